@@ -0,0 +1,430 @@
+import argparse
+import csv
+import json
+import sys
+import time
+from collections import deque
+from itertools import islice
+from Controller.file_handler import FileHandler, FbfFileError
+from Model.expression_processor import ExpressionProcessor
+from Model.parser import Parser
+from Model.formula_handler import FormulaHandler
+from Model.truth_table_generator import TruthTableGenerator
+from Model.formula_cache import FormulaCache
+from Model.equivalence_checker import EquivalenceChecker
+from Model.table_store import TableStore
+from Model.stats import Stats, ChromeTraceExporter
+
+# Campos de cada registro, na ordem das colunas do formato CSV
+FIELDS = ["file", "line", "offset", "formula", "variables", "classification",
+          "true_assignment", "false_assignment", "table", "error"]
+
+# Fórmulas enviadas de uma vez a um processo de trabalho
+CHUNK_SIZE = 64
+
+# Blocos em andamento por processo: limita a parte da entrada lida antes de ser escrita
+PENDING_CHUNKS_PER_JOB = 4
+
+
+def analyze_formula(item):
+    """
+    Analisa e classifica uma fórmula de um arquivo (executada nos processos de trabalho).
+
+    Args:
+        item (tuple): (arquivo, número da linha, posição da linha em bytes, fórmula, gerar tabela, máximo de
+            variáveis para gerar a tabela, (diretório, tamanho máximo) do cache de
+            tabelas em disco ou None, erro de leitura do arquivo ou None, modo de
+            medição: None, "stats" ou "trace")
+
+    Returns:
+        dict: Registro com os campos de FIELDS; em caso de erro, o campo "error"
+        descreve o problema. Com medição, o campo adicional "profile" traz as
+        estatísticas (Stats.as_dict) e os eventos de rastreamento, e deve ser
+        retirado com collect_profile antes da escrita
+    """
+    (file_path, line_number, byte_offset, formula, emit_table, max_table_variables, table_cache, read_error,
+     profile) = item
+    record = dict.fromkeys(FIELDS)
+    record.update(file=file_path, line=line_number, offset=byte_offset, formula=formula, error=read_error)
+    if read_error is not None:
+        return record
+    exporter = ChromeTraceExporter() if profile == "trace" else None
+    stats = Stats(trace=exporter) if profile else Stats.DISABLED
+    try:
+        with stats.stage("lex"):
+            tokens, _, variables = ExpressionProcessor.lex(formula)
+        with stats.stage("parse"):
+            parser = Parser(tokens, variables)
+            parsed_expression = parser.parse()
+        if stats.enabled:
+            stats.count("shared_nodes", parser.shared_node_count(parsed_expression))
+
+        truth_table_gen = TruthTableGenerator(FormulaHandler(parser))
+        classification, true_assignment, false_assignment = truth_table_gen.classify(
+            parsed_expression, variables, stats=stats)
+        record.update(variables=variables, classification=classification.split(":")[0],
+                      true_assignment=true_assignment, false_assignment=false_assignment)
+
+        if emit_table:
+            if len(variables) > max_table_variables:
+                raise ValueError(f"Tabela grande demais: {len(variables)} variáveis "
+                                 f"(máximo {max_table_variables})")
+            table = None
+            if table_cache is not None:
+                with stats.stage("cache_lookup"):
+                    store = TableStore(*table_cache)
+                    key = store.table_key(FormulaCache.canonical_key(parsed_expression, parser.op_symbols),
+                                          variables)
+                    loaded = store.load(key)
+                if loaded is not None:
+                    stats.count("table_cache_hits")
+                    table = loaded[0]
+                else:
+                    stats.count("table_cache_misses")
+            if table is None:
+                table = truth_table_gen.generate_packed_table(parsed_expression, variables, stats=stats)
+                if table_cache is not None:
+                    with stats.stage("cache_store"):
+                        store.store(key, table, truth_table_gen.classify_fbf(table, table.columns[-1]))
+            with stats.stage("serialize"):
+                record["table"] = {"columns": table.columns, "rows": list(table.iter_rows())}
+    except Exception as e:
+        record["error"] = str(e)
+    if profile:
+        record["profile"] = (stats.as_dict(), exporter.events if exporter is not None else [])
+    return record
+
+
+def analyze_chunk(items):
+    """
+    Analisa um bloco de fórmulas (executada nos processos de trabalho).
+
+    Args:
+        items (list): Itens aceitos por analyze_formula
+
+    Returns:
+        list: Registros produzidos por analyze_formula, na mesma ordem
+    """
+    return [analyze_formula(item) for item in items]
+
+
+def iter_records(items, jobs):
+    """
+    Analisa as fórmulas e devolve os registros na ordem de entrada.
+
+    Com mais de um processo, os itens são enviados em blocos de CHUNK_SIZE e no
+    máximo jobs * PENDING_CHUNKS_PER_JOB blocos ficam em andamento: um novo bloco
+    só é lido da entrada quando o mais antigo é entregue, de modo que a memória
+    não cresce com o tamanho dos arquivos (Executor.map consumiria toda a entrada
+    antes de devolver o primeiro resultado).
+
+    Args:
+        items (iterable): Itens aceitos por analyze_formula
+        jobs (int): Número de processos
+
+    Yields:
+        dict: Registro produzido por analyze_formula
+    """
+    if jobs <= 1:
+        yield from map(analyze_formula, items)
+        return
+
+    # Importação tardia: o multiprocessing só é carregado quando há processos
+    from concurrent.futures import ProcessPoolExecutor
+    items = iter(items)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        while True:
+            while len(pending) < jobs * PENDING_CHUNKS_PER_JOB:
+                chunk = list(islice(items, CHUNK_SIZE))
+                if not chunk:
+                    break
+                pending.append(executor.submit(analyze_chunk, chunk))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+
+def collect_profile(record, stats, exporter=None):
+    """
+    Retira do registro as estatísticas do processo de trabalho e as acumula.
+
+    Args:
+        record (dict): Registro produzido por analyze_formula
+        stats (Stats): Estatísticas de todo o lote
+        exporter (ChromeTraceExporter, opcional): Recebe os eventos de rastreamento do registro
+    """
+    profile = record.pop("profile", None)
+    if profile is None:
+        return
+    data, events = profile
+    stats.merge(data)
+    if exporter is not None:
+        exporter.events.extend(events)
+
+
+def report_profile(stats):
+    """
+    Imprime na saída de erro o tempo acumulado de cada etapa e os contadores do lote.
+
+    Args:
+        stats (Stats): Estatísticas de todo o lote
+    """
+    data = stats.as_dict()
+    print("Perfil por etapa (tempo acumulado em todos os processos):", file=sys.stderr)
+    for name, stage in data["stages"].items():
+        print(f"  {name:14s} {stage['ms']:12.3f} ms  {stage['calls']:10d} chamadas", file=sys.stderr)
+    for name, amount in data["counters"].items():
+        print(f"  {name:20s} {amount:16d}", file=sys.stderr)
+
+
+def iter_items(file_paths, emit_table, max_table_variables, table_cache=None, profile=None):
+    """
+    Percorre as fórmulas de todos os arquivos, na ordem de entrada.
+
+    Os arquivos são lidos sob demanda (FileHandler.iter_fbf_records). Uma linha
+    que não pode ser decodificada gera um item com o erro de leitura e a leitura
+    continua na linha seguinte; um arquivo que não pode ser aberto gera um item
+    com o erro, e o lote continua com o próximo arquivo.
+
+    Args:
+        file_paths (list): Arquivos de fórmulas
+        emit_table (bool): Se as tabelas verdade devem ser geradas
+        max_table_variables (int): Máximo de variáveis para gerar uma tabela
+        table_cache (tuple, opcional): (diretório, tamanho máximo) do cache de tabelas em disco
+        profile (str, opcional): Modo de medição: None, "stats" ou "trace"
+
+    Yields:
+        tuple: Item aceito por analyze_formula
+    """
+    for file_path in file_paths:
+        try:
+            for line_number, byte_offset, formula in FileHandler.iter_fbf_records(file_path):
+                if isinstance(formula, FbfFileError):
+                    yield (file_path, line_number, byte_offset, None, emit_table, max_table_variables,
+                           table_cache, str(formula), profile)
+                else:
+                    yield (file_path, line_number, byte_offset, formula, emit_table, max_table_variables,
+                           table_cache, None, profile)
+        except ValueError as e:
+            yield file_path, None, None, None, emit_table, max_table_variables, table_cache, str(e), profile
+
+
+class RecordWriter:
+    """
+    Classe responsável por escrever os registros do processamento em lote
+    nos formatos JSON Lines ou CSV.
+    """
+
+    def __init__(self, stream, output_format):
+        """
+        Inicializa o escritor.
+
+        Args:
+            stream (file): Arquivo de saída
+            output_format (str): "jsonl" ou "csv"
+        """
+        self.stream = stream
+        self.output_format = output_format
+        if output_format == "csv":
+            self.csv_writer = csv.DictWriter(stream, fieldnames=FIELDS)
+            self.csv_writer.writeheader()
+
+    def write(self, record):
+        """
+        Escreve um registro.
+
+        Args:
+            record (dict): Registro produzido por analyze_formula
+        """
+        if self.output_format == "jsonl":
+            self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+            return
+
+        row = dict(record)
+        if record["variables"] is not None:
+            row["variables"] = " ".join(record["variables"])
+        for key in ("true_assignment", "false_assignment"):
+            if record[key] is not None:
+                row[key] = " ".join(f"{var}={value}" for var, value in record[key].items())
+        if record["table"] is not None:
+            # No CSV, a tabela é resumida pela coluna da fórmula principal, linha a linha
+            row["table"] = "".join("V" if values[-1] else "F" for values in record["table"]["rows"])
+        self.csv_writer.writerow(row)
+
+
+def report_error(record):
+    """
+    Informa na saída de erro a falha de um registro, com o arquivo e a linha.
+
+    Args:
+        record (dict): Registro produzido por analyze_formula
+
+    Returns:
+        bool: True se o registro tem um erro
+    """
+    if record["error"] is None:
+        return False
+    if record["formula"] is None:
+        # Erros de leitura já trazem o arquivo (e a linha, quando houver) na mensagem
+        print(record["error"], file=sys.stderr)
+    else:
+        print(f"{record['file']}, linha {record['line']}: {record['error']}", file=sys.stderr)
+    return True
+
+
+def build_arg_parser():
+    """
+    Cria o analisador de argumentos da linha de comando.
+
+    Returns:
+        argparse.ArgumentParser: Analisador com os subcomandos "batch" e "equiv"
+    """
+    arg_parser = argparse.ArgumentParser(
+        prog="main.py", description="Calculadora de Tabela Verdade sem interface gráfica.")
+    subcommands = arg_parser.add_subparsers(dest="command", required=True)
+
+    batch = subcommands.add_parser("batch", help="Classifica todas as FBFs de um ou mais arquivos.")
+    batch.add_argument("files", nargs="+", metavar="ARQUIVO", help="Arquivos de FBFs (uma por linha)")
+    batch.add_argument("--jobs", "-j", type=int, default=1, help="Número de processos (padrão: 1)")
+    batch.add_argument("--format", choices=("jsonl", "csv"), default="jsonl", help="Formato da saída")
+    batch.add_argument("--tables", action="store_true", help="Inclui a tabela verdade de cada fórmula")
+    batch.add_argument("--max-table-variables", type=int, default=16,
+                       help="Máximo de variáveis para gerar uma tabela (padrão: 16)")
+    batch.add_argument("--cache-dir", help="Diretório do cache de tabelas em disco (padrão: sem cache)")
+    batch.add_argument("--cache-max-mb", type=int, default=1024,
+                       help="Tamanho máximo do cache de tabelas em MB (padrão: 1024)")
+    batch.add_argument("--output", "-o", help="Arquivo de saída (padrão: saída padrão)")
+    batch.add_argument("--profile", action="store_true",
+                       help="Mede o tempo de cada etapa e os contadores e imprime o perfil ao final")
+    batch.add_argument("--trace", metavar="ARQUIVO",
+                       help="Grava as etapas medidas em formato Chrome Trace (JSON); implica --profile")
+
+    equiv = subcommands.add_parser("equiv", help="Separa as FBFs de um ou mais arquivos em classes de equivalência.")
+    equiv.add_argument("files", nargs="+", metavar="ARQUIVO", help="Arquivos de FBFs (uma por linha)")
+    equiv.add_argument("--seed", type=int, default=0, help="Semente das assinaturas aleatórias (padrão: 0)")
+    equiv.add_argument("--output", "-o", help="Arquivo de saída (padrão: saída padrão)")
+    return arg_parser
+
+
+def run_batch(args):
+    """
+    Executa o subcomando "batch".
+
+    Args:
+        args (argparse.Namespace): Argumentos da linha de comando
+
+    Returns:
+        int: Código de saída (0 sem erros, 1 se alguma linha ou arquivo falhou)
+    """
+    stream = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    writer = RecordWriter(stream, args.format)
+    table_cache = None
+    if args.cache_dir:
+        table_cache = (args.cache_dir, args.cache_max_mb * 1024 * 1024)
+    profile = "trace" if args.trace else "stats" if args.profile else None
+    exporter = ChromeTraceExporter() if args.trace else None
+    stats = Stats(trace=exporter) if profile else Stats.DISABLED
+    items = iter_items(args.files, args.tables, args.max_table_variables, table_cache, profile)
+
+    start = time.perf_counter()
+    count = 0
+    failed = 0
+    try:
+        for record in iter_records(items, args.jobs):
+            collect_profile(record, stats, exporter)
+            with stats.stage("write"):
+                writer.write(record)
+            count += 1
+            failed += report_error(record)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    print(f"{count} fórmulas em {elapsed:.3f} s ({rate:.1f} fórmulas/s), {failed} erros",
+          file=sys.stderr)
+    if stats.enabled:
+        report_profile(stats)
+    if exporter is not None:
+        exporter.write(args.trace)
+    return 1 if failed else 0
+
+
+def run_equivalence(args):
+    """
+    Executa o subcomando "equiv".
+
+    As fórmulas de todos os arquivos são separadas em classes de equivalência
+    (EquivalenceChecker.group) e cada classe é escrita como uma linha JSON
+    {"class": número, "formulas": [{"file", "line", "formula"}, ...]}, na ordem da
+    primeira fórmula de cada classe. Fórmulas inválidas são informadas na saída de
+    erro e deixadas de fora.
+
+    Args:
+        args (argparse.Namespace): Argumentos da linha de comando
+
+    Returns:
+        int: Código de saída (0 sem erros, 1 se alguma linha ou arquivo falhou)
+    """
+    start = time.perf_counter()
+    sources = []
+    formulas = []
+    failed = 0
+    for file_path in args.files:
+        try:
+            for line_number, _, formula in FileHandler.iter_fbf_records(file_path):
+                if isinstance(formula, FbfFileError):
+                    print(formula, file=sys.stderr)
+                    failed += 1
+                    continue
+                try:
+                    tokens, _, variables = ExpressionProcessor.lex(formula)
+                    formulas.append((Parser(tokens, variables).parse(), variables))
+                except ValueError as e:
+                    print(f"{file_path}, linha {line_number}: {e}", file=sys.stderr)
+                    failed += 1
+                    continue
+                sources.append({"file": file_path, "line": line_number, "formula": formula})
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            failed += 1
+
+    classes = EquivalenceChecker(args.seed).group(formulas)
+
+    stream = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for number, members in enumerate(classes):
+            record = {"class": number, "formulas": [sources[index] for index in members]}
+            stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"{len(formulas)} fórmulas em {len(classes)} classes de equivalência em {elapsed:.3f} s, "
+          f"{failed} erros", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+
+    Args:
+        argv (list, opcional): Argumentos; por padrão, sys.argv[1:]
+
+    Returns:
+        int: Código de saída
+    """
+    args = build_arg_parser().parse_args(argv)
+    if args.command == "batch":
+        return run_batch(args)
+    if args.command == "equiv":
+        return run_equivalence(args)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
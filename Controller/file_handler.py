@@ -1,3 +1,28 @@
+import mmap
+from array import array
+
+
+class FbfFileError(ValueError):
+    """
+    Erro em uma linha de um arquivo de fórmulas, com sua localização.
+    """
+
+    def __init__(self, file_path, line_number, byte_offset, message):
+        """
+        Inicializa o erro.
+
+        Args:
+            file_path (str): Caminho do arquivo
+            line_number (int): Número da linha, a partir de 1
+            byte_offset (int): Posição do início da linha no arquivo, em bytes
+            message (str): Descrição do problema
+        """
+        super().__init__(f"{file_path}, linha {line_number}: {message}")
+        self.file_path = file_path
+        self.line_number = line_number
+        self.byte_offset = byte_offset
+
+
 class FileHandler:
     """
     Classe responsável por manipular arquivos de fórmulas booleanas.
@@ -12,15 +37,206 @@ class FileHandler:
             file_path (str): Caminho para o arquivo contendo as FBFs
             
         Returns:
-            list: Lista de strings representando as FBFs lidas do arquivo
+            list: Lista de strings representando as FBFs lidas do arquivo (linhas em
+            branco e comentários são ignorados)
             
         Raises:
-            ValueError: Se ocorrer um erro ao ler o arquivo
+            ValueError: Se ocorrer um erro ao ler o arquivo (FbfFileError, com o número
+            da linha, se uma linha não puder ser decodificada)
+        """
+        return [fbf for _, fbf in FileHandler.iter_fbfs(file_path)]
+
+    # Linhas que começam com este prefixo (após os espaços) são comentários
+    COMMENT_PREFIX = "#"
+
+    @staticmethod
+    def iter_fbf_records(file_path, comment_prefix=COMMENT_PREFIX):
+        """
+        Percorre as fórmulas de um arquivo sob demanda, sem carregá-lo na memória.
+
+        O arquivo é mapeado com mmap e cada linha só é decodificada quando chega a
+        sua vez, de modo que a primeira fórmula de um arquivo enorme fica disponível
+        imediatamente.
+
+        Args:
+            file_path (str): Caminho para o arquivo contendo as FBFs
+            comment_prefix (str, opcional): Prefixo das linhas de comentário; None
+                para não ignorar comentários
+
+        Yields:
+            tuple: (número da linha a partir de 1, posição do início da linha em bytes,
+            FBF sem espaços nas pontas); linhas em branco e comentários são ignorados.
+            Uma linha que não pode ser decodificada como UTF-8 gera um registro com
+            o erro (FbfFileError) no lugar da FBF, e a leitura continua na linha seguinte
+
+        Raises:
+            ValueError: Se o arquivo não puder ser aberto
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                # Lê cada linha como uma FBF separada
-                fbfs = [line.strip() for line in file.readlines() if line.strip()]
-            return fbfs
-        except Exception as e:
-            raise ValueError(f"Erro ao ler o arquivo: {str(e)}")
\ No newline at end of file
+            file = open(file_path, "rb")
+        except OSError as e:
+            raise ValueError(f"Erro ao ler o arquivo: {str(e)}")
+        with file:
+            try:
+                memory = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Arquivo vazio: não há o que mapear
+                return
+            except OSError as e:
+                raise ValueError(f"Erro ao ler o arquivo: {str(e)}")
+            with memory:
+                yield from FileHandler._scan_lines(file_path, memory, 0, comment_prefix)
+
+    @staticmethod
+    def _scan_lines(file_path, memory, byte_offset, comment_prefix, line_number=1):
+        """
+        Percorre as linhas de um arquivo mapeado a partir de uma posição.
+
+        Args:
+            file_path (str): Caminho do arquivo (para as mensagens de erro)
+            memory (mmap.mmap): Arquivo mapeado em memória
+            byte_offset (int): Posição do início da primeira linha
+            comment_prefix (str ou None): Prefixo das linhas de comentário
+            line_number (int, opcional): Número da linha em byte_offset
+
+        Yields:
+            tuple: (número da linha, posição do início da linha, FBF ou FbfFileError
+            se a linha não puder ser decodificada como UTF-8)
+        """
+        size = len(memory)
+        position = byte_offset
+        if position == 0 and memory[:3] == b"\xef\xbb\xbf":
+            # Ignora a marca de ordem de bytes (BOM) do UTF-8
+            position = 3
+        while position < size:
+            end = memory.find(b"\n", position)
+            if end == -1:
+                end = size
+            raw = memory[position:end]
+            if raw.strip():
+                try:
+                    fbf = raw.decode("utf-8").strip()
+                except UnicodeDecodeError as e:
+                    yield line_number, position, FbfFileError(
+                        file_path, line_number, position, f"codificação inválida (byte {position + e.start})")
+                else:
+                    if fbf and not (comment_prefix and fbf.startswith(comment_prefix)):
+                        yield line_number, position, fbf
+            position = end + 1
+            line_number += 1
+
+    @staticmethod
+    def iter_fbfs(file_path):
+        """
+        Percorre as fórmulas de um arquivo junto com o número da linha de cada uma.
+        
+        Args:
+            file_path (str): Caminho para o arquivo contendo as FBFs
+            
+        Yields:
+            tuple: (número da linha a partir de 1, FBF sem espaços nas pontas); linhas
+            em branco e comentários são ignorados
+            
+        Raises:
+            ValueError: Se ocorrer um erro ao ler o arquivo (FbfFileError, com o número
+            da linha, se uma linha não puder ser decodificada)
+        """
+        for line_number, _, fbf in FileHandler.iter_fbf_records(file_path):
+            if isinstance(fbf, FbfFileError):
+                raise fbf
+            yield line_number, fbf
+
+    @staticmethod
+    def build_index(file_path, comment_prefix=COMMENT_PREFIX):
+        """
+        Indexa as fórmulas de um arquivo para permitir o acesso direto à k-ésima.
+
+        Args:
+            file_path (str): Caminho para o arquivo contendo as FBFs
+            comment_prefix (str, opcional): Prefixo das linhas de comentário
+
+        Returns:
+            FbfIndex: Índice com a linha e a posição em bytes de cada registro de
+            iter_fbf_records (fórmulas e linhas que não puderam ser decodificadas)
+
+        Raises:
+            ValueError: Se ocorrer um erro ao ler o arquivo
+        """
+        line_numbers = array("Q")
+        offsets = array("Q")
+        for line_number, byte_offset, _ in FileHandler.iter_fbf_records(file_path, comment_prefix):
+            line_numbers.append(line_number)
+            offsets.append(byte_offset)
+        return FbfIndex(file_path, line_numbers, offsets, comment_prefix)
+
+
+class FbfIndex:
+    """
+    Classe que representa o índice das fórmulas de um arquivo: para cada fórmula,
+    o número da linha e a posição do início da linha em bytes, guardados em
+    arrays compactos (16 bytes por fórmula). A k-ésima fórmula é lida diretamente
+    do arquivo mapeado, sem percorrer as anteriores.
+    """
+
+    def __init__(self, file_path, line_numbers, offsets, comment_prefix=FileHandler.COMMENT_PREFIX):
+        """
+        Inicializa o índice.
+
+        Args:
+            file_path (str): Caminho do arquivo indexado
+            line_numbers (array): Número da linha de cada fórmula
+            offsets (array): Posição em bytes do início da linha de cada fórmula
+            comment_prefix (str, opcional): Prefixo das linhas de comentário
+        """
+        self.file_path = file_path
+        self.line_numbers = line_numbers
+        self.offsets = offsets
+        self.comment_prefix = comment_prefix
+        self._file = None
+        self._memory = None
+
+    def __len__(self):
+        """
+        Retorna o número de fórmulas indexadas.
+
+        Returns:
+            int: Número de fórmulas
+        """
+        return len(self.offsets)
+
+    def __getitem__(self, k):
+        """
+        Lê a k-ésima fórmula do arquivo.
+
+        Args:
+            k (int): Posição da fórmula (negativa conta a partir do fim)
+
+        Returns:
+            tuple: (número da linha, posição em bytes, FBF ou FbfFileError), como em
+            FileHandler.iter_fbf_records
+
+        Raises:
+            IndexError: Se k estiver fora do índice
+            ValueError: Se o arquivo mudou desde a indexação
+        """
+        line_number = self.line_numbers[k]
+        byte_offset = self.offsets[k]
+        if self._memory is None:
+            self._file = open(self.file_path, "rb")
+            self._memory = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        for record in FileHandler._scan_lines(self.file_path, self._memory, byte_offset,
+                                              self.comment_prefix, line_number):
+            if record[0] == line_number:
+                return record
+            break
+        raise ValueError(f"{self.file_path}, linha {line_number}: o arquivo mudou desde a indexação")
+
+    def close(self):
+        """
+        Libera o arquivo mapeado usado pelas leituras.
+        """
+        if self._memory is not None:
+            self._memory.close()
+            self._file.close()
+            self._memory = None
+            self._file = None
@@ -0,0 +1,198 @@
+import queue
+import threading
+from Model.formula_cache import FormulaCache
+from Model.stats import Stats
+from Model.truth_table import TruthTable
+from Model.truth_table_generator import TruthTableGenerator
+
+class TableJob:
+    """
+    Classe que representa um pedido de geração de tabela verdade.
+    """
+
+    def __init__(self, job_id, expression):
+        """
+        Inicializa o pedido.
+
+        Args:
+            job_id (int): Identificador do pedido
+            expression (str): Expressão lógica digitada pelo usuário
+        """
+        self.job_id = job_id
+        self.expression = expression
+        self.cancel_event = threading.Event()
+
+
+class TableJobRunner:
+    """
+    Classe responsável por gerar tabelas verdade em uma thread de trabalho.
+    Os pedidos formam uma fila e são atendidos um de cada vez; a tabela é gerada
+    em blocos, o que permite informar o progresso e cancelar entre um bloco e
+    outro (ou antes de a tabela ser montada e guardada no cache). A interface
+    consulta os eventos produzidos com poll_events, sem nunca bloquear a thread
+    do Tk. Fórmulas e tabelas já calculadas são reaproveitadas de um
+    FormulaCache, que pode também guardar as tabelas grandes em disco
+    (TableStore) entre sessões.
+
+    Eventos (tuplas):
+        ("started", job_id, expressão)
+        ("progress", job_id, linhas prontas, total de linhas)
+        ("done", job_id, resultado) em que resultado é um dicionário com
+            expression (texto da fórmula), variables, table, classification,
+            cache_stats e stats (Stats com o tempo de cada etapa; desativado se o
+            executor não foi criado com profile=True)
+        ("cancelled", job_id)
+        ("error", job_id, mensagem)
+    """
+
+    def __init__(self, chunk_rows=65536, cache=None, profile=False, trace=None):
+        """
+        Inicializa o executor.
+
+        Args:
+            chunk_rows (int, opcional): Número de linhas gerado entre dois avisos de progresso
+            cache (FormulaCache, opcional): Cache de fórmulas e tabelas; por padrão, um novo,
+                apenas em memória
+            profile (bool, opcional): Se o tempo de cada etapa e os contadores de cada
+                pedido devem ser medidos
+            trace (callable, opcional): Gancho repassado às estatísticas de cada pedido
+                (por exemplo, um ChromeTraceExporter); só é usado com profile=True
+        """
+        self.chunk_rows = chunk_rows
+        self.profile = profile
+        self.trace = trace
+        self.cache = FormulaCache() if cache is None else cache
+        self.jobs = queue.Queue()
+        self.events = queue.Queue()
+        self.current_job = None
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, expression):
+        """
+        Coloca uma expressão na fila de geração.
+
+        Args:
+            expression (str): Expressão lógica digitada pelo usuário
+
+        Returns:
+            int: Identificador do pedido
+        """
+        with self._lock:
+            self._next_id += 1
+            job = TableJob(self._next_id, expression)
+        self.jobs.put(job)
+        return job.job_id
+
+    def cancel_current(self):
+        """
+        Pede o cancelamento do pedido em andamento, se houver.
+
+        Returns:
+            bool: True se havia um pedido em andamento
+        """
+        job = self.current_job
+        if job is None:
+            return False
+        job.cancel_event.set()
+        return True
+
+    def pending_count(self):
+        """
+        Retorna quantos pedidos aguardam na fila (sem contar o que está em andamento).
+
+        Returns:
+            int: Número aproximado de pedidos na fila
+        """
+        return self.jobs.qsize()
+
+    def poll_events(self):
+        """
+        Retira todos os eventos disponíveis sem bloquear.
+
+        Returns:
+            list: Eventos na ordem em que foram produzidos
+        """
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _run(self):
+        """
+        Laço da thread de trabalho: atende os pedidos da fila em ordem.
+        """
+        while True:
+            job = self.jobs.get()
+            self.current_job = job
+            self.events.put(("started", job.job_id, job.expression))
+            try:
+                result = self._compute(job)
+                if result is None:
+                    self.events.put(("cancelled", job.job_id))
+                else:
+                    self.events.put(("done", job.job_id, result))
+            except Exception as e:
+                self.events.put(("error", job.job_id, str(e)))
+            finally:
+                self.current_job = None
+
+    def _compute(self, job):
+        """
+        Analisa a expressão e gera sua tabela verdade em blocos.
+
+        Args:
+            job (TableJob): Pedido a ser atendido
+
+        Returns:
+            dict ou None: Resultado do pedido, ou None se ele foi cancelado
+        """
+        stats = Stats(trace=self.trace) if self.profile else Stats.DISABLED
+        entry = self.cache.get_formula(job.expression, stats=stats)
+        variables = entry.variables
+        total_rows = 1 << len(variables)
+
+        with stats.stage("subformulas"):
+            expression, subformula_texts = entry.render()
+        with stats.stage("cache_lookup"):
+            table = self.cache.get_table(entry)
+        if table is None:
+            stats.count("table_cache_misses")
+            chunks = []
+            done_rows = 0
+            for chunk in TruthTableGenerator.iter_compact_table(entry.formula, subformula_texts, self.chunk_rows,
+                                                                stats=stats):
+                if job.cancel_event.is_set():
+                    return None
+                chunks.append(chunk)
+                done_rows += len(chunk)
+                self.events.put(("progress", job.job_id, done_rows, total_rows))
+
+            # O cancelamento também vale depois do último bloco: a tabela não é
+            # montada nem guardada no cache
+            if job.cancel_event.is_set():
+                return None
+            with stats.stage("concat"):
+                table = TruthTable.concat(chunks)
+            with stats.stage("classify"):
+                classification = TruthTableGenerator.classify_fbf(table, table.columns[-1])
+            if job.cancel_event.is_set():
+                return None
+            with stats.stage("cache_store"):
+                self.cache.put_table(entry, table, classification)
+        else:
+            stats.count("table_cache_hits")
+            self.events.put(("progress", job.job_id, total_rows, total_rows))
+
+        return {
+            "expression": expression,
+            "variables": variables,
+            "table": table,
+            "classification": entry.classification,
+            "cache_stats": self.cache.stats(),
+            "stats": stats,
+        }
@@ -0,0 +1,413 @@
+from Model.logical_operations import LogicalOperations
+
+class NodeLimitExceeded(Exception):
+    """
+    Exceção lançada quando a construção de um BDD ultrapassa o limite de nós.
+    """
+
+
+class BDD:
+    """
+    Classe que implementa um Diagrama de Decisão Binária Reduzido e Ordenado (ROBDD)
+    com arestas de complemento.
+
+    Uma aresta é um inteiro (índice do nó << 1) | bit de complemento. O nó 0 é o
+    terminal verdadeiro, de modo que a aresta 0 é a constante verdadeira e a aresta 1
+    é a constante falsa. A aresta "então" (high) de um nó nunca é complementada, o
+    que torna a representação canônica: duas funções são iguais se e somente se
+    suas arestas forem iguais, e a negação custa O(1).
+    """
+
+    TRUE = 0
+    FALSE = 1
+
+    def __init__(self, order, node_limit=None):
+        """
+        Inicializa o gerenciador de BDDs.
+
+        Args:
+            order (list): Variáveis na ordem dos níveis (a primeira fica na raiz)
+            node_limit (int, opcional): Número máximo de nós; ao ultrapassá-lo,
+                NodeLimitExceeded é lançada
+        """
+        self.order = list(order)
+        self.levels = {var: i for i, var in enumerate(self.order)}
+        self.num_levels = len(self.order)
+        self.node_limit = node_limit
+        # Nó 0: terminal verdadeiro, abaixo de todos os níveis
+        self.node_levels = [self.num_levels]
+        self.highs = [0]
+        self.lows = [0]
+        self.unique_table = {}
+        self.computed_table = {}
+
+    def __len__(self):
+        """
+        Retorna o número de nós criados pelo gerenciador (incluindo o terminal).
+
+        Returns:
+            int: Número de nós
+        """
+        return len(self.highs)
+
+    def _make_node(self, level, high, low):
+        """
+        Retorna a aresta do nó (level, high, low), reutilizando nós já existentes.
+        """
+        if high == low:
+            return high
+        negate = high & 1
+        if negate:
+            high ^= 1
+            low ^= 1
+        key = (level, high, low)
+        index = self.unique_table.get(key)
+        if index is None:
+            index = len(self.highs)
+            if self.node_limit is not None and index > self.node_limit:
+                raise NodeLimitExceeded(f"Limite de {self.node_limit} nós excedido")
+            self.unique_table[key] = index
+            self.node_levels.append(level)
+            self.highs.append(high)
+            self.lows.append(low)
+        return (index << 1) | negate
+
+    def var(self, name):
+        """
+        Retorna a aresta da função que vale a própria variável.
+
+        Args:
+            name (str): Nome da variável
+
+        Returns:
+            int: Aresta do BDD
+        """
+        return self._make_node(self.levels[name], self.TRUE, self.FALSE)
+
+    def level(self, edge):
+        """
+        Retorna o nível do nó apontado por uma aresta.
+        """
+        return self.node_levels[edge >> 1]
+
+    def cofactors(self, edge, level):
+        """
+        Retorna os cofatores (high, low) de uma aresta em relação à variável de um nível.
+
+        Args:
+            edge (int): Aresta do BDD
+            level (int): Nível da variável
+
+        Returns:
+            tuple: Arestas (com a variável verdadeira, com a variável falsa)
+        """
+        index = edge >> 1
+        if self.node_levels[index] != level:
+            return edge, edge
+        negate = edge & 1
+        return self.highs[index] ^ negate, self.lows[index] ^ negate
+
+    def ite(self, f, g, h):
+        """
+        Calcula if-then-else(f, g, h) = (f ∧ g) v (~f ∧ h).
+
+        A recursão de Shannon é feita com uma pilha explícita, e os resultados
+        intermediários são guardados na tabela de computados.
+
+        Args:
+            f (int): Aresta da condição
+            g (int): Aresta do ramo "então"
+            h (int): Aresta do ramo "senão"
+
+        Returns:
+            int: Aresta do resultado
+        """
+        results = []
+        # Tarefas: (f, g, h) para calcular ou (chave, nível, negação) para combinar
+        tasks = [(False, f, g, h)]
+        while tasks:
+            task = tasks.pop()
+            if task[0]:
+                _, key, level, negate = task
+                low = results.pop()
+                high = results.pop()
+                result = self._make_node(level, high, low)
+                self.computed_table[key] = result
+                results.append(result ^ negate)
+                continue
+
+            _, f, g, h = task
+            # Casos terminais
+            if f == self.TRUE:
+                results.append(g)
+                continue
+            if f == self.FALSE:
+                results.append(h)
+                continue
+            # Condição sem complemento
+            if f & 1:
+                f ^= 1
+                g, h = h, g
+            # Ramos iguais à condição viram constantes
+            if g == f:
+                g = self.TRUE
+            elif g == f ^ 1:
+                g = self.FALSE
+            if h == f:
+                h = self.FALSE
+            elif h == f ^ 1:
+                h = self.TRUE
+            if g == h:
+                results.append(g)
+                continue
+            if g == self.TRUE and h == self.FALSE:
+                results.append(f)
+                continue
+            if g == self.FALSE and h == self.TRUE:
+                results.append(f ^ 1)
+                continue
+            # Ramo "então" sem complemento: ite(f, ~g, ~h) = ~ite(f, g, h)
+            negate = g & 1
+            if negate:
+                g ^= 1
+                h ^= 1
+
+            key = (f, g, h)
+            cached = self.computed_table.get(key)
+            if cached is not None:
+                results.append(cached ^ negate)
+                continue
+
+            level = min(self.level(f), self.level(g), self.level(h))
+            f1, f0 = self.cofactors(f, level)
+            g1, g0 = self.cofactors(g, level)
+            h1, h0 = self.cofactors(h, level)
+            tasks.append((True, key, level, negate))
+            tasks.append((False, f0, g0, h0))
+            tasks.append((False, f1, g1, h1))
+        return results[0]
+
+    def apply(self, op, f, g=None):
+        """
+        Aplica uma operação lógica do LogicalOperations a BDDs.
+
+        Args:
+            op (function): Operação de LogicalOperations
+            f (int): Aresta do primeiro operando
+            g (int, opcional): Aresta do segundo operando (operações binárias)
+
+        Returns:
+            int: Aresta do resultado
+
+        Raises:
+            ValueError: Se a operação for desconhecida
+        """
+        if op == LogicalOperations.not_op:
+            return f ^ 1
+        elif op == LogicalOperations.and_op:
+            return self.ite(f, g, self.FALSE)
+        elif op == LogicalOperations.or_op:
+            return self.ite(f, self.TRUE, g)
+        elif op == LogicalOperations.xor_op:
+            return self.ite(f, g ^ 1, g)
+        elif op == LogicalOperations.eq_op:
+            return self.ite(f, g, g ^ 1)
+        elif op == LogicalOperations.imp_op:
+            return self.ite(f, g, self.TRUE)
+        raise ValueError(f"Operação desconhecida: {op}")
+
+    def from_formula(self, node):
+        """
+        Constrói o BDD de uma árvore de análise produzida pelo Parser.
+
+        Args:
+            node (tuple ou str): Nó da árvore de análise
+
+        Returns:
+            int: Aresta do BDD da fórmula
+
+        Raises:
+            ValueError: Se algum nó for de um tipo desconhecido
+        """
+        edges = {}
+        stack = [(node, False)]
+        while stack:
+            current, expanded = stack.pop()
+            key = id(current)
+            if key in edges:
+                continue
+            if isinstance(current, str):
+                edges[key] = self.var(current)
+            elif not isinstance(current, tuple):
+                raise ValueError(f"Nó incorreto: {current}")
+            elif not expanded:
+                stack.append((current, True))
+                stack.extend((arg, False) for arg in current[1:] if id(arg) not in edges)
+            else:
+                edges[key] = self.apply(current[0], *[edges[id(arg)] for arg in current[1:]])
+        return edges[id(node)]
+
+    def size(self, edge):
+        """
+        Conta os nós alcançáveis a partir de uma aresta (incluindo o terminal).
+
+        Args:
+            edge (int): Aresta do BDD
+
+        Returns:
+            int: Número de nós do BDD da função
+        """
+        seen = {edge >> 1}
+        stack = [edge >> 1]
+        while stack:
+            index = stack.pop()
+            if index == 0:
+                continue
+            for child in (self.highs[index] >> 1, self.lows[index] >> 1):
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        return len(seen)
+
+    def count_models(self, edge):
+        """
+        Conta as valorações de todas as variáveis da ordem que satisfazem a função.
+
+        O custo é linear no tamanho do BDD.
+
+        Args:
+            edge (int): Aresta do BDD
+
+        Returns:
+            int: Número de valorações que tornam a função verdadeira
+        """
+        # counts[i]: modelos do nó i sobre as variáveis dos níveis node_levels[i] em diante
+        counts = {0: 1}
+
+        def edge_count(e, from_level):
+            index = e >> 1
+            level = self.node_levels[index]
+            count = counts[index]
+            if e & 1:
+                count = (1 << (self.num_levels - level)) - count
+            return count << (level - from_level)
+
+        stack = [edge >> 1]
+        while stack:
+            index = stack[-1]
+            if index in counts:
+                stack.pop()
+                continue
+            pending = [c >> 1 for c in (self.highs[index], self.lows[index]) if c >> 1 not in counts]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            level = self.node_levels[index] + 1
+            counts[index] = edge_count(self.highs[index], level) + edge_count(self.lows[index], level)
+        return edge_count(edge, 0)
+
+    def iter_models(self, edge):
+        """
+        Enumera, sob demanda, as valorações que satisfazem a função.
+
+        A busca desce pelos cofatores nível a nível, primeiro com a variável falsa;
+        uma variável ausente do caminho gera os dois ramos. Com arestas de
+        complemento, toda aresta diferente de FALSE é satisfatível, de modo que a
+        busca nunca volta de um ramo sem modelos e cada valoração custa O(n).
+
+        Args:
+            edge (int): Aresta do BDD
+
+        Yields:
+            dict: Valoração {variável: 0 ou 1} de todas as variáveis da ordem, em
+            ordem lexicográfica (a primeira variável da ordem é a mais significativa)
+        """
+        order = self.order
+        num_levels = self.num_levels
+        values = [0] * num_levels
+        # Tarefas: (nível, aresta, valor da variável do nível anterior)
+        stack = [(0, edge, None)] if edge != self.FALSE else []
+        while stack:
+            level, edge, value = stack.pop()
+            if value is not None:
+                values[level - 1] = value
+            if level == num_levels:
+                yield dict(zip(order, values))
+                continue
+            high, low = self.cofactors(edge, level)
+            if high != self.FALSE:
+                stack.append((level + 1, high, 1))
+            if low != self.FALSE:
+                stack.append((level + 1, low, 0))
+
+    def any_assignment(self, edge):
+        """
+        Encontra uma valoração que satisfaz a função.
+
+        Args:
+            edge (int): Aresta do BDD
+
+        Returns:
+            dict ou None: Dicionário {variável: 0 ou 1} (variáveis fora do caminho valem 0),
+            ou None se a função for insatisfatível
+        """
+        if edge == self.FALSE:
+            return None
+        assignment = {var: 0 for var in self.order}
+        while edge != self.TRUE:
+            level = self.level(edge)
+            high, low = self.cofactors(edge, level)
+            # Com arestas de complemento, toda aresta diferente de FALSE é satisfatível
+            if high != self.FALSE:
+                assignment[self.order[level]] = 1
+                edge = high
+            else:
+                edge = low
+        return assignment
+
+    def equivalent(self, f, g):
+        """
+        Verifica se duas funções construídas neste gerenciador são equivalentes.
+
+        Args:
+            f (int): Aresta da primeira função
+            g (int): Aresta da segunda função
+
+        Returns:
+            bool: True se as funções forem iguais
+        """
+        return f == g
+
+    @staticmethod
+    def appearance_order(node, variables):
+        """
+        Ordena as variáveis pela primeira ocorrência em um percurso em profundidade.
+
+        Variáveis que aparecem próximas na fórmula ficam em níveis próximos, o que
+        mantém pequenas cadeias como paridades e equivalências encadeadas.
+
+        Args:
+            node (tuple ou str): Nó da árvore de análise
+            variables (list): Lista de variáveis da fórmula
+
+        Returns:
+            list: Variáveis na ordem de primeira ocorrência (as ausentes ficam no final)
+        """
+        order = []
+        seen_vars = set()
+        visited = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if id(current) in visited:
+                continue
+            visited.add(id(current))
+            if isinstance(current, str):
+                if current not in seen_vars:
+                    seen_vars.add(current)
+                    order.append(current)
+            else:
+                stack.extend(reversed(current[1:]))
+        return order + [var for var in variables if var not in seen_vars]
+
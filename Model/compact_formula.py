@@ -0,0 +1,258 @@
+import struct
+import sys
+from array import array
+from Model.logical_operations import LogicalOperations
+
+class CompactFormula:
+    """
+    Classe que representa uma fórmula em forma compacta, em ordem pós-fixa.
+
+    Cada nó único do DAG ocupa uma posição: um opcode em um array('B') e dois
+    operandos em um array('I'). Para uma variável, o primeiro operando é o
+    índice da variável na lista de variáveis; para uma operação, os operandos
+    são as posições dos filhos, que sempre vêm antes do pai. Os nós cujos
+    valores interessam (as colunas da tabela) são indicados em outputs.
+
+    São 9 bytes por nó, contra uma tupla com referências a funções, os
+    dicionários de identidade e as chaves de internação da árvore de análise.
+    A árvore só existe durante a análise sintática: as funções de avaliação
+    (FormulaCompiler), a avaliação em código de Gray (GrayCodeEvaluator), os
+    textos das subfórmulas (render) e a serialização para os processos de
+    trabalho (ParallelEvaluator) trabalham sobre a forma compacta, e o
+    FormulaCache guarda apenas ela.
+    """
+
+    VAR, NOT, AND, OR, XOR, EQ, IMP = range(7)
+
+    # Operação correspondente a cada opcode (VAR não tem operação)
+    OPERATIONS = (
+        None,
+        LogicalOperations.not_op,
+        LogicalOperations.and_op,
+        LogicalOperations.or_op,
+        LogicalOperations.xor_op,
+        LogicalOperations.eq_op,
+        LogicalOperations.imp_op,
+    )
+    OPCODES = {op: code for code, op in enumerate(OPERATIONS) if op is not None}
+
+    MAGIC = b"TVCF"
+    VERSION = 1
+    # Assinatura, versão, tamanho da lista de variáveis, número de nós e de saídas
+    HEADER = struct.Struct("<4sBxxxIII")
+
+    def __init__(self, variables, opcodes, operands, outputs):
+        """
+        Inicializa a fórmula compacta.
+
+        Args:
+            variables (list): Lista de variáveis
+            opcodes (array): Opcode de cada nó (array('B'))
+            operands (array): Dois operandos por nó (array('I'))
+            outputs (array): Posições dos nós devolvidos pela avaliação (array('I'))
+        """
+        self.variables = variables
+        self.opcodes = opcodes
+        self.operands = operands
+        self.outputs = outputs
+
+    @classmethod
+    def from_tree(cls, nodes, variables):
+        """
+        Converte nós da árvore de análise na forma compacta.
+
+        Args:
+            nodes (list): Nós cujos valores devem ser devolvidos (por exemplo, as
+                subfórmulas na ordem das colunas)
+            variables (list): Lista de variáveis
+
+        Returns:
+            CompactFormula: Fórmula com todos os nós alcançáveis a partir de nodes
+
+        Raises:
+            ValueError: Se algum nó for de um tipo desconhecido
+        """
+        return cls.encode(nodes, variables)[0]
+
+    @classmethod
+    def from_subformulas(cls, expression, variables):
+        """
+        Converte uma expressão na forma compacta, com uma saída por subfórmula.
+
+        Args:
+            expression (tuple ou str): Expressão lógica analisada
+            variables (list): Lista de variáveis
+
+        Returns:
+            CompactFormula: Fórmula cujas saídas são as operações, na ordem das
+            colunas da tabela verdade (a mesma de FormulaHandler.get_subformulas):
+            cada subfórmula depois das que a compõem e a expressão inteira por último
+
+        Raises:
+            ValueError: Se algum nó for de um tipo desconhecido
+        """
+        formula = cls.from_tree([expression], variables)
+        formula.outputs = array("I", [i for i, opcode in enumerate(formula.opcodes) if opcode != cls.VAR])
+        return formula
+
+    @classmethod
+    def encode(cls, nodes, variables):
+        """
+        Converte nós da árvore de análise na forma compacta, guardando o nó de cada posição.
+
+        Args:
+            nodes (list): Nós cujos valores devem ser devolvidos
+            variables (list): Lista de variáveis
+
+        Returns:
+            tuple: (CompactFormula, lista com o nó da árvore em cada posição)
+
+        Raises:
+            ValueError: Se algum nó for de um tipo desconhecido
+        """
+        var_ids = {var: i for i, var in enumerate(variables)}
+        opcodes = array("B")
+        operands = array("I")
+        tree_nodes = []
+        positions = {}
+        # Percurso em pós-ordem com pilha explícita, cada nó único uma vez
+        for node in nodes:
+            stack = [node]
+            while stack:
+                current = stack[-1]
+                key = id(current)
+                if key in positions:
+                    stack.pop()
+                elif isinstance(current, tuple):
+                    pending = [arg for arg in current[1:] if id(arg) not in positions]
+                    if pending:
+                        stack.extend(reversed(pending))
+                        continue
+                    stack.pop()
+                    args = [positions[id(arg)] for arg in current[1:]]
+                    positions[key] = len(opcodes)
+                    tree_nodes.append(current)
+                    opcodes.append(cls.OPCODES[current[0]])
+                    operands.extend(args if len(args) == 2 else (args[0], 0))
+                elif isinstance(current, str):
+                    stack.pop()
+                    positions[key] = len(opcodes)
+                    tree_nodes.append(current)
+                    opcodes.append(cls.VAR)
+                    operands.extend((var_ids[current], 0))
+                else:
+                    raise ValueError(f"Nó incorreto: {current}")
+        outputs = array("I", [positions[id(node)] for node in nodes])
+        return cls(list(variables), opcodes, operands, outputs), tree_nodes
+
+    def __len__(self):
+        """
+        Retorna o número de nós únicos.
+
+        Returns:
+            int: Número de nós
+        """
+        return len(self.opcodes)
+
+    @property
+    def nbytes(self):
+        """
+        Retorna a memória ocupada pelos arrays da fórmula.
+
+        Returns:
+            int: Número de bytes dos opcodes, operandos e saídas
+        """
+        return sum(len(a) * a.itemsize for a in (self.opcodes, self.operands, self.outputs))
+
+    def render(self, op_symbols):
+        """
+        Converte cada nó em texto, em uma única passagem pelos arrays.
+
+        Cada texto é montado a partir dos textos já gerados dos filhos, que vêm
+        antes do pai, de modo que o custo é linear no número de nós (mais o
+        tamanho dos textos produzidos).
+
+        Args:
+            op_symbols (dict): Símbolo de cada operação (Parser.op_symbols)
+
+        Returns:
+            list: Texto de cada nó, na ordem das posições; operações sem os
+            parênteses externos, como em FormulaHandler.node_to_string
+        """
+        operations = self.OPERATIONS
+        variables = self.variables
+        operands = self.operands
+        texts = []
+        # Texto de cada nó como operando: operações ficam entre parênteses
+        operand_texts = []
+        for i, opcode in enumerate(self.opcodes):
+            first = operands[2 * i]
+            if opcode == self.VAR:
+                texts.append(variables[first])
+                operand_texts.append(variables[first])
+                continue
+            if opcode == self.NOT:
+                text = f"~{operand_texts[first]}"
+            else:
+                text = f"{operand_texts[first]} {op_symbols[operations[opcode]]} {operand_texts[operands[2 * i + 1]]}"
+            texts.append(text)
+            operand_texts.append(f"({text})")
+        return texts
+
+    def to_bytes(self):
+        """
+        Serializa a fórmula.
+
+        Returns:
+            bytes: Cabeçalho, variáveis (UTF-8 separadas por quebra de linha), opcodes,
+            operandos e saídas (inteiros de 32 bits little-endian)
+        """
+        names = "\n".join(self.variables).encode("utf-8")
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, len(names), len(self.opcodes), len(self.outputs))
+        operands = self.operands
+        outputs = self.outputs
+        if sys.byteorder == "big":
+            operands = array("I", operands)
+            outputs = array("I", outputs)
+            operands.byteswap()
+            outputs.byteswap()
+        return b"".join((header, names, self.opcodes.tobytes(), operands.tobytes(), outputs.tobytes()))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Reconstrói uma fórmula serializada por to_bytes.
+
+        Args:
+            data (bytes): Fórmula serializada
+
+        Returns:
+            CompactFormula: A fórmula
+
+        Raises:
+            ValueError: Se os dados não forem uma fórmula serializada válida
+        """
+        if len(data) < cls.HEADER.size:
+            raise ValueError("Fórmula serializada incompleta.")
+        magic, version, names_size, num_nodes, num_outputs = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Formato de fórmula serializada desconhecido.")
+        position = cls.HEADER.size
+        sizes = (names_size, num_nodes, 8 * num_nodes, 4 * num_outputs)
+        if len(data) != position + sum(sizes):
+            raise ValueError("Fórmula serializada com tamanho incorreto.")
+
+        names = bytes(data[position:position + names_size]).decode("utf-8")
+        position += names_size
+        opcodes = array("B", data[position:position + num_nodes])
+        position += num_nodes
+        operands = array("I")
+        operands.frombytes(data[position:position + 8 * num_nodes])
+        position += 8 * num_nodes
+        outputs = array("I")
+        outputs.frombytes(data[position:])
+        if sys.byteorder == "big":
+            operands.byteswap()
+            outputs.byteswap()
+        variables = names.split("\n") if names else []
+        return cls(variables, opcodes, operands, outputs)
@@ -0,0 +1,196 @@
+import random
+from Model.bdd import BDD, NodeLimitExceeded
+from Model.formula_compiler import FormulaCompiler
+from Model.logical_operations import LogicalOperations
+
+class EquivalenceChecker:
+    """
+    Classe responsável por decidir se duas fórmulas são equivalentes (têm o
+    mesmo valor em todas as valorações das variáveis das duas) sem montar a
+    tabela verdade da equivalência entre elas.
+
+    Cada fórmula recebe primeiro uma assinatura de simulação aleatória: cada
+    variável é associada a uma máscara aleatória de 64 bits (sempre a mesma
+    para o mesmo nome) e a fórmula compilada é avaliada uma única vez sobre
+    essas máscaras, o que equivale a avaliá-la em 64 valorações aleatórias ao
+    mesmo tempo. Assinaturas diferentes provam que as fórmulas não são
+    equivalentes, e o bit em que elas diferem dá a valoração que as distingue.
+    Assinaturas iguais só indicam a equivalência, que é confirmada por BDDs
+    (canônicos, em um mesmo gerenciador) ou, se o BDD ultrapassar MAX_BDD_NODES
+    nós, pelo resolvedor SAT aplicado ao ou-exclusivo das duas fórmulas.
+    """
+
+    SIGNATURE_BITS = 64
+    FULL_MASK = (1 << SIGNATURE_BITS) - 1
+
+    # Limite de nós do BDD usado na confirmação exata
+    MAX_BDD_NODES = 1 << 16
+
+    def __init__(self, seed=0):
+        """
+        Inicializa o verificador.
+
+        Args:
+            seed (int ou str, opcional): Semente das máscaras aleatórias; a mesma semente
+                produz as mesmas assinaturas em qualquer processo
+        """
+        self.seed = seed
+        self.masks = {}
+
+    def variable_mask(self, var):
+        """
+        Retorna a máscara aleatória de uma variável.
+
+        Args:
+            var (str): Nome da variável
+
+        Returns:
+            int: Máscara de SIGNATURE_BITS bits; o bit i é o valor da variável na i-ésima
+            valoração simulada
+        """
+        mask = self.masks.get(var)
+        if mask is None:
+            mask = random.Random(f"{self.seed}:{var}").getrandbits(self.SIGNATURE_BITS)
+            self.masks[var] = mask
+        return mask
+
+    def signature(self, expression, variables):
+        """
+        Calcula a assinatura de simulação aleatória de uma fórmula.
+
+        Args:
+            expression (tuple ou str): Expressão lógica analisada
+            variables (list): Lista de variáveis na expressão
+
+        Returns:
+            int: Valores da fórmula nas SIGNATURE_BITS valorações simuladas, um por bit
+        """
+        formula = FormulaCompiler(variables).compile([expression])
+        (bits,) = formula(tuple(self.variable_mask(var) for var in variables), self.FULL_MASK)
+        return bits
+
+    def find_difference(self, first, first_variables, second, second_variables):
+        """
+        Procura uma valoração em que as duas fórmulas têm valores diferentes.
+
+        Args:
+            first (tuple ou str): Primeira expressão analisada
+            first_variables (list): Variáveis da primeira expressão
+            second (tuple ou str): Segunda expressão analisada
+            second_variables (list): Variáveis da segunda expressão
+
+        Returns:
+            dict ou None: Valoração {variável: 0 ou 1} das variáveis das duas fórmulas que
+            as distingue, ou None se as fórmulas forem equivalentes
+        """
+        variables = sorted(set(first_variables).union(second_variables))
+        difference = self.signature(first, first_variables) ^ self.signature(second, second_variables)
+        if difference:
+            bit = (difference & -difference).bit_length() - 1
+            return {var: (self.variable_mask(var) >> bit) & 1 for var in variables}
+
+        xor = (LogicalOperations.xor_op, first, second)
+        try:
+            bdd = BDD(BDD.appearance_order(xor, variables), node_limit=self.MAX_BDD_NODES)
+            assignment = bdd.any_assignment(bdd.from_formula(xor))
+        except NodeLimitExceeded:
+            # Importação tardia: o resolvedor só é necessário para fórmulas grandes
+            from Model.sat_solver import TseitinEncoder
+            assignment = TseitinEncoder(variables).find_assignment(xor, True)
+        if assignment is None:
+            return None
+        return {var: assignment[var] for var in variables}
+
+    def equivalent(self, first, first_variables, second, second_variables):
+        """
+        Verifica se duas fórmulas são equivalentes.
+
+        Args:
+            first (tuple ou str): Primeira expressão analisada
+            first_variables (list): Variáveis da primeira expressão
+            second (tuple ou str): Segunda expressão analisada
+            second_variables (list): Variáveis da segunda expressão
+
+        Returns:
+            bool: True se as fórmulas tiverem o mesmo valor em todas as valorações
+        """
+        return self.find_difference(first, first_variables, second, second_variables) is None
+
+    def group(self, formulas):
+        """
+        Separa fórmulas em classes de equivalência.
+
+        As fórmulas são agrupadas pela assinatura (um dicionário, sem comparações
+        entre pares); dentro de cada grupo, as classes são confirmadas construindo
+        todas as fórmulas do grupo em um mesmo gerenciador de BDDs, em que fórmulas
+        equivalentes têm a mesma aresta. Se o BDD ultrapassar MAX_BDD_NODES nós, cada
+        fórmula do grupo é comparada com o representante de cada classe já formada.
+
+        Args:
+            formulas (iterable): Pares (expressão analisada, lista de variáveis)
+
+        Returns:
+            list: Classes de equivalência, cada uma a lista dos índices de suas
+            fórmulas em ordem crescente; as classes estão na ordem do primeiro índice
+        """
+        formulas = list(formulas)
+        buckets = {}
+        for index, (expression, variables) in enumerate(formulas):
+            buckets.setdefault(self.signature(expression, variables), []).append(index)
+
+        classes = []
+        for bucket in buckets.values():
+            if len(bucket) == 1:
+                classes.append(bucket)
+                continue
+            try:
+                classes.extend(self._group_bdd([formulas[index] for index in bucket], bucket))
+            except NodeLimitExceeded:
+                classes.extend(self._group_pairwise(formulas, bucket))
+        classes.sort(key=lambda members: members[0])
+        return classes
+
+    def _group_bdd(self, formulas, indices):
+        """
+        Separa fórmulas de mesma assinatura pela aresta no mesmo gerenciador de BDDs.
+
+        Args:
+            formulas (list): Pares (expressão analisada, lista de variáveis)
+            indices (list): Índice de cada fórmula
+
+        Returns:
+            list: Classes de equivalência (listas de índices)
+
+        Raises:
+            NodeLimitExceeded: Se o BDD ultrapassar MAX_BDD_NODES nós
+        """
+        variables = sorted({var for _, formula_variables in formulas for var in formula_variables})
+        bdd = BDD(BDD.appearance_order(formulas[0][0], variables), node_limit=self.MAX_BDD_NODES)
+        classes = {}
+        for index, (expression, _) in zip(indices, formulas):
+            classes.setdefault(bdd.from_formula(expression), []).append(index)
+        return list(classes.values())
+
+    def _group_pairwise(self, formulas, indices):
+        """
+        Separa fórmulas de mesma assinatura comparando cada uma com os representantes
+        das classes já formadas.
+
+        Args:
+            formulas (list): Pares (expressão analisada, lista de variáveis) de todas as fórmulas
+            indices (list): Índices das fórmulas a separar
+
+        Returns:
+            list: Classes de equivalência (listas de índices)
+        """
+        classes = []
+        for index in indices:
+            expression, variables = formulas[index]
+            for members in classes:
+                representative, representative_variables = formulas[members[0]]
+                if self.equivalent(representative, representative_variables, expression, variables):
+                    members.append(index)
+                    break
+            else:
+                classes.append([index])
+        return classes
@@ -1,11 +1,68 @@
 import re
+from array import array
+from itertools import accumulate, chain
 
 class ExpressionProcessor:
     """
     Classe responsável pelo processamento de expressões lógicas.
-    Fornece métodos para extrair variáveis e tokenizar expressões.
+    Fornece métodos para extrair variáveis e tokenizar expressões; ambos usam o
+    mesmo analisador léxico (lex), que faz as duas coisas em uma única passada.
     """
     
+    # Grafia canônica (a usada pelo Parser) de cada operador, em ASCII ou Unicode
+    OPERATORS = {
+        '(': '(', ')': ')',
+        '^': '^', '∧': '^',
+        'v': 'v', '∨': 'v',
+        '~': '~', '¬': '~',
+        'x': 'x', '⊻': 'x',
+        '->': '->', '→': '->',
+        '<->': '<->', '↔': '<->',
+    }
+
+    # Expressão regular única do analisador léxico: cada ocorrência é formada pelos
+    # espaços que antecedem um token (grupo 1) e pelo token (grupo 2), que é um
+    # operador, um nome (letra seguida de letras ou dígitos) ou um caractere
+    # qualquer, rejeitado depois. As ocorrências cobrem a expressão sem lacunas.
+    TOKEN_PATTERN = re.compile(r"(\s*)(<->|->|[()^~∧∨¬⊻→↔]|[^\W\d_][^\W_]*|\S)")
+    NAME_PATTERN = re.compile(r"[^\W\d_][^\W_]*")
+
+    @staticmethod
+    def lex(expression):
+        """
+        Analisa lexicamente uma expressão em uma única passada.
+        
+        Toda a varredura é feita pelo mecanismo de expressões regulares e por
+        funções embutidas, sem um laço Python por caractere ou por token. "v" e "x"
+        isolados são operadores; dentro de um nome (como "PvQ") fazem parte dele.
+        
+        Args:
+            expression (str): A expressão lógica a ser analisada
+            
+        Returns:
+            tuple: (tokens na grafia canônica, posições, lista ordenada de variáveis
+            únicas), em que posições é um array com o início e o fim de cada token
+            na expressão: o token i ocupa expression[spans[2 * i]:spans[2 * i + 1]]
+            
+        Raises:
+            ValueError: Se a expressão contiver caracteres inválidos
+        """
+        operators = ExpressionProcessor.OPERATORS
+        matches = ExpressionProcessor.TOKEN_PATTERN.findall(expression)
+        # Somas acumuladas dos tamanhos (espaços, token, espaços, token, ...): fim dos
+        # espaços = início do token, seguido do fim do token
+        spans = array("q", accumulate(map(len, chain.from_iterable(matches))))
+        raw_tokens = [token for _, token in matches]
+        
+        names = set(raw_tokens).difference(operators)
+        invalid = [name for name in names if not ExpressionProcessor.NAME_PATTERN.fullmatch(name)]
+        if invalid:
+            index = min(raw_tokens.index(name) for name in invalid)
+            raise ValueError(f"Caractere incorreto: {raw_tokens[index]} (posição {spans[2 * index]})")
+        
+        tokens = list(map(operators.get, raw_tokens, raw_tokens))
+        return tokens, spans, sorted(names)
+
     @staticmethod
     def extract_variables(expression):
         """
@@ -16,14 +73,11 @@ class ExpressionProcessor:
             
         Returns:
             list: Lista ordenada de variáveis únicas encontradas na expressão
+            
+        Raises:
+            ValueError: Se a expressão contiver caracteres inválidos
         """
-        # Encontra todas as letras na expressão
-        all_chars = re.findall(r'[a-zA-Z]+', expression)
-        # Filtra operadores conhecidos
-        operators = ['v', '⊻', '^', '~', '→', '↔']
-        # Retorna variáveis únicas em ordem alfabética
-        variables = sorted(list(set([char for char in all_chars if char not in operators])))
-        return variables
+        return ExpressionProcessor.lex(expression)[2]
 
     @staticmethod
     def tokenize(expression):
@@ -39,39 +93,4 @@ class ExpressionProcessor:
         Raises:
             ValueError: Se a expressão contiver caracteres inválidos
         """
-        tokens = []
-        i = 0
-
-        while i < len(expression):
-            char = expression[i]
-            if char in "()":
-                tokens.append(char)
-                i += 1
-            elif char.isalpha():
-                # Captura variáveis (letras)
-                var = char
-                i += 1
-                while i < len(expression) and expression[i].isalnum():
-                    var += expression[i]
-                    i += 1
-                tokens.append(var)
-            elif char == "^":
-                tokens.append("^")
-                i += 1
-            elif char == "~":
-                tokens.append("~")
-                i += 1
-            elif char == "v":
-                tokens.append("v")
-                i += 1
-            elif char == "-" and i + 1 < len(expression) and expression[i + 1] == ">":
-                tokens.append("->")
-                i += 2
-            elif char == "<" and i + 2 < len(expression) and expression[i + 1] == "-" and expression[i + 2] == ">":
-                tokens.append("<->")
-                i += 3
-            elif char.isspace():
-                i += 1
-            else:
-                raise ValueError(f"Caractere incorreto: {char}")
-        return tokens
\ No newline at end of file
+        return ExpressionProcessor.lex(expression)[0]
@@ -0,0 +1,299 @@
+import threading
+from collections import OrderedDict
+from Model.expression_processor import ExpressionProcessor
+from Model.parser import Parser
+from Model.compact_formula import CompactFormula
+from Model.stats import Stats
+
+class CachedFormula:
+    """
+    Classe que guarda tudo o que foi calculado para uma fórmula: variáveis,
+    forma compacta com uma saída por subfórmula e, depois de gerada, a tabela
+    verdade e sua classificação.
+
+    A árvore de análise (e o parser, com seus dicionários de internação) é
+    descartada depois da conversão: a entrada ocupa cerca de 13 bytes por nó,
+    além da chave canônica, e os textos das subfórmulas só são gerados quando
+    pedidos (render).
+    """
+
+    # Estimativa de bytes de cada texto no índice auxiliar, além dos caracteres
+    TEXT_KEY_BYTES = 120
+
+    def __init__(self, key, formula, op_symbols):
+        """
+        Inicializa a entrada do cache.
+
+        Args:
+            key (str): Forma canônica da fórmula
+            formula (CompactFormula): Fórmula com uma saída por subfórmula
+                (CompactFormula.from_subformulas)
+            op_symbols (dict): Símbolo de cada operação (Parser.op_symbols)
+        """
+        self.key = key
+        self.formula = formula
+        self.variables = formula.variables
+        self.op_symbols = op_symbols
+        self.table = None
+        self.classification = None
+        # Textos do índice auxiliar que apontam para esta entrada
+        self.text_keys = []
+
+    def render(self):
+        """
+        Gera o texto da fórmula e de suas subfórmulas.
+
+        Returns:
+            tuple: (texto da fórmula inteira, lista com o texto de cada subfórmula,
+            na ordem das colunas da tabela verdade)
+        """
+        texts = self.formula.render(self.op_symbols)
+        return texts[-1], [texts[i] for i in self.formula.outputs]
+
+    @property
+    def nbytes(self):
+        """
+        Estima a memória ocupada pela entrada.
+
+        Returns:
+            int: Número aproximado de bytes
+        """
+        size = self.formula.nbytes + len(self.key)
+        size += sum(len(text) + self.TEXT_KEY_BYTES for text in self.text_keys)
+        if self.table is not None:
+            size += self.table.nbytes
+        return size
+
+
+class FormulaCache:
+    """
+    Classe que implementa um cache LRU, limitado em bytes, das fórmulas já analisadas
+    e de suas tabelas verdade.
+
+    As entradas são indexadas pela forma canônica da árvore de análise, de modo
+    que espaços e parênteses redundantes não mudam a chave. Um índice auxiliar,
+    pelo texto com os espaços normalizados, evita repetir a tokenização e a
+    análise sintática quando o mesmo texto é pedido de novo.
+
+    Opcionalmente, as tabelas também são procuradas e gravadas em um TableStore,
+    que as mantém em disco entre sessões.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, store=None):
+        """
+        Inicializa o cache.
+
+        Args:
+            max_bytes (int, opcional): Orçamento de memória das entradas
+            store (TableStore, opcional): Cache persistente das tabelas em disco
+        """
+        self.max_bytes = max_bytes
+        self.store = store
+        self.entries = OrderedDict()
+        self.text_index = {}
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.table_hits = 0
+        self.table_misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def canonical_key(node, op_symbols):
+        """
+        Gera a forma canônica de uma árvore de análise, totalmente parentizada.
+
+        Args:
+            node (tuple ou str): Nó da árvore de análise
+            op_symbols (dict): Símbolo de cada operação (Parser.op_symbols)
+
+        Returns:
+            str: Forma canônica da fórmula
+        """
+        rendered = {}
+        stack = [(node, False)]
+        while stack:
+            current, expanded = stack.pop()
+            key = id(current)
+            if key in rendered:
+                continue
+            if isinstance(current, str):
+                rendered[key] = current
+            elif not expanded:
+                stack.append((current, True))
+                stack.extend((arg, False) for arg in current[1:])
+            else:
+                args = [rendered[id(arg)] for arg in current[1:]]
+                if len(args) == 1:
+                    rendered[key] = f"{op_symbols[current[0]]}{args[0]}"
+                else:
+                    rendered[key] = f"({args[0]} {op_symbols[current[0]]} {args[1]})"
+        return rendered[id(node)]
+
+    def get_formula(self, expression, stats=None):
+        """
+        Retorna a entrada de uma expressão, analisando-a apenas se necessário.
+
+        Args:
+            expression (str): Expressão lógica digitada pelo usuário
+            stats (Stats, opcional): Estatísticas que recebem o tempo das etapas lex,
+                parse e compact e o contador shared_nodes (nós removidos pelo
+                compartilhamento de subexpressões), apenas quando o texto não está
+                no cache, e os contadores formula_cache_hits e formula_cache_misses
+
+        Returns:
+            CachedFormula: Entrada do cache (a tabela pode ainda não ter sido gerada)
+
+        Raises:
+            ValueError: Se a expressão for inválida
+        """
+        if stats is None:
+            stats = Stats.DISABLED
+        text_key = " ".join(expression.split())
+        with self._lock:
+            key = self.text_index.get(text_key)
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                stats.count("formula_cache_hits")
+                return self.entries[key]
+
+        with stats.stage("lex"):
+            tokens, _, variables = ExpressionProcessor.lex(expression)
+        with stats.stage("parse"):
+            parser = Parser(tokens, variables)
+            parsed_expression = parser.parse()
+            key = self.canonical_key(parsed_expression, parser.op_symbols)
+        if stats.enabled:
+            stats.count("shared_nodes", parser.shared_node_count(parsed_expression))
+
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                stats.count("formula_cache_hits")
+                before = entry.nbytes
+                self._index_text(entry, text_key)
+                self.current_bytes += entry.nbytes - before
+                self._evict()
+                return entry
+            self.misses += 1
+            stats.count("formula_cache_misses")
+            with stats.stage("compact"):
+                entry = CachedFormula(key, CompactFormula.from_subformulas(parsed_expression, variables),
+                                      parser.op_symbols)
+            self._index_text(entry, text_key)
+            self.entries[key] = entry
+            self.current_bytes += entry.nbytes
+            self._evict()
+            return entry
+
+    def _index_text(self, entry, text_key):
+        """
+        Registra um texto no índice auxiliar e na entrada para a qual ele aponta
+        (chamado com o lock adquirido).
+
+        Args:
+            entry (CachedFormula): Entrada do cache
+            text_key (str): Texto da expressão com os espaços normalizados
+        """
+        if text_key not in self.text_index:
+            self.text_index[text_key] = entry.key
+            entry.text_keys.append(text_key)
+
+    def get_table(self, entry):
+        """
+        Retorna a tabela já calculada de uma entrada, contabilizando acertos e falhas.
+        Se ela não estiver em memória, é procurada no cache em disco.
+
+        Args:
+            entry (CachedFormula): Entrada do cache
+
+        Returns:
+            TruthTable ou None: A tabela, ou None se ainda não foi gerada
+        """
+        with self._lock:
+            if entry.table is not None:
+                self.table_hits += 1
+                return entry.table
+
+        loaded = None
+        if self.store is not None:
+            loaded = self.store.load(self.store.table_key(entry.key, entry.variables))
+
+        with self._lock:
+            if loaded is None:
+                self.table_misses += 1
+                return None
+            self.table_hits += 1
+            self.disk_hits += 1
+            self._set_table(entry, *loaded)
+            return entry.table
+
+    def put_table(self, entry, table, classification):
+        """
+        Guarda a tabela gerada de uma entrada e aplica o orçamento de memória.
+
+        Args:
+            entry (CachedFormula): Entrada do cache
+            table (TruthTable): Tabela verdade gerada
+            classification (str): Classificação da fórmula
+        """
+        with self._lock:
+            self._set_table(entry, table, classification)
+        if self.store is not None and table.start == 0:
+            self.store.store(self.store.table_key(entry.key, entry.variables), table, classification)
+
+    def _set_table(self, entry, table, classification):
+        """
+        Associa uma tabela a uma entrada e aplica o orçamento de memória
+        (chamado com o lock adquirido).
+
+        Args:
+            entry (CachedFormula): Entrada do cache
+            table (TruthTable): Tabela verdade
+            classification (str): Classificação da fórmula
+        """
+        before = entry.nbytes
+        entry.table = table
+        entry.classification = classification
+        if self.entries.get(entry.key) is entry:
+            self.current_bytes += entry.nbytes - before
+            self.entries.move_to_end(entry.key)
+            self._evict()
+
+    def _evict(self):
+        """
+        Remove as entradas menos usadas recentemente até caber no orçamento.
+        A entrada mais recente é mantida mesmo que sozinha ultrapasse o orçamento.
+        """
+        while self.current_bytes > self.max_bytes and len(self.entries) > 1:
+            _, entry = self.entries.popitem(last=False)
+            self.current_bytes -= entry.nbytes
+            self.evictions += 1
+            for text_key in entry.text_keys:
+                del self.text_index[text_key]
+
+    def stats(self):
+        """
+        Retorna as estatísticas de uso do cache.
+
+        Returns:
+            dict: Acertos e falhas de fórmulas e tabelas (e quantos acertos vieram do disco),
+            remoções, entradas e bytes ocupados
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "table_hits": self.table_hits,
+                "table_misses": self.table_misses,
+                "disk_hits": self.disk_hits,
+                "evictions": self.evictions,
+                "entries": len(self.entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,116 @@
+from Model.logical_operations import LogicalOperations
+from Model.compact_formula import CompactFormula
+
+class FormulaCompiler:
+    """
+    Classe responsável por compilar fórmulas em uma única função Python.
+    A função gerada recebe uma tupla com os valores das variáveis (na ordem da
+    lista de variáveis) e devolve, em uma só chamada, o valor de cada subfórmula,
+    sem recursão, sem consultas a dicionários e sem chamadas de função por nó.
+    O código é gerado a partir da forma compacta (CompactFormula); árvores de
+    análise são convertidas antes.
+
+    As operações são escritas com operadores bit a bit (&, |, ^) sobre o valor
+    "one", de modo que o mesmo código serve para valores 0/1 (one=1), para colunas
+    empacotadas em inteiros (one=máscara com todos os bits) e para vetores
+    booleanos do NumPy (one=True).
+    """
+
+    FUNCTION_NAME = "_formula"
+
+    # Modelos de código para cada operação
+    templates = {
+        LogicalOperations.and_op: "{0} & {1}",
+        LogicalOperations.or_op: "{0} | {1}",
+        LogicalOperations.not_op: "one ^ {0}",
+        LogicalOperations.xor_op: "{0} ^ {1}",
+        LogicalOperations.eq_op: "one ^ {0} ^ {1}",
+        LogicalOperations.imp_op: "(one ^ {0}) | {1}",
+    }
+
+    def __init__(self, variables):
+        """
+        Inicializa o compilador.
+
+        Args:
+            variables (list): Lista de variáveis; a posição de cada variável na lista
+                é a posição do seu valor na tupla recebida pela função gerada
+        """
+        self.variables = variables
+        self.var_names = {var: f"v{i}" for i, var in enumerate(variables)}
+
+    def generate_compact_source(self, formula):
+        """
+        Gera o código-fonte da função que avalia uma fórmula compacta, sem
+        reconstruir a árvore de análise.
+
+        Args:
+            formula (CompactFormula): Fórmula compacta com as mesmas variáveis do compilador
+
+        Returns:
+            str: Código-fonte da função, que devolve o valor de cada saída da fórmula
+        """
+        lines = [f"def {self.FUNCTION_NAME}(values, one=1):"]
+        if self.variables:
+            lines.append(f"    ({', '.join(self.var_names.values())},) = values")
+
+        operations = formula.OPERATIONS
+        operands = formula.operands
+        names = []
+        for i, opcode in enumerate(formula.opcodes):
+            first = operands[2 * i]
+            if opcode == formula.VAR:
+                names.append(f"v{first}")
+                continue
+            name = f"n{i}"
+            args = (names[first],) if opcode == formula.NOT else (names[first], names[operands[2 * i + 1]])
+            lines.append(f"    {name} = {self.templates[operations[opcode]].format(*args)}")
+            names.append(name)
+
+        results = ", ".join(names[i] for i in formula.outputs)
+        lines.append(f"    return ({results}{',' if len(formula.outputs) == 1 else ''})")
+        return "\n".join(lines) + "\n"
+
+    def compile(self, nodes):
+        """
+        Compila uma lista de nós em uma função Python.
+
+        Args:
+            nodes (list): Nós da árvore de análise cujos valores devem ser devolvidos
+
+        Returns:
+            function: Função que recebe a tupla de valores das variáveis (e, opcionalmente,
+            o valor "one") e devolve uma tupla com o valor de cada nó
+
+        Raises:
+            ValueError: Se algum nó for de um tipo desconhecido
+        """
+        return self.compile_compact(CompactFormula.from_tree(nodes, self.variables))
+
+    def compile_compact(self, formula):
+        """
+        Compila uma fórmula compacta em uma função Python.
+
+        Args:
+            formula (CompactFormula): Fórmula compacta com as mesmas variáveis do compilador
+
+        Returns:
+            function: Função que recebe a tupla de valores das variáveis (e, opcionalmente,
+            o valor "one") e devolve uma tupla com o valor de cada saída da fórmula
+        """
+        return self.load(self.generate_compact_source(formula))
+
+    @classmethod
+    def load(cls, source):
+        """
+        Carrega uma função a partir do código-fonte gerado por generate_compact_source.
+
+        Args:
+            source (str): Código-fonte da função
+
+        Returns:
+            function: A função compilada
+        """
+        namespace = {}
+        exec(compile(source, "<fórmula compilada>", "exec"), namespace)
+        return namespace[cls.FUNCTION_NAME]
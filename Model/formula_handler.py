@@ -1,4 +1,4 @@
-from Model.logical_operations import LogicalOperations
+from Model.compact_formula import CompactFormula
 
 class FormulaHandler:
     """
@@ -20,48 +20,29 @@ class FormulaHandler:
         """
         Obtém todas as subfórmulas de uma expressão lógica.
         
+        A expressão é convertida na forma compacta e seus textos são gerados por
+        CompactFormula.render, em uma única passagem que converte cada nó único em
+        texto uma só vez, reaproveitando o texto já gerado dos filhos, de modo que
+        o custo é linear no número de nós (mais o tamanho dos textos produzidos).
+        
         Args:
             node (tuple ou str): Nó da árvore de análise representando a expressão
-            subformulas (set, opcional): Conjunto para armazenar subfórmulas encontradas
+            subformulas (list, opcional): Lista na qual as subfórmulas encontradas são acrescentadas
             
         Returns:
-            set: Conjunto de tuplas (string_da_subfórmula, nó_da_subfórmula)
+            list: Tuplas (string_da_subfórmula, nó_da_subfórmula) de cada operação, em
+            ordem topológica: cada subfórmula vem depois das subfórmulas que a compõem
+            e a expressão inteira vem por último
+            
+        Raises:
+            ValueError: Se o tipo de algum nó for desconhecido
         """
         if subformulas is None:
-            subformulas = set()
-        
-        # Se o nó é uma tupla, é uma operação
-        if isinstance(node, tuple):
-            op = node[0]
-            args = node[1:]
-            
-            # Recursivamente obter subfórmulas dos operandos
-            for arg in args:
-                self.get_subformulas(arg, subformulas)
-            
-            # Construir a representação textual da subfórmula
-            if op == LogicalOperations.not_op:
-                # Operador unário (negação)
-                arg_str = self.node_to_string(args[0])
-                if isinstance(args[0], tuple):
-                    subformula = f"~({arg_str})"
-                else:
-                    subformula = f"~{arg_str}"
-                subformulas.add((subformula, node))
-            else:
-                # Operadores binários
-                left_str = self.node_to_string(args[0])
-                right_str = self.node_to_string(args[1])
-                
-                # Adicionar parênteses se os operandos são operações complexas
-                if isinstance(args[0], tuple):
-                    left_str = f"({left_str})"
-                if isinstance(args[1], tuple):
-                    right_str = f"({right_str})"
-                    
-                subformula = f"{left_str} {self.op_symbols[op]} {right_str}"
-                subformulas.add((subformula, node))
-        
+            subformulas = []
+        formula, tree_nodes = CompactFormula.encode([node], self.parser.variables)
+        texts = formula.render(self.op_symbols)
+        subformulas.extend((texts[i], tree_nodes[i])
+                           for i, opcode in enumerate(formula.opcodes) if opcode != formula.VAR)
         return subformulas
 
     def node_to_string(self, node):
@@ -77,30 +58,4 @@ class FormulaHandler:
         Raises:
             ValueError: Se o tipo de nó for desconhecido
         """
-        if isinstance(node, str):
-            return node
-        elif isinstance(node, tuple):
-            op = node[0]
-            args = node[1:]
-            
-            if op == LogicalOperations.not_op:
-                # Operador unário (negação)
-                arg_str = self.node_to_string(args[0])
-                if isinstance(args[0], tuple):
-                    return f"~({arg_str})"
-                else:
-                    return f"~{arg_str}"
-            else:
-                # Operadores binários
-                left_str = self.node_to_string(args[0])
-                right_str = self.node_to_string(args[1])
-                
-                # Adicionar parênteses se os operandos são operações complexas
-                if isinstance(args[0], tuple):
-                    left_str = f"({left_str})"
-                if isinstance(args[1], tuple):
-                    right_str = f"({right_str})"
-                    
-                return f"{left_str} {self.op_symbols[op]} {right_str}"
-        else:
-            raise ValueError(f"Tipo de nó desconhecido: {type(node)}")
\ No newline at end of file
+        return CompactFormula.from_tree([node], self.parser.variables).render(self.op_symbols)[-1]
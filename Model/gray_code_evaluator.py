@@ -0,0 +1,162 @@
+from Model.compact_formula import CompactFormula
+from Model.formula_compiler import FormulaCompiler
+
+class GrayCodeEvaluator:
+    """
+    Classe responsável por avaliar uma fórmula linha a linha percorrendo as
+    valorações em código de Gray, em que apenas uma variável muda de uma linha
+    para a seguinte.
+
+    Para cada variável é pré-calculado o seu cone de influência: as subfórmulas
+    que dependem dela, direta ou indiretamente. A cada passo só o cone da
+    variável alterada é recalculado, por um trecho de código gerado para
+    ela; os demais valores continuam válidos. Como a variável associada ao bit
+    menos significativo do contador muda em metade dos passos, ela é a de menor
+    cone. As linhas são gravadas na posição do índice canônico (a ordem de
+    itertools.product), de modo que o resultado não depende da ordem da visita.
+    """
+
+    FUNCTION_NAME = "_gray_rows"
+
+    def __init__(self, variables, nodes):
+        """
+        Inicializa o avaliador.
+
+        Args:
+            variables (list): Lista de variáveis, na ordem das colunas
+            nodes (list): Nós das subfórmulas, na ordem das colunas
+        """
+        self.variables = variables
+        self.formula = CompactFormula.from_tree(nodes, variables)
+        n = len(variables)
+        opcodes = self.formula.opcodes
+        operands = self.formula.operands
+
+        # Variável local de cada nó na função gerada (x0, x1, ...): as variáveis ocupam as n primeiras
+        self.slots = [operands[2 * i] if opcode == CompactFormula.VAR else n + i
+                      for i, opcode in enumerate(opcodes)]
+        self.output_slots = list(range(n)) + [self.slots[i] for i in self.formula.outputs]
+
+        # Variáveis de que cada nó depende (bit j: variável j), em ordem topológica
+        dependencies = []
+        for i, opcode in enumerate(opcodes):
+            first = operands[2 * i]
+            if opcode == CompactFormula.VAR:
+                dependencies.append(1 << first)
+            elif opcode == CompactFormula.NOT:
+                dependencies.append(dependencies[first])
+            else:
+                dependencies.append(dependencies[first] | dependencies[operands[2 * i + 1]])
+
+        # Cone de influência de cada variável: operações que dependem dela, em ordem topológica
+        self.cones = [[i for i, opcode in enumerate(opcodes)
+                       if opcode != CompactFormula.VAR and (dependencies[i] >> j) & 1]
+                      for j in range(n)]
+        # O bit b do contador de Gray muda a cada 2^b passos: as variáveis com os
+        # menores cones ficam com os bits que mudam com mais frequência
+        self.flip_order = sorted(range(n), key=lambda j: len(self.cones[j]))
+        self.run = self._compile()
+
+    def _compile(self):
+        """
+        Gera a função que percorre todas as linhas em código de Gray.
+
+        Os valores dos nós são variáveis locais da função gerada; a cada passo, um
+        bloco if/elif escolhe a variável que muda e recalcula apenas o seu cone.
+
+        Returns:
+            function: Função que recebe a lista de linhas (com 2^n posições) e a
+            sequência de bits alterados (ruler_sequence) e grava em cada posição a
+            tupla de valores da linha correspondente
+        """
+        templates = FormulaCompiler.templates
+        operations = CompactFormula.OPERATIONS
+        operands = self.formula.operands
+        opcodes = self.formula.opcodes
+        slots = self.slots
+        n = len(self.variables)
+
+        def assignment(i):
+            args = [f"x{slots[operands[2 * i]]}"]
+            if opcodes[i] != CompactFormula.NOT:
+                args.append(f"x{slots[operands[2 * i + 1]]}")
+            return f"x{slots[i]} = {templates[operations[opcodes[i]]].format(*args)}"
+
+        outputs = ", ".join(f"x{slot}" for slot in self.output_slots)
+        lines = [f"def {self.FUNCTION_NAME}(rows, bits, one=1):"]
+        lines.extend(f"    x{j} = 0" for j in range(n))
+        lines.extend(f"    {assignment(i)}" for i, opcode in enumerate(opcodes) if opcode != CompactFormula.VAR)
+        lines.append(f"    rows[0] = ({outputs},)")
+        lines.append("    row = 0")
+        lines.append("    for bit in bits:")
+        for bit, j in enumerate(self.flip_order):
+            if bit == 0:
+                lines.append("        if bit == 0:")
+            elif bit < n - 1:
+                lines.append(f"        elif bit == {bit}:")
+            else:
+                lines.append("        else:")
+            # A variável j é o bit n - 1 - j do índice canônico da linha
+            lines.append(f"            x{j} ^= 1")
+            lines.append(f"            row ^= {1 << (n - 1 - j)}")
+            lines.extend(f"            {assignment(i)}" for i in self.cones[j])
+        lines.append(f"        rows[row] = ({outputs},)")
+
+        namespace = {}
+        exec(compile("\n".join(lines) + "\n", "<avaliação em código de Gray>", "exec"), namespace)
+        return namespace[self.FUNCTION_NAME]
+
+    @staticmethod
+    def ruler_sequence(num_bits):
+        """
+        Calcula o bit que muda em cada passo do código de Gray refletido.
+
+        No passo k (de 1 a 2^n - 1) muda o bit menos significativo ligado de k; a
+        sequência é construída por duplicação: S(b + 1) = S(b) + [b] + S(b).
+
+        Args:
+            num_bits (int): Número de bits do contador
+
+        Returns:
+            bytes: Bit alterado em cada um dos 2^n - 1 passos
+        """
+        sequence = b""
+        for bit in range(num_bits):
+            sequence = sequence + bytes((bit,)) + sequence
+        return sequence
+
+    def cone_sizes(self):
+        """
+        Retorna o tamanho do cone de influência de cada variável.
+
+        Returns:
+            dict: Número de operações recalculadas quando cada variável muda
+        """
+        return {var: len(cone) for var, cone in zip(self.variables, self.cones)}
+
+    def average_updates(self):
+        """
+        Calcula quantas operações são recalculadas, em média, por linha.
+
+        O bit b do contador muda em 1 de cada 2^(b + 1) passos, de modo que o
+        custo médio é a soma dos cones ponderada por essas frequências. A
+        avaliação completa de cada linha custaria o número total de operações.
+
+        Returns:
+            float: Número médio de operações recalculadas por linha
+        """
+        num_rows = 1 << len(self.variables)
+        total = sum(len(self.cones[j]) * (num_rows >> (bit + 1)) for bit, j in enumerate(self.flip_order))
+        return total / num_rows
+
+    def rows(self):
+        """
+        Avalia todas as linhas.
+
+        Returns:
+            list: Tupla de valores (variáveis seguidas das subfórmulas) de cada linha,
+            na ordem canônica das valorações
+        """
+        rows = [None] * (1 << len(self.variables))
+        self.run(rows, self.ruler_sequence(len(self.variables)))
+        return rows
@@ -0,0 +1,230 @@
+from Model.sat_solver import TseitinEncoder
+
+class ModelCounter:
+    """
+    Classe que conta os modelos de um conjunto de cláusulas (#SAT) por busca
+    DPLL com decomposição em componentes e cache de componentes.
+
+    A cada passo, os literais unitários são propagados e as cláusulas restantes
+    são separadas em componentes que não compartilham variáveis; o número de
+    modelos é o produto dos números de modelos dos componentes, e cada
+    componente já contado (identificado pelo conjunto de suas cláusulas) é
+    reaproveitado do cache. Um componente é dividido em dois pela variável que
+    aparece em mais cláusulas.
+
+    Para contar os modelos de uma fórmula, basta contar os da sua codificação
+    de Tseitin: as variáveis auxiliares são definidas por equivalências e,
+    portanto, cada valoração das variáveis originais que satisfaz a fórmula se
+    estende de uma única maneira. Escolher o valor de uma variável auxiliar
+    também é permitido, e costuma separar a fórmula em componentes (em uma
+    cadeia de ou-exclusivos, por exemplo, a variável do meio da cadeia).
+    """
+
+    # Número de componentes guardados no cache antes de ele ser esvaziado
+    CACHE_LIMIT = 1 << 18
+
+    def __init__(self, num_vars):
+        """
+        Inicializa o contador.
+
+        Args:
+            num_vars (int): Número de variáveis (numeradas a partir de 1); as que não
+                aparecem em nenhuma cláusula podem assumir os dois valores
+        """
+        self.num_vars = num_vars
+        self.cache = {}
+        self.cache_hits = 0
+        self.decisions = 0
+
+    @classmethod
+    def count_formula(cls, node, variables):
+        """
+        Conta os modelos de uma fórmula sobre as variáveis informadas.
+
+        Args:
+            node (tuple ou str): Nó da árvore de análise
+            variables (list): Lista de variáveis
+
+        Returns:
+            int: Número de valorações das variáveis que tornam a fórmula verdadeira
+        """
+        encoder = TseitinEncoder(variables)
+        root = encoder.encode(node)
+        return cls(encoder.num_vars).count(encoder.clauses + [[root]])
+
+    def count(self, clauses):
+        """
+        Conta os modelos de um conjunto de cláusulas.
+
+        A busca usa uma pilha explícita de tarefas: "solve" propaga um literal e
+        decompõe o resultado, "branch" divide um componente por uma variável,
+        "sum" soma os dois ramos (e guarda o componente no cache) e "multiply"
+        multiplica os componentes de uma decomposição.
+
+        Args:
+            clauses (list): Cláusulas no formato DIMACS (listas de inteiros não nulos)
+
+        Returns:
+            int: Número de valorações das variáveis que satisfazem as cláusulas
+        """
+        normalized = []
+        for clause in clauses:
+            literals = set(clause)
+            # Cláusulas tautológicas são sempre satisfeitas
+            if not any(-literal in literals for literal in literals):
+                normalized.append(tuple(sorted(literals)))
+
+        results = []
+        tasks = [("solve", normalized, range(1, self.num_vars + 1), None)]
+        while tasks:
+            task = tasks.pop()
+            kind = task[0]
+            if kind == "solve":
+                _, component, scope, literal = task
+                self._solve(component, scope, literal, tasks, results)
+            elif kind == "branch":
+                _, key, component = task
+                var, scope = self._pick_branch(component)
+                self.decisions += 1
+                tasks.append(("sum", key))
+                tasks.append(("solve", component, scope, var))
+                tasks.append(("solve", component, scope, -var))
+            elif kind == "sum":
+                total = results.pop() + results.pop()
+                if len(self.cache) >= self.CACHE_LIMIT:
+                    self.cache.clear()
+                self.cache[task[1]] = total
+                results.append(total)
+            else:
+                _, num_components, factor = task
+                for _ in range(num_components):
+                    factor *= results.pop()
+                results.append(factor)
+        return results[0]
+
+    def _solve(self, clauses, scope, literal, tasks, results):
+        """
+        Atribui um literal, propaga e decompõe as cláusulas restantes em componentes.
+
+        Args:
+            clauses (list): Cláusulas do subproblema
+            scope (iterable): Variáveis pelas quais o subproblema responde
+            literal (int ou None): Literal atribuído antes da propagação
+            tasks (list): Pilha de tarefas, que recebe as tarefas dos componentes
+            results (list): Pilha de resultados, que recebe a contagem quando ela
+                já é conhecida
+        """
+        propagated = self._propagate(clauses, literal)
+        if propagated is None:
+            results.append(0)
+            return
+        clauses, assigned = propagated
+
+        # Variáveis que sumiram das cláusulas sem serem atribuídas são livres
+        occurring = {abs(literal) for clause in clauses for literal in clause}
+        factor = 1 << sum(1 for var in scope if var not in assigned and var not in occurring)
+
+        pending = []
+        for component in self._components(clauses):
+            key = frozenset(component)
+            cached = self.cache.get(key)
+            if cached is None:
+                pending.append((key, component))
+                continue
+            self.cache_hits += 1
+            factor *= cached
+            if not factor:
+                results.append(0)
+                return
+        tasks.append(("multiply", len(pending), factor))
+        tasks.extend(("branch", key, component) for key, component in pending)
+
+    @staticmethod
+    def _propagate(clauses, literal=None):
+        """
+        Atribui um literal e propaga os literais unitários.
+
+        Args:
+            clauses (list): Cláusulas (tuplas de literais)
+            literal (int, opcional): Literal atribuído antes da propagação
+
+        Returns:
+            tuple ou None: (cláusulas restantes, sem as satisfeitas e sem os literais
+            falsos; conjunto das variáveis atribuídas), ou None em caso de conflito
+        """
+        pending = [clause[0] for clause in clauses if len(clause) == 1]
+        if literal is not None:
+            pending.append(literal)
+        true_literals = set()
+        while pending:
+            literal = pending.pop()
+            if literal in true_literals:
+                continue
+            if -literal in true_literals:
+                return None
+            true_literals.add(literal)
+            remaining = []
+            for clause in clauses:
+                if literal in clause:
+                    continue
+                if -literal in clause:
+                    clause = tuple(other for other in clause if other != -literal)
+                    if not clause:
+                        return None
+                    if len(clause) == 1:
+                        pending.append(clause[0])
+                remaining.append(clause)
+            clauses = remaining
+        return clauses, {abs(literal) for literal in true_literals}
+
+    @staticmethod
+    def _components(clauses):
+        """
+        Separa as cláusulas em componentes que não compartilham variáveis.
+
+        Args:
+            clauses (list): Cláusulas (tuplas de literais)
+
+        Returns:
+            list: Lista de componentes, cada um uma lista de cláusulas
+        """
+        parents = {}
+
+        def find(var):
+            root = var
+            while parents.setdefault(root, root) != root:
+                root = parents[root]
+            # Compressão de caminho
+            while parents[var] != root:
+                parents[var], var = root, parents[var]
+            return root
+
+        for clause in clauses:
+            first = find(abs(clause[0]))
+            for literal in clause[1:]:
+                other = find(abs(literal))
+                if other != first:
+                    parents[other] = first
+
+        components = {}
+        for clause in clauses:
+            components.setdefault(find(abs(clause[0])), []).append(clause)
+        return list(components.values())
+
+    @staticmethod
+    def _pick_branch(component):
+        """
+        Escolhe a variável que aparece em mais cláusulas de um componente.
+
+        Args:
+            component (list): Cláusulas do componente
+
+        Returns:
+            tuple: (variável escolhida, conjunto das variáveis do componente)
+        """
+        occurrences = {}
+        for clause in component:
+            for literal in clause:
+                var = abs(literal)
+                occurrences[var] = occurrences.get(var, 0) + 1
+        return max(occurrences, key=occurrences.get), set(occurrences)
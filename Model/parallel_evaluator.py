@@ -0,0 +1,131 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from Model.compact_formula import CompactFormula
+from Model.formula_compiler import FormulaCompiler
+from Model.truth_table import TruthTable
+
+# Funções já compiladas em cada processo, indexadas pela fórmula serializada
+_compiled_formulas = {}
+
+
+def _load_formula(formula_bytes):
+    """
+    Compila uma fórmula compacta serializada, reaproveitando compilações anteriores.
+
+    Args:
+        formula_bytes (bytes): Fórmula serializada por CompactFormula.to_bytes
+
+    Returns:
+        function: Função gerada por FormulaCompiler para as saídas da fórmula
+    """
+    formula = _compiled_formulas.get(formula_bytes)
+    if formula is None:
+        compact = CompactFormula.from_bytes(formula_bytes)
+        formula = _compiled_formulas[formula_bytes] = FormulaCompiler(compact.variables).compile_compact(compact)
+    return formula
+
+
+def _evaluate_block(formula_bytes, num_variables, start, num_rows, memory_name):
+    """
+    Avalia um bloco de linhas em um processo de trabalho.
+
+    As colunas do bloco são gravadas diretamente na memória compartilhada, em que
+    cada coluna completa ocupa 2^n / 8 bytes consecutivos (little-endian).
+
+    Args:
+        formula_bytes (bytes): Fórmula serializada por CompactFormula.to_bytes
+        num_variables (int): Número de variáveis da fórmula
+        start (int): Índice da primeira linha do bloco (múltiplo de 8)
+        num_rows (int): Número de linhas do bloco (múltiplo de 8)
+        memory_name (str): Nome do bloco de memória compartilhada
+    """
+    formula = _load_formula(formula_bytes)
+    masks = tuple(TruthTable.variable_mask(i, num_variables, start, num_rows)
+                  for i in range(num_variables))
+    bits = masks + formula(masks, (1 << num_rows) - 1)
+    num_bytes = num_rows // 8
+    column_bytes = (1 << num_variables) // 8
+    memory = shared_memory.SharedMemory(name=memory_name)
+    try:
+        for i, column in enumerate(bits):
+            offset = i * column_bytes + start // 8
+            memory.buf[offset:offset + num_bytes] = column.to_bytes(num_bytes, "little")
+    finally:
+        memory.close()
+
+
+class ParallelEvaluator:
+    """
+    Classe responsável por avaliar colunas empacotadas em vários processos.
+    O espaço de 2^n valorações é dividido pelos k bits mais significativos do
+    índice da linha (as k primeiras variáveis), cada parte é avaliada por um
+    processo que recebe a fórmula compacta serializada (bytes, sem árvores
+    serializadas com pickle) e a compila, e cada processo grava
+    seus bits empacotados na posição final de cada coluna em memória
+    compartilhada, sem serializar linhas.
+    """
+
+    # Menor número de linhas por parte: abaixo disso não compensa dividir
+    MIN_ROWS_PER_PART = 8
+
+    def __init__(self, workers):
+        """
+        Inicializa o avaliador paralelo.
+
+        Args:
+            workers (int): Número de processos de trabalho
+        """
+        self.workers = workers
+
+    def split_bits(self, num_variables):
+        """
+        Calcula quantos bits do topo do índice da linha definem as partes.
+
+        Args:
+            num_variables (int): Número de variáveis da fórmula
+
+        Returns:
+            int: Número k de bits; o espaço é dividido em 2^k partes iguais
+        """
+        k = max(self.workers - 1, 0).bit_length()
+        max_k = num_variables - (self.MIN_ROWS_PER_PART.bit_length() - 1)
+        return max(0, min(k, max_k))
+
+    def evaluate(self, formula_bytes, num_variables, num_columns):
+        """
+        Avalia todas as linhas de uma fórmula compacta.
+
+        Args:
+            formula_bytes (bytes): Fórmula serializada por CompactFormula.to_bytes
+            num_variables (int): Número de variáveis da fórmula
+            num_columns (int): Número de variáveis mais o número de saídas da fórmula
+
+        Returns:
+            list: Colunas empacotadas (int) das variáveis seguidas das colunas
+            das saídas da fórmula
+        """
+        k = self.split_bits(num_variables)
+        if k == 0:
+            # Tabela pequena demais para dividir: avalia no próprio processo
+            formula = _load_formula(formula_bytes)
+            masks = tuple(TruthTable.variable_mask(i, num_variables) for i in range(num_variables))
+            return list(masks + formula(masks, (1 << (1 << num_variables)) - 1))
+
+        part_rows = 1 << (num_variables - k)
+        starts = [part * part_rows for part in range(1 << k)]
+        column_bytes = (1 << num_variables) // 8
+        memory = shared_memory.SharedMemory(create=True, size=num_columns * column_bytes)
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(_evaluate_block, formula_bytes, num_variables, start,
+                                           part_rows, memory.name) for start in starts]
+                for future in futures:
+                    future.result()
+            buffer = memory.buf
+            columns = [int.from_bytes(buffer[i * column_bytes:(i + 1) * column_bytes], "little")
+                       for i in range(num_columns)]
+            del buffer
+            return columns
+        finally:
+            memory.close()
+            memory.unlink()
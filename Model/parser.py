@@ -1,5 +1,24 @@
 from Model.logical_operations import LogicalOperations
 
+
+class ParseError(ValueError):
+    """
+    Erro de sintaxe em uma expressão, com a posição do token em que foi encontrado.
+    """
+
+    def __init__(self, message, position):
+        """
+        Inicializa o erro.
+
+        Args:
+            message (str): Descrição do problema
+            position (int): Posição do token na lista de tokens (igual ao número de
+                tokens se o erro estiver no fim da expressão)
+        """
+        super().__init__(f"{message} (token {position})")
+        self.position = position
+
+
 class Parser:
     """
     Classe responsável por analisar e converter expressões lógicas tokenizadas
@@ -41,84 +60,182 @@ class Parser:
             LogicalOperations.eq_op: '↔',
             LogicalOperations.imp_op: '→'
         }
+        # Nós únicos da árvore (DAG), na ordem em que foram criados. Como os filhos
+        # são sempre criados antes dos pais, esta lista já está em ordem topológica.
+        self.nodes = []
+        # Identificador inteiro estável de cada nó, indexado pela identidade do nó
+        self.node_ids = {}
+        # Quantidade de nós da árvore original representada por cada nó único
+        self.tree_sizes = []
+        self._interned = {}
 
     def parse(self):
         """
         Analisa a expressão completa.
         
+        A análise usa pilhas explícitas (algoritmo shunting-yard) em vez de
+        recursão, de modo que o tempo e a memória são lineares no número de tokens
+        e a profundidade de aninhamento não é limitada pela pilha do Python. Todos
+        os operadores binários associam à esquerda e a negação se aplica apenas ao
+        operando seguinte.
+        
         Returns:
             tuple ou str: Árvore de análise representando a expressão
-        """
-        return self.parse_expression()
+            
+        Raises:
+            ParseError: Se houver um erro de sintaxe na expressão, com a posição do
+                token na lista de tokens
+        """
+        ops = self.ops
+        precedence = self.precedence
+        variables = set(self.variables)
+        operands = []
+        # Operadores pendentes e parênteses abertos, do mais antigo para o mais recente
+        operators = []
+        open_parentheses = 0
+        expect_operand = True
+        
+        # None marca o fim da expressão
+        tokens = self.tokens
+        num_tokens = len(tokens)
+        for self.pos in range(self.pos, num_tokens + 1):
+            token = tokens[self.pos] if self.pos < num_tokens else None
+            if expect_operand:
+                if token == '~' or token == '(':
+                    operators.append(token)
+                    open_parentheses += token == '('
+                elif token in variables:
+                    operands.append(self.intern(token))
+                    expect_operand = False
+                else:
+                    raise ParseError(f"Token incorreto: {token}", self.pos)
+            elif token in ops and token != '~':
+                # Reduz os operadores pendentes de precedência maior ou igual (associação à esquerda)
+                token_precedence = precedence[token]
+                while operators and operators[-1] != '(' and precedence[operators[-1]] >= token_precedence:
+                    self.reduce(operators.pop(), operands)
+                operators.append(token)
+                expect_operand = True
+            elif token == ')' and open_parentheses:
+                while operators[-1] != '(':
+                    self.reduce(operators.pop(), operands)
+                operators.pop()
+                open_parentheses -= 1
+            else:
+                # Fim da expressão, ou um token que não pode continuá-la
+                if open_parentheses:
+                    raise ParseError("Esperado parêntese de fechamento.", self.pos)
+                if token is not None:
+                    raise ParseError(f"Token inesperado: {token}", self.pos)
+                while operators:
+                    self.reduce(operators.pop(), operands)
+                return operands[0]
 
     def parse_expression(self):
         """
-        Analisa uma expressão completa.
+        Analisa uma expressão completa (mantido por compatibilidade; equivale a parse).
         
         Returns:
             tuple ou str: Árvore de análise representando a expressão
         """
-        return self.parse_binary(0)
+        return self.parse()
 
-    def parse_binary(self, min_precedence):
+    def reduce(self, op, operands):
         """
-        Analisa uma expressão binária com precedência mínima.
+        Aplica um operador aos operandos do topo da pilha de operandos.
         
         Args:
-            min_precedence (int): Precedência mínima para operadores
+            op (str): Token do operador
+            operands (list): Pilha de operandos; o resultado substitui os operandos usados
+        """
+        if op == '~':
+            operands.append(self.intern((LogicalOperations.not_op, operands.pop())))
+        else:
+            right = operands.pop()
+            left = operands.pop()
+            operands.append(self.intern((self.ops[op], left, right)))
+
+    def intern(self, node):
+        """
+        Devolve o nó único estruturalmente igual ao nó informado, criando-o se necessário.
+        
+        Nós iguais passam a ser o mesmo objeto, transformando a árvore em um DAG no
+        qual cada subexpressão compartilhada é representada (e avaliada) uma só vez.
+        
+        Args:
+            node (tuple ou str): Variável ou tupla (operação, filhos...) cujos filhos
+                já foram internados
             
         Returns:
-            tuple ou str: Árvore de análise representando a expressão binária
+            tuple ou str: O nó único equivalente
         """
-        left = self.parse_unary()
+        if isinstance(node, tuple):
+            node_ids = self.node_ids
+            child_ids = [node_ids[id(arg)] for arg in node[1:]]
+            key = (node[0], *child_ids)
+        else:
+            key = node
         
-        while (self.current() in self.ops and 
-               self.current() != '~' and 
-               self.precedence[self.current()] >= min_precedence):
-            op = self.current()
-            op_precedence = self.precedence[op]
-            self.advance()
-            right = self.parse_binary(op_precedence + 1)
-            left = (self.ops[op], left, right)
+        existing = self._interned.get(key)
+        if existing is not None:
+            return existing
         
-        return left
+        if isinstance(node, tuple):
+            tree_sizes = self.tree_sizes
+            size = 1
+            for child_id in child_ids:
+                size += tree_sizes[child_id]
+        else:
+            size = 1
+        
+        self._interned[key] = node
+        self.node_ids[id(node)] = len(self.nodes)
+        self.nodes.append(node)
+        self.tree_sizes.append(size)
+        return node
 
-    def parse_unary(self):
+    def node_id(self, node):
         """
-        Analisa uma expressão unária (negação).
+        Retorna o identificador inteiro estável de um nó internado.
         
+        Args:
+            node (tuple ou str): Nó produzido por este parser
+            
         Returns:
-            tuple ou str: Árvore de análise representando a expressão unária
+            int: Posição do nó na lista de nós únicos (ordem topológica)
         """
-        if self.current() == '~':
-            self.advance()
-            operand = self.parse_unary()
-            return (LogicalOperations.not_op, operand)
-        return self.parse_primary()
+        return self.node_ids[id(node)]
 
-    def parse_primary(self):
+    def shared_node_count(self, root):
         """
-        Analisa uma expressão primária (variável ou expressão entre parênteses).
+        Calcula quantos nós o compartilhamento de subexpressões removeu.
         
+        Args:
+            root (tuple ou str): Raiz da árvore de análise produzida por este parser
+            
         Returns:
-            tuple ou str: Árvore de análise representando a expressão primária
+            int: Diferença entre o número de nós da árvore e o número de nós únicos do DAG
+        """
+        return self.tree_sizes[self.node_id(root)] - len(self.topological_order(root))
+
+    def topological_order(self, root):
+        """
+        Retorna os nós únicos alcançáveis a partir de uma raiz, filhos antes dos pais.
+        
+        Args:
+            root (tuple ou str): Raiz da árvore de análise produzida por este parser
             
-        Raises:
-            ValueError: Se houver um erro de sintaxe na expressão
-        """
-        if self.current() == '(':
-            self.advance()
-            expr = self.parse_expression()
-            if self.current() != ')':
-                raise ValueError("Esperado parêntese de fechamento.")
-            self.advance()
-            return expr
-        elif self.current() in self.variables:
-            var = self.current()
-            self.advance()
-            return var
-        else:
-            raise ValueError(f"Token incorreto: {self.current()}")
+        Returns:
+            list: Nós únicos em ordem topológica
+        """
+        reachable = {self.node_id(root)}
+        # Percorre os nós do mais novo para o mais antigo: pais sempre vêm depois dos filhos
+        for index in range(self.node_id(root), -1, -1):
+            if index in reachable:
+                node = self.nodes[index]
+                if isinstance(node, tuple):
+                    reachable.update(self.node_ids[id(arg)] for arg in node[1:])
+        return [self.nodes[index] for index in sorted(reachable)]
 
     def current(self):
         """
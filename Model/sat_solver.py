@@ -0,0 +1,460 @@
+import heapq
+from Model.logical_operations import LogicalOperations
+
+class SatSolver:
+    """
+    Classe que implementa um resolvedor SAT CDCL (Conflict-Driven Clause Learning)
+    em Python puro, com literais vigiados, heurística VSIDS, salvamento de fase e
+    reinícios segundo a sequência de Luby.
+
+    As cláusulas são informadas no formato DIMACS: listas de inteiros não nulos,
+    em que v representa a variável v e -v a sua negação (variáveis a partir de 1).
+    Internamente, o literal v é codificado como 2v e o literal -v como 2v + 1.
+    """
+
+    RESTART_UNIT = 100
+    ACTIVITY_DECAY = 0.95
+
+    def __init__(self, num_vars=0):
+        """
+        Inicializa o resolvedor.
+
+        Args:
+            num_vars (int, opcional): Número de variáveis já conhecidas
+        """
+        self.num_vars = 0
+        self.clauses = []
+        self.watches = [[], []]
+        self.lit_values = [-1, -1]
+        self.levels = [0]
+        self.reasons = [None]
+        self.activity = [0.0]
+        self.phases = [False]
+        self.heap = []
+        self.activity_inc = 1.0
+        self.trail = []
+        self.trail_limits = []
+        self.queue_head = 0
+        self.unsatisfiable = False
+        self.model = None
+        self.conflicts = 0
+        self.ensure_vars(num_vars)
+
+    def ensure_vars(self, num_vars):
+        """
+        Garante que as variáveis de 1 até num_vars existam.
+
+        Args:
+            num_vars (int): Maior variável que será usada
+        """
+        while self.num_vars < num_vars:
+            self.num_vars += 1
+            self.watches.extend(([], []))
+            self.lit_values.extend((-1, -1))
+            self.levels.append(0)
+            self.reasons.append(None)
+            self.activity.append(0.0)
+            self.phases.append(False)
+            heapq.heappush(self.heap, (0.0, self.num_vars))
+
+    @staticmethod
+    def _encode(literal):
+        """
+        Converte um literal DIMACS para a codificação interna.
+        """
+        return 2 * literal if literal > 0 else -2 * literal + 1
+
+    def add_clause(self, literals):
+        """
+        Adiciona uma cláusula ao problema (no nível de decisão 0).
+
+        Args:
+            literals (list): Literais DIMACS da cláusula
+
+        Returns:
+            bool: False se o problema se tornou trivialmente insatisfatível
+        """
+        if self.unsatisfiable:
+            return False
+        self._backtrack(0)
+        self.ensure_vars(max((abs(lit) for lit in literals), default=0))
+
+        clause = []
+        for code in {self._encode(lit) for lit in literals}:
+            value = self.lit_values[code]
+            if value == 1 or code ^ 1 in clause:
+                # Cláusula já satisfeita ou tautológica
+                return True
+            if value == -1:
+                clause.append(code)
+
+        if not clause:
+            self.unsatisfiable = True
+            return False
+        if len(clause) == 1:
+            self._enqueue(clause[0], None)
+            if self._propagate() is not None:
+                self.unsatisfiable = True
+                return False
+            return True
+
+        self._attach(clause)
+        return True
+
+    def _attach(self, clause):
+        """
+        Registra uma cláusula e vigia seus dois primeiros literais.
+        """
+        index = len(self.clauses)
+        self.clauses.append(clause)
+        self.watches[clause[0]].append(index)
+        self.watches[clause[1]].append(index)
+        return index
+
+    def _enqueue(self, code, reason):
+        """
+        Atribui verdadeiro a um literal no nível de decisão atual.
+        """
+        var = code >> 1
+        self.lit_values[code] = 1
+        self.lit_values[code ^ 1] = 0
+        self.levels[var] = len(self.trail_limits)
+        self.reasons[var] = reason
+        self.trail.append(code)
+
+    def _propagate(self):
+        """
+        Propaga as atribuições pendentes usando os literais vigiados.
+
+        Returns:
+            int ou None: Índice da cláusula em conflito, ou None se não houver conflito
+        """
+        lit_values = self.lit_values
+        clauses = self.clauses
+        watches = self.watches
+        trail = self.trail
+
+        while self.queue_head < len(trail):
+            false_lit = trail[self.queue_head] ^ 1
+            self.queue_head += 1
+            watching = watches[false_lit]
+            kept = []
+            for position, index in enumerate(watching):
+                clause = clauses[index]
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], false_lit
+                first = clause[0]
+                if lit_values[first] == 1:
+                    kept.append(index)
+                    continue
+
+                # Procura outro literal não falso para vigiar
+                for k in range(2, len(clause)):
+                    candidate = clause[k]
+                    if lit_values[candidate] != 0:
+                        clause[1], clause[k] = candidate, false_lit
+                        watches[candidate].append(index)
+                        break
+                else:
+                    kept.append(index)
+                    if lit_values[first] == 0:
+                        kept.extend(watching[position + 1:])
+                        watches[false_lit] = kept
+                        return index
+                    self._enqueue(first, index)
+            watches[false_lit] = kept
+        return None
+
+    def _bump(self, var):
+        """
+        Aumenta a atividade VSIDS de uma variável.
+        """
+        self.activity[var] += self.activity_inc
+        if self.activity[var] > 1e100:
+            # Reescala todas as atividades para evitar estouro
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.activity_inc *= 1e-100
+            self.heap = [(-self.activity[v], v) for v in range(1, self.num_vars + 1)
+                         if self.lit_values[2 * v] == -1]
+            heapq.heapify(self.heap)
+        elif self.lit_values[2 * var] == -1:
+            heapq.heappush(self.heap, (-self.activity[var], var))
+
+    def _analyze(self, conflict):
+        """
+        Analisa um conflito e aprende uma cláusula pelo primeiro ponto de implicação único.
+
+        Args:
+            conflict (int): Índice da cláusula em conflito
+
+        Returns:
+            tuple: (cláusula aprendida, nível para o qual retroceder)
+        """
+        seen = set()
+        learnt = [None]
+        current_level = len(self.trail_limits)
+        pending = 0
+        code = None
+        index = len(self.trail) - 1
+        reason = conflict
+
+        while True:
+            clause = self.clauses[reason]
+            for q in (clause if code is None else clause[1:]):
+                var = q >> 1
+                if var not in seen and self.levels[var] > 0:
+                    seen.add(var)
+                    self._bump(var)
+                    if self.levels[var] >= current_level:
+                        pending += 1
+                    else:
+                        learnt.append(q)
+            # Próximo literal marcado na trilha
+            while (self.trail[index] >> 1) not in seen:
+                index -= 1
+            code = self.trail[index]
+            index -= 1
+            reason = self.reasons[code >> 1]
+            seen.discard(code >> 1)
+            pending -= 1
+            if pending == 0:
+                break
+
+        learnt[0] = code ^ 1
+        if len(learnt) == 1:
+            return learnt, 0
+
+        # O literal de maior nível (depois do UIP) é vigiado na segunda posição
+        best = max(range(1, len(learnt)), key=lambda i: self.levels[learnt[i] >> 1])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, self.levels[learnt[1] >> 1]
+
+    def _backtrack(self, level):
+        """
+        Desfaz as atribuições acima de um nível de decisão.
+        """
+        if len(self.trail_limits) <= level:
+            return
+        limit = self.trail_limits[level]
+        for code in self.trail[limit:]:
+            var = code >> 1
+            self.phases[var] = not (code & 1)
+            self.lit_values[code] = -1
+            self.lit_values[code ^ 1] = -1
+            self.reasons[var] = None
+            heapq.heappush(self.heap, (-self.activity[var], var))
+        del self.trail[limit:]
+        del self.trail_limits[level:]
+        self.queue_head = limit
+
+    def _pick_branch(self):
+        """
+        Escolhe a variável livre de maior atividade.
+
+        Returns:
+            int ou None: Literal de decisão (com a fase salva) ou None se todas estiverem atribuídas
+        """
+        while self.heap:
+            negative_activity, var = heapq.heappop(self.heap)
+            if self.lit_values[2 * var] == -1 and -negative_activity == self.activity[var]:
+                return 2 * var + (0 if self.phases[var] else 1)
+        return None
+
+    @staticmethod
+    def luby(index):
+        """
+        Calcula o i-ésimo termo (a partir de 0) da sequência de Luby: 1, 1, 2, 1, 1, 2, 4, ...
+
+        Args:
+            index (int): Posição na sequência
+
+        Returns:
+            int: Termo da sequência
+        """
+        size, power = 1, 0
+        while size < index + 1:
+            power += 1
+            size = 2 * size + 1
+        while size - 1 != index:
+            size = (size - 1) >> 1
+            power -= 1
+            index %= size
+        return 1 << power
+
+    def solve(self):
+        """
+        Decide se o conjunto de cláusulas é satisfatível.
+
+        Returns:
+            bool: True se for satisfatível (o modelo fica em self.model), False caso contrário
+        """
+        self.model = None
+        if self.unsatisfiable:
+            return False
+
+        restarts = 0
+        restart_limit = self.luby(restarts) * self.RESTART_UNIT
+        conflicts_since_restart = 0
+
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                conflicts_since_restart += 1
+                if not self.trail_limits:
+                    self.unsatisfiable = True
+                    return False
+
+                learnt, level = self._analyze(conflict)
+                self._backtrack(level)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    self._enqueue(learnt[0], self._attach(learnt))
+                self.activity_inc /= self.ACTIVITY_DECAY
+                continue
+
+            if conflicts_since_restart >= restart_limit:
+                restarts += 1
+                restart_limit = self.luby(restarts) * self.RESTART_UNIT
+                conflicts_since_restart = 0
+                self._backtrack(0)
+                continue
+
+            code = self._pick_branch()
+            if code is None:
+                self.model = {var: self.lit_values[2 * var] == 1
+                              for var in range(1, self.num_vars + 1)}
+                return True
+            self.trail_limits.append(len(self.trail))
+            self._enqueue(code, None)
+
+
+class TseitinEncoder:
+    """
+    Classe responsável por converter a árvore de análise do Parser em CNF pela
+    transformação de Tseitin: cada operação recebe uma variável auxiliar
+    equivalente ao seu resultado, e a negação é representada pelo literal oposto.
+    """
+
+    def __init__(self, variables):
+        """
+        Inicializa o codificador.
+
+        Args:
+            variables (list): Lista de variáveis; a variável na posição i recebe o número i + 1
+        """
+        self.variables = variables
+        self.var_numbers = {var: i + 1 for i, var in enumerate(variables)}
+        self.num_vars = len(variables)
+        self.clauses = []
+
+    def _new_var(self):
+        """
+        Cria uma variável auxiliar.
+        """
+        self.num_vars += 1
+        return self.num_vars
+
+    def encode(self, node):
+        """
+        Codifica um nó e todos os seus descendentes.
+
+        Args:
+            node (tuple ou str): Nó da árvore de análise
+
+        Returns:
+            int: Literal DIMACS equivalente ao valor do nó
+
+        Raises:
+            ValueError: Se algum nó for de um tipo desconhecido
+        """
+        literals = {}
+        # Percurso em pós-ordem com pilha explícita
+        stack = [(node, False)]
+        while stack:
+            current, expanded = stack.pop()
+            key = id(current)
+            if key in literals:
+                continue
+            if isinstance(current, str):
+                literals[key] = self.var_numbers[current]
+            elif not isinstance(current, tuple):
+                raise ValueError(f"Nó incorreto: {current}")
+            elif not expanded:
+                stack.append((current, True))
+                stack.extend((arg, False) for arg in current[1:] if id(arg) not in literals)
+            else:
+                literals[key] = self._encode_operation(current[0], [literals[id(arg)] for arg in current[1:]])
+        return literals[id(node)]
+
+    def _encode_operation(self, op, args):
+        """
+        Gera as cláusulas de uma operação e devolve o literal do seu resultado.
+        """
+        if op == LogicalOperations.not_op:
+            return -args[0]
+
+        a, b = args
+        c = self._new_var()
+        if op == LogicalOperations.and_op:
+            self.clauses.extend(([-c, a], [-c, b], [c, -a, -b]))
+        elif op == LogicalOperations.or_op:
+            self.clauses.extend(([c, -a], [c, -b], [-c, a, b]))
+        elif op == LogicalOperations.imp_op:
+            self.clauses.extend(([c, a], [c, -b], [-c, -a, b]))
+        elif op in (LogicalOperations.xor_op, LogicalOperations.eq_op):
+            self.clauses.extend(([-c, a, b], [-c, -a, -b], [c, -a, b], [c, a, -b]))
+            if op == LogicalOperations.eq_op:
+                return -c
+        else:
+            raise ValueError(f"Operação desconhecida: {op}")
+        return c
+
+    def find_assignment(self, node, value=True):
+        """
+        Procura uma valoração das variáveis que dê o valor informado ao nó.
+
+        Args:
+            node (tuple ou str): Nó da árvore de análise
+            value (bool, opcional): Valor desejado para o nó
+
+        Returns:
+            dict ou None: Dicionário {variável: 0 ou 1} com a valoração encontrada,
+            ou None se nenhuma valoração der esse valor ao nó
+        """
+        root = self.encode(node)
+        solver = SatSolver(self.num_vars)
+        for clause in self.clauses:
+            solver.add_clause(clause)
+        solver.add_clause([root if value else -root])
+        if not solver.solve():
+            return None
+        return {var: int(solver.model[number]) for var, number in self.var_numbers.items()}
+
+    def iter_assignments(self, node, value=True):
+        """
+        Enumera, sob demanda, as valorações das variáveis que dão o valor informado ao nó.
+
+        A cada valoração encontrada, uma cláusula que a proíbe (sobre as variáveis
+        originais) é acrescentada e o resolvedor é chamado de novo, aproveitando as
+        cláusulas aprendidas nas buscas anteriores.
+
+        Args:
+            node (tuple ou str): Nó da árvore de análise
+            value (bool, opcional): Valor desejado para o nó
+
+        Yields:
+            dict: Dicionário {variável: 0 ou 1} com cada valoração, sem repetições
+        """
+        root = self.encode(node)
+        solver = SatSolver(self.num_vars)
+        for clause in self.clauses:
+            solver.add_clause(clause)
+        solver.add_clause([root if value else -root])
+        while solver.solve():
+            assignment = {var: int(solver.model[number]) for var, number in self.var_numbers.items()}
+            yield assignment
+            if not solver.add_clause([-number if assignment[var] else number
+                                      for var, number in self.var_numbers.items()]):
+                return
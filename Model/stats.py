@@ -0,0 +1,250 @@
+import json
+import os
+import threading
+import time
+
+
+class StageTimer:
+    """
+    Classe que mede uma etapa, usada como gerenciador de contexto (with).
+    """
+
+    __slots__ = ("stats", "name", "start")
+
+    def __init__(self, stats, name):
+        """
+        Inicializa a medição.
+
+        Args:
+            stats (Stats): Estatísticas que recebem o tempo da etapa
+            name (str): Nome da etapa
+        """
+        self.stats = stats
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stats.add_time(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class NullStageTimer:
+    """
+    Classe de um gerenciador de contexto que não mede nada (usada pelas
+    estatísticas desativadas).
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_STAGE_TIMER = NullStageTimer()
+
+
+class Stats:
+    """
+    Classe que acumula o tempo de parede de cada etapa do processamento (análise
+    léxica, análise sintática, subfórmulas, avaliação, montagem da tabela,
+    exibição...) e contadores (linhas, avaliações de nós, acertos de cache,
+    bytes alocados).
+
+    As etapas são medidas com "with stats.stage(nome):" e os contadores com
+    stats.count(nome, quantidade). Uma etapa repetida (por exemplo, a avaliação
+    de cada bloco de linhas) acumula o tempo e o número de chamadas.
+
+    Opcionalmente, cada etapa concluída é repassada a um gancho trace(nome,
+    início, fim), com os instantes em nanossegundos de time.perf_counter_ns,
+    por exemplo um ChromeTraceExporter ou um adaptador para um profiler externo.
+
+    Quando a medição não é desejada, usa-se Stats.DISABLED, cujos métodos não
+    fazem nada: o código medido não precisa testar se a medição está ativa.
+    """
+
+    enabled = True
+
+    def __init__(self, trace=None):
+        """
+        Inicializa as estatísticas vazias.
+
+        Args:
+            trace (callable, opcional): Gancho chamado ao fim de cada etapa com
+                (nome, início, fim) em nanossegundos
+        """
+        self.trace = trace
+        # Etapa -> [nanossegundos acumulados, chamadas], na ordem da primeira medição
+        self.stages = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def stage(self, name):
+        """
+        Mede uma etapa.
+
+        Args:
+            name (str): Nome da etapa
+
+        Returns:
+            StageTimer: Gerenciador de contexto que mede o bloco with
+        """
+        return StageTimer(self, name)
+
+    def add_time(self, name, start, end):
+        """
+        Acumula o tempo de uma etapa e o repassa ao gancho.
+
+        Args:
+            name (str): Nome da etapa
+            start (int): Início, em nanossegundos (time.perf_counter_ns)
+            end (int): Fim, em nanossegundos
+        """
+        with self._lock:
+            totals = self.stages.get(name)
+            if totals is None:
+                self.stages[name] = [end - start, 1]
+            else:
+                totals[0] += end - start
+                totals[1] += 1
+        if self.trace is not None:
+            self.trace(name, start, end)
+
+    def count(self, name, amount=1):
+        """
+        Incrementa um contador.
+
+        Args:
+            name (str): Nome do contador
+            amount (int, opcional): Valor somado
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def as_dict(self):
+        """
+        Retorna as estatísticas em uma estrutura serializável (JSON).
+
+        Returns:
+            dict: {"stages": {etapa: {"ms": tempo, "calls": chamadas}}, "counters": {...}}
+        """
+        with self._lock:
+            return {
+                "stages": {name: {"ms": total / 1e6, "calls": calls}
+                           for name, (total, calls) in self.stages.items()},
+                "counters": dict(self.counters),
+            }
+
+    def merge(self, data):
+        """
+        Soma às estatísticas as de outra medição (por exemplo, de outro processo).
+
+        Args:
+            data (dict): Estatísticas no formato de as_dict
+        """
+        with self._lock:
+            for name, stage in data["stages"].items():
+                totals = self.stages.setdefault(name, [0, 0])
+                totals[0] += round(stage["ms"] * 1e6)
+                totals[1] += stage["calls"]
+            for name, amount in data["counters"].items():
+                self.counters[name] = self.counters.get(name, 0) + amount
+
+    def summary(self):
+        """
+        Resume as estatísticas em uma linha de texto.
+
+        Returns:
+            str: Tempo de cada etapa seguido dos contadores, por exemplo
+            "lex 0.1 ms, parse 0.2 ms | rows=16, node_evaluations=64"
+        """
+        data = self.as_dict()
+        stages = ", ".join(f"{name} {stage['ms']:.1f} ms" for name, stage in data["stages"].items())
+        counters = ", ".join(f"{name}={amount}" for name, amount in data["counters"].items())
+        return " | ".join(part for part in (stages, counters) if part)
+
+
+class DisabledStats(Stats):
+    """
+    Estatísticas desativadas: todas as medições são descartadas sem custo
+    além de uma chamada de método.
+    """
+
+    enabled = False
+
+    def stage(self, name):
+        """
+        Devolve um gerenciador de contexto que não mede nada.
+
+        Args:
+            name (str): Nome da etapa (ignorado)
+
+        Returns:
+            NullStageTimer: Gerenciador de contexto vazio, compartilhado
+        """
+        return NULL_STAGE_TIMER
+
+    def add_time(self, name, start, end):
+        """
+        Descarta o tempo de uma etapa.
+        """
+
+    def count(self, name, amount=1):
+        """
+        Descarta um incremento de contador.
+        """
+
+    def merge(self, data):
+        """
+        Descarta as estatísticas de outra medição.
+        """
+
+
+Stats.DISABLED = DisabledStats()
+
+
+class ChromeTraceExporter:
+    """
+    Classe que registra as etapas medidas como eventos no formato Chrome Trace
+    (JSON), que pode ser aberto em chrome://tracing ou no Perfetto. Deve ser
+    passada como gancho trace de Stats.
+    """
+
+    def __init__(self):
+        """
+        Inicializa o exportador sem eventos.
+        """
+        self.events = []
+        self._lock = threading.Lock()
+
+    def __call__(self, name, start, end):
+        """
+        Registra uma etapa concluída como um evento completo ("ph": "X").
+
+        Args:
+            name (str): Nome da etapa
+            start (int): Início, em nanossegundos (time.perf_counter_ns)
+            end (int): Fim, em nanossegundos
+        """
+        event = {"name": name, "ph": "X", "ts": start / 1000, "dur": (end - start) / 1000,
+                 "pid": os.getpid(), "tid": threading.get_ident()}
+        with self._lock:
+            self.events.append(event)
+
+    def write(self, file_path):
+        """
+        Grava os eventos registrados em um arquivo.
+
+        Args:
+            file_path (str): Caminho do arquivo JSON
+        """
+        with self._lock:
+            events = list(self.events)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
@@ -0,0 +1,371 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+from collections.abc import Mapping
+from Model.truth_table import TruthTable
+
+
+class MappedColumns(Mapping):
+    """
+    Classe que expõe as colunas de um arquivo mapeado em memória como um
+    dicionário de colunas empacotadas. Cada coluna só é convertida em inteiro
+    quando acessada inteira pela primeira vez; abrir o arquivo não copia nenhum
+    dado, e os recortes de linhas (slice_bits) leem apenas os bytes do recorte.
+    """
+
+    def __init__(self, memory, columns, offset, column_bytes, stride=None):
+        """
+        Inicializa o mapeamento.
+
+        Args:
+            memory (mmap.mmap): Arquivo mapeado em memória
+            columns (list): Nomes das colunas, na ordem em que aparecem no arquivo
+            offset (int): Posição do início da primeira coluna
+            column_bytes (int): Número de bytes de dados de cada coluna
+            stride (int, opcional): Distância entre o início de colunas consecutivas
+                (dados e preenchimento); por padrão, column_bytes
+        """
+        if stride is None:
+            stride = column_bytes
+        self.memory = memory
+        self.positions = {name: offset + i * stride for i, name in enumerate(columns)}
+        self.column_bytes = column_bytes
+        self._decoded = {}
+
+    def __getitem__(self, name):
+        bits = self._decoded.get(name)
+        if bits is None:
+            position = self.positions[name]
+            with memoryview(self.memory) as view:
+                bits = int.from_bytes(view[position:position + self.column_bytes], "little")
+            self._decoded[name] = bits
+        return bits
+
+    def slice_bits(self, name, offset, size):
+        """
+        Lê um recorte de uma coluna diretamente do arquivo mapeado.
+
+        Args:
+            name (str): Nome da coluna
+            offset (int): Posição da primeira linha do recorte na coluna
+            size (int): Número de linhas do recorte
+
+        Returns:
+            int: Recorte empacotado, em que o bit j é a linha offset + j da coluna
+        """
+        bits = self._decoded.get(name)
+        if bits is not None:
+            return (bits >> offset) & ((1 << size) - 1)
+        position = self.positions[name]
+        first_byte = offset >> 3
+        last_byte = min((offset + size + 7) >> 3, self.column_bytes)
+        with memoryview(self.memory) as view:
+            chunk = int.from_bytes(view[position + first_byte:position + last_byte], "little")
+        return (chunk >> (offset & 7)) & ((1 << size) - 1)
+
+    def __iter__(self):
+        return iter(self.positions)
+
+    def __len__(self):
+        return len(self.positions)
+
+
+class TableStore:
+    """
+    Classe que implementa um cache persistente de tabelas verdade em disco.
+
+    Cada tabela é gravada em um arquivo cujo nome é o hash da forma canônica da
+    fórmula e da ordem das variáveis. O arquivo tem um cabeçalho pequeno seguido
+    das colunas empacotadas (1 bit por linha, little-endian; cada coluna começa
+    em uma posição múltipla de 8 bytes) e é reaberto com mmap, de modo que carregar uma tabela grande não lê
+    nem copia as colunas.
+
+    A gravação usa um arquivo temporário e os.replace, que é atômico: processos
+    gravando a mesma tabela ao mesmo tempo nunca deixam um arquivo pela metade.
+    Quando o diretório ultrapassa o limite de tamanho, os arquivos usados há
+    mais tempo (data de modificação, atualizada a cada leitura) são removidos.
+    """
+
+    MAGIC = b"TVTB"
+    # Versão 2: subfórmulas em ordem topológica; versão 3: colunas alinhadas em 8 bytes
+    VERSION = 3
+    # Assinatura, versão, tamanho dos metadados, primeira linha e número de linhas
+    HEADER = struct.Struct("<4sHxxIQQ")
+    EXTENSION = ".tvt"
+    # Temporários mais antigos que isso foram deixados por processos interrompidos
+    STALE_TEMP_SECONDS = 3600
+    # Variáveis de ambiente que ativam o cache da interface gráfica (from_environment)
+    DIRECTORY_VARIABLE = "TABELA_VERDADE_CACHE"
+    MAX_MB_VARIABLE = "TABELA_VERDADE_CACHE_MB"
+
+    def __init__(self, directory=None, max_bytes=1024 * 1024 * 1024, min_rows=1 << 16):
+        """
+        Inicializa o cache em disco.
+
+        Args:
+            directory (str, opcional): Diretório do cache; por padrão, o da variável de
+                ambiente TABELA_VERDADE_CACHE ou ~/.cache/tabela-verdade
+            max_bytes (int, opcional): Tamanho máximo do diretório
+            min_rows (int, opcional): Menor tabela gravada; tabelas menores são mais
+                rápidas de gerar do que de ler do disco
+        """
+        if directory is None:
+            directory = os.environ.get(self.DIRECTORY_VARIABLE) or os.path.join(
+                os.path.expanduser("~"), ".cache", "tabela-verdade")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.min_rows = min_rows
+        self.hits = 0
+        self.misses = 0
+        # Estimativa do tamanho do diretório; None até a primeira varredura
+        self._estimated_bytes = None
+
+    @classmethod
+    def from_environment(cls, environ=None):
+        """
+        Cria o cache configurado pelas variáveis de ambiente, se houver.
+
+        O cache em disco da interface gráfica é opcional: ele só é usado quando
+        TABELA_VERDADE_CACHE indica o diretório; TABELA_VERDADE_CACHE_MB define o
+        tamanho máximo em MB (padrão: 1024).
+
+        Args:
+            environ (dict, opcional): Variáveis de ambiente; por padrão, os.environ
+
+        Returns:
+            TableStore ou None: O cache, ou None se TABELA_VERDADE_CACHE não estiver definida
+
+        Raises:
+            ValueError: Se TABELA_VERDADE_CACHE_MB não for um número inteiro
+        """
+        if environ is None:
+            environ = os.environ
+        directory = environ.get(cls.DIRECTORY_VARIABLE)
+        if not directory:
+            return None
+        max_mb = environ.get(cls.MAX_MB_VARIABLE, "1024")
+        try:
+            max_bytes = int(max_mb) * 1024 * 1024
+        except ValueError:
+            raise ValueError(f"{cls.MAX_MB_VARIABLE} inválida: {max_mb}") from None
+        return cls(directory, max_bytes)
+
+    @staticmethod
+    def table_key(canonical_formula, variables):
+        """
+        Calcula a chave de uma tabela.
+
+        Args:
+            canonical_formula (str): Forma canônica da fórmula (FormulaCache.canonical_key)
+            variables (list): Lista de variáveis, na ordem das colunas
+
+        Returns:
+            str: Hash SHA-256 em hexadecimal
+        """
+        content = "\0".join([canonical_formula] + list(variables))
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def path(self, key):
+        """
+        Retorna o caminho do arquivo de uma chave.
+
+        Args:
+            key (str): Chave calculada por table_key
+
+        Returns:
+            str: Caminho do arquivo
+        """
+        return os.path.join(self.directory, key + self.EXTENSION)
+
+    def load(self, key):
+        """
+        Abre uma tabela do cache.
+
+        Args:
+            key (str): Chave calculada por table_key
+
+        Returns:
+            tuple ou None: (TruthTable, classificação), ou None se a tabela não estiver
+            no cache ou o arquivo for inválido
+        """
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                memory = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        loaded = self._read(memory)
+        if loaded is None:
+            memory.close()
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        try:
+            # Marca o arquivo como usado recentemente
+            os.utime(path)
+        except OSError:
+            pass
+        return loaded
+
+    def _read(self, memory):
+        """
+        Interpreta o cabeçalho de um arquivo mapeado e monta a tabela.
+
+        Args:
+            memory (mmap.mmap): Arquivo mapeado em memória
+
+        Returns:
+            tuple ou None: (TruthTable, classificação), ou None se o arquivo for inválido
+        """
+        if len(memory) < self.HEADER.size:
+            return None
+        magic, version, metadata_size, start, num_rows = self.HEADER.unpack_from(memory)
+        if magic != self.MAGIC or version != self.VERSION:
+            return None
+        try:
+            metadata = json.loads(memory[self.HEADER.size:self.HEADER.size + metadata_size])
+            columns = metadata["columns"]
+            variables = metadata["variables"]
+            classification = metadata["classification"]
+            offset = self._data_offset(metadata_size)
+            column_bytes = (num_rows + 7) // 8
+            if len(memory) != offset + len(columns) * self._column_stride(num_rows):
+                return None
+            column_map = MappedColumns(memory, columns, offset, column_bytes, self._column_stride(num_rows))
+        except (ValueError, KeyError, TypeError):
+            # Metadados ilegíveis ou com a estrutura errada
+            return None
+        table = TruthTable.from_column_map(variables, columns, column_map, start, num_rows)
+        return table, classification
+
+    def _data_offset(self, metadata_size):
+        """
+        Calcula a posição da primeira coluna, alinhada em 8 bytes.
+
+        Args:
+            metadata_size (int): Tamanho dos metadados em bytes
+
+        Returns:
+            int: Posição da primeira coluna no arquivo
+        """
+        return (self.HEADER.size + metadata_size + 7) // 8 * 8
+
+    @staticmethod
+    def _column_stride(num_rows):
+        """
+        Calcula o espaço ocupado por coluna, com preenchimento até um múltiplo de 8 bytes.
+
+        Args:
+            num_rows (int): Número de linhas da tabela
+
+        Returns:
+            int: Distância, em bytes, entre o início de colunas consecutivas
+        """
+        return (num_rows + 63) // 64 * 8
+
+    def store(self, key, table, classification):
+        """
+        Grava uma tabela no cache, se ela for grande o bastante.
+
+        Args:
+            key (str): Chave calculada por table_key
+            table (TruthTable): Tabela verdade completa
+            classification (str): Classificação da fórmula
+
+        Returns:
+            bool: True se a tabela foi gravada
+        """
+        if table.num_rows < self.min_rows:
+            return False
+        metadata = json.dumps({"variables": table.variables, "columns": table.columns,
+                               "classification": classification}, ensure_ascii=False).encode("utf-8")
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, len(metadata), table.start, table.num_rows)
+        padding = bytes(self._data_offset(len(metadata)) - len(header) - len(metadata))
+        column_padding = bytes(self._column_stride(table.num_rows) - (table.num_rows + 7) // 8)
+
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                f.write(header + metadata + padding)
+                for name in table.columns:
+                    f.write(table.column_bytes(name))
+                    f.write(column_padding)
+            os.replace(temp_path, self.path(key))
+        except OSError:
+            # Outro processo pode estar usando o arquivo (no Windows); a tabela não é gravada
+            self._remove(temp_path)
+            return False
+
+        if self._estimated_bytes is not None:
+            self._estimated_bytes += os.path.getsize(self.path(key))
+        if self._estimated_bytes is None or self._estimated_bytes > self.max_bytes:
+            self.evict(keep=self.path(key))
+        return True
+
+    def evict(self, keep=None):
+        """
+        Remove os arquivos usados há mais tempo até o diretório caber no limite,
+        além de temporários abandonados.
+
+        Args:
+            keep (str, opcional): Arquivo que nunca é removido (a tabela recém-gravada)
+
+        Returns:
+            int: Número de arquivos removidos
+        """
+        files = []
+        removed = 0
+        now = time.time()
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            entries = []
+        for entry in entries:
+            try:
+                info = entry.stat()
+            except OSError:
+                continue
+            if entry.name.endswith(".tmp"):
+                if now - info.st_mtime > self.STALE_TEMP_SECONDS:
+                    removed += self._remove(entry.path)
+            elif entry.name.endswith(self.EXTENSION) and entry.path != keep:
+                files.append((info.st_mtime, info.st_size, entry.path))
+
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        if keep is not None and os.path.exists(keep):
+            total += os.path.getsize(keep)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                removed += 1
+                total -= size
+        self._estimated_bytes = total
+        return removed
+
+    @staticmethod
+    def _remove(path):
+        """
+        Remove um arquivo, ignorando erros (ele pode já ter sido removido ou estar em uso).
+
+        Args:
+            path (str): Caminho do arquivo
+
+        Returns:
+            bool: True se o arquivo foi removido
+        """
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
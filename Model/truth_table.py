@@ -0,0 +1,365 @@
+class TruthTable:
+    """
+    Classe que representa uma tabela verdade de forma compacta.
+    Cada coluna é guardada como um inteiro Python de 2^n bits, em que o bit r
+    corresponde ao valor da coluna na linha r (1 bit por célula). As linhas seguem
+    a ordem de itertools.product([0, 1], repeat=n): a primeira variável é o bit
+    mais significativo do índice da linha.
+
+    Uma tabela também pode representar apenas um bloco contíguo de linhas
+    (start, num_rows), como os produzidos por TruthTableGenerator.iter_truth_table.
+    Os índices de linha aceitos e devolvidos pelos métodos são sempre absolutos.
+    """
+
+    def __init__(self, variables, columns, bits, start=0, num_rows=None):
+        """
+        Inicializa a tabela verdade.
+
+        Args:
+            variables (list): Lista de variáveis da tabela
+            columns (list): Nomes de todas as colunas (variáveis seguidas das subfórmulas)
+            bits (list): Coluna empacotada (int) correspondente a cada nome em columns
+            start (int, opcional): Índice da primeira linha representada
+            num_rows (int, opcional): Número de linhas representadas; por padrão, 2^n - start
+        """
+        self.variables = variables
+        self.columns = columns
+        self.start = start
+        self.num_rows = (1 << len(variables)) - start if num_rows is None else num_rows
+        self.full_mask = (1 << self.num_rows) - 1
+        self._bits = dict(zip(columns, bits))
+
+    @classmethod
+    def from_column_map(cls, variables, columns, column_map, start=0, num_rows=None):
+        """
+        Cria uma tabela cujas colunas são lidas de um mapeamento já existente,
+        sem copiá-las. Permite, por exemplo, decodificar as colunas de um arquivo
+        apenas quando forem acessadas. Se o mapeamento tiver um método
+        slice_bits(nome, posição, tamanho), os recortes de linhas (column_slice,
+        value, iter_rows) são lidos por ele, sem decodificar a coluna inteira.
+
+        Args:
+            variables (list): Lista de variáveis da tabela
+            columns (list): Nomes de todas as colunas (variáveis seguidas das subfórmulas)
+            column_map (Mapping): Coluna empacotada (int) de cada nome em columns
+            start (int, opcional): Índice da primeira linha representada
+            num_rows (int, opcional): Número de linhas representadas; por padrão, 2^n - start
+
+        Returns:
+            TruthTable: Tabela que consulta column_map a cada acesso
+        """
+        table = cls(variables, columns, [], start, num_rows)
+        table._bits = column_map
+        return table
+
+    @staticmethod
+    def variable_mask(index, num_variables, start=0, num_rows=None):
+        """
+        Constrói a coluna empacotada de uma variável.
+
+        Args:
+            index (int): Posição da variável na lista de variáveis
+            num_variables (int): Quantidade total de variáveis
+            start (int, opcional): Índice da primeira linha da coluna
+            num_rows (int, opcional): Número de linhas da coluna; por padrão, 2^n - start
+
+        Returns:
+            int: Coluna com o bit j ligado quando a variável é verdadeira na linha start + j
+        """
+        if num_rows is None:
+            num_rows = (1 << num_variables) - start
+        shift = num_variables - 1 - index
+        half = 1 << shift
+        period = half * 2
+
+        if period <= num_rows:
+            # Um período: "half" linhas falsas seguidas de "half" linhas verdadeiras
+            mask = ((1 << half) - 1) << half
+            width = period
+            # Replica o período dobrando o tamanho até cobrir o deslocamento e o bloco
+            phase = start % period
+            while width < num_rows + phase:
+                mask |= mask << width
+                width *= 2
+            return (mask >> phase) & ((1 << num_rows) - 1)
+
+        # Períodos maiores que o bloco: no máximo duas sequências de valores iguais
+        mask = 0
+        row = start
+        stop = start + num_rows
+        while row < stop:
+            run_stop = min(stop, ((row >> shift) + 1) << shift)
+            if (row >> shift) & 1:
+                mask |= ((1 << (run_stop - row)) - 1) << (row - start)
+            row = run_stop
+        return mask
+
+    @classmethod
+    def variable_masks(cls, variables, start=0, num_rows=None):
+        """
+        Constrói as colunas empacotadas de todas as variáveis.
+
+        Args:
+            variables (list): Lista de variáveis
+            start (int, opcional): Índice da primeira linha das colunas
+            num_rows (int, opcional): Número de linhas das colunas; por padrão, 2^n - start
+
+        Returns:
+            tuple: Coluna empacotada de cada variável, na ordem da lista
+        """
+        return tuple(cls.variable_mask(i, len(variables), start, num_rows)
+                     for i in range(len(variables)))
+
+    @classmethod
+    def concat(cls, tables):
+        """
+        Junta blocos consecutivos de uma mesma tabela em uma única tabela.
+
+        Args:
+            tables (list): Blocos (TruthTable) com as mesmas colunas, em ordem de linhas
+                e sem lacunas entre eles
+
+        Returns:
+            TruthTable: Tabela com todas as linhas dos blocos
+
+        Raises:
+            ValueError: Se a lista estiver vazia ou os blocos não forem consecutivos
+        """
+        if not tables:
+            raise ValueError("Nenhum bloco para juntar.")
+        first = tables[0]
+        row = first.start
+        for table in tables:
+            if table.start != row or table.columns != first.columns:
+                raise ValueError(f"Bloco fora de ordem na linha {table.start}")
+            row += table.num_rows
+
+        if all(table.num_rows % 8 == 0 for table in tables[:-1]):
+            # Blocos alinhados em bytes: concatena os bytes de cada coluna
+            bits = [int.from_bytes(b"".join(table._bits[name].to_bytes((table.num_rows + 7) // 8, "little")
+                                            for table in tables), "little")
+                    for name in first.columns]
+        else:
+            bits = [sum(table._bits[name] << (table.start - first.start) for table in tables)
+                    for name in first.columns]
+        return cls(first.variables, first.columns, bits, start=first.start, num_rows=row - first.start)
+
+    @staticmethod
+    def row_assignment(row, variables):
+        """
+        Retorna a valoração das variáveis correspondente a uma linha.
+
+        Args:
+            row (int): Índice absoluto da linha
+            variables (list): Lista de variáveis
+
+        Returns:
+            dict: Dicionário mapeando cada variável para seu valor (0 ou 1)
+        """
+        n = len(variables)
+        return {var: (row >> (n - 1 - i)) & 1 for i, var in enumerate(variables)}
+
+    def __len__(self):
+        """
+        Retorna o número de linhas da tabela.
+
+        Returns:
+            int: Número de linhas representadas
+        """
+        return self.num_rows
+
+    def column(self, name):
+        """
+        Retorna a coluna empacotada com o nome informado.
+
+        Args:
+            name (str): Nome da coluna
+
+        Returns:
+            int: Coluna empacotada
+
+        Raises:
+            KeyError: Se a coluna não existir
+        """
+        return self._bits[name]
+
+    def column_slice(self, name, offset, size):
+        """
+        Retorna um recorte de uma coluna empacotada.
+
+        Args:
+            name (str): Nome da coluna
+            offset (int): Posição da primeira linha do recorte, relativa ao início da tabela
+            size (int): Número de linhas do recorte
+
+        Returns:
+            int: Recorte empacotado, em que o bit j é a linha start + offset + j
+        """
+        slice_bits = getattr(self._bits, "slice_bits", None)
+        if slice_bits is not None:
+            return slice_bits(name, offset, size)
+        return (self._bits[name] >> offset) & ((1 << size) - 1)
+
+    def column_bytes(self, name):
+        """
+        Retorna a coluna empacotada como bytes little-endian (bit j é a linha start + j).
+
+        Args:
+            name (str): Nome da coluna
+
+        Returns:
+            bytes: ceil(num_rows / 8) bytes da coluna
+        """
+        return self.column(name).to_bytes((self.num_rows + 7) // 8, "little")
+
+    def __getitem__(self, name):
+        """
+        Permite acessar uma coluna empacotada com a sintaxe table[nome].
+        """
+        return self.column(name)
+
+    def count_true(self, name):
+        """
+        Conta as linhas em que a coluna é verdadeira.
+
+        Args:
+            name (str): Nome da coluna
+
+        Returns:
+            int: Número de linhas verdadeiras
+        """
+        return self.column(name).bit_count()
+
+    def is_all_true(self, name):
+        """
+        Verifica se a coluna é verdadeira em todas as linhas.
+
+        Args:
+            name (str): Nome da coluna
+
+        Returns:
+            bool: True se todas as linhas forem verdadeiras
+        """
+        return self.column(name) == self.full_mask
+
+    def is_all_false(self, name):
+        """
+        Verifica se a coluna é falsa em todas as linhas.
+
+        Args:
+            name (str): Nome da coluna
+
+        Returns:
+            bool: True se todas as linhas forem falsas
+        """
+        return self.column(name) == 0
+
+    def columns_equal(self, first, second):
+        """
+        Verifica se duas colunas têm o mesmo valor em todas as linhas.
+
+        Args:
+            first (str): Nome da primeira coluna
+            second (str): Nome da segunda coluna
+
+        Returns:
+            bool: True se as colunas forem iguais
+        """
+        return self.column(first) == self.column(second)
+
+    def equals(self, other):
+        """
+        Verifica se duas tabelas têm as mesmas colunas com os mesmos valores.
+
+        Args:
+            other (TruthTable): Tabela a ser comparada
+
+        Returns:
+            bool: True se as tabelas forem iguais
+        """
+        return (self.variables == other.variables and self.columns == other.columns
+                and self.start == other.start and self.num_rows == other.num_rows
+                and all(self._bits[c] == other._bits[c] for c in self.columns))
+
+    def true_rows(self, name):
+        """
+        Percorre os índices das linhas em que a coluna é verdadeira.
+
+        Args:
+            name (str): Nome da coluna
+
+        Yields:
+            int: Índice de cada linha verdadeira, em ordem crescente
+        """
+        bits = self.column(name)
+        while bits:
+            low = bits & -bits
+            yield self.start + low.bit_length() - 1
+            bits ^= low
+
+    def value(self, row, name):
+        """
+        Retorna o valor de uma célula.
+
+        Args:
+            row (int): Índice da linha
+            name (str): Nome da coluna
+
+        Returns:
+            int: 1 se a célula for verdadeira, 0 caso contrário
+        """
+        return self.column_slice(name, row - self.start, 1)
+
+    def iter_rows(self, start=None, stop=None, block_rows=4096):
+        """
+        Percorre as linhas da tabela como listas de 0/1.
+
+        As colunas são recortadas em blocos (column_slice) para que cada linha
+        custe apenas operações sobre inteiros pequenos; em uma tabela aberta do
+        cache em disco, só os blocos percorridos são lidos do arquivo.
+
+        Args:
+            start (int, opcional): Primeira linha; por padrão, o início da tabela
+            stop (int, opcional): Linha final (exclusiva); por padrão, o fim da tabela
+            block_rows (int, opcional): Número de linhas recortadas de cada vez
+
+        Yields:
+            list: Valores (0 ou 1) de cada coluna na linha
+        """
+        start = 0 if start is None else max(start - self.start, 0)
+        stop = self.num_rows if stop is None else min(stop - self.start, self.num_rows)
+        for block_start in range(start, stop, block_rows):
+            size = min(block_rows, stop - block_start)
+            block = [self.column_slice(name, block_start, size) for name in self.columns]
+            for offset in range(size):
+                yield [(bits >> offset) & 1 for bits in block]
+
+    @property
+    def nbytes(self):
+        """
+        Retorna a memória ocupada pelos dados das colunas.
+
+        Returns:
+            int: Número de bytes das colunas empacotadas
+        """
+        return len(self.columns) * ((self.num_rows + 7) // 8)
+
+    def to_dataframe(self):
+        """
+        Converte a tabela em um DataFrame com uma coluna int64 por coluna da tabela.
+
+        Returns:
+            pandas.DataFrame: Tabela verdade no formato de generate_truth_table, indexada
+            pelo índice absoluto de cada linha
+        """
+        # Importação tardia: a tabela empacotada não depende do pandas
+        import numpy as np
+        import pandas as pd
+
+        num_bytes = (self.num_rows + 7) // 8
+        data = np.empty((self.num_rows, len(self.columns)), dtype=np.int64)
+        for i, name in enumerate(self.columns):
+            raw = np.frombuffer(self._bits[name].to_bytes(num_bytes, "little"), dtype=np.uint8)
+            data[:, i] = np.unpackbits(raw, bitorder="little")[:self.num_rows]
+        index = pd.RangeIndex(self.start, self.start + self.num_rows)
+        return pd.DataFrame(data, columns=self.columns, index=index)
@@ -1,11 +1,33 @@
-import pandas as pd
-from itertools import product
+from itertools import islice, product
+from Model.formula_compiler import FormulaCompiler
+from Model.compact_formula import CompactFormula
+from Model.gray_code_evaluator import GrayCodeEvaluator
+from Model.stats import Stats
+from Model.truth_table import TruthTable
 
 class TruthTableGenerator:
     """
     Classe responsável por gerar tabelas verdade para expressões lógicas.
     """
     
+    # Mecanismos de avaliação aceitos por generate_truth_table
+    ENGINES = ("python", "numpy", "gray")
+    
+    # Acima deste número de variáveis, classify usa o BDD ou o resolvedor SAT em vez de enumerar
+    MAX_ENUMERATION_VARIABLES = 20
+    
+    # Limite de nós dos BDDs construídos por count_models e iter_models
+    MAX_BDD_NODES = 1 << 16
+    
+    # Limite de nós do BDD construído por classify: o resolvedor SAT costuma decidir
+    # em poucos milissegundos, e o BDD só compensa quando é pequeno (paridades, por exemplo)
+    MAX_CLASSIFY_BDD_NODES = 1 << 12
+    
+    # Mensagens de classificação das FBFs
+    TAUTOLOGY = "Tautologia: A fórmula é sempre verdadeira para qualquer valoração das variáveis."
+    CONTRADICTION = "Contradição: A fórmula é sempre falsa para qualquer valoração das variáveis."
+    CONTINGENCY = "Contingência: A fórmula pode ser verdadeira ou falsa, dependendo da valoração das variáveis."
+    
     def __init__(self, formula_handler):
         """
         Inicializa o gerador de tabela verdade.
@@ -29,31 +51,69 @@ class TruthTableGenerator:
         Raises:
             ValueError: Se o nó for de um tipo desconhecido
         """
-        if isinstance(node, tuple):
-            op = node[0]
-            args = [self.evaluate(arg, variables) for arg in node[1:]]
-            return op(*args)
-        elif isinstance(node, str):
-            return variables[node]
-        else:
-            raise ValueError(f"Nó incorreto: {node}")
+        # Percurso em pós-ordem com pilha explícita; cada nó único do DAG é avaliado uma vez
+        values = {}
+        stack = [node]
+        while stack:
+            current = stack[-1]
+            key = id(current)
+            if key in values:
+                stack.pop()
+            elif isinstance(current, tuple):
+                pending = [arg for arg in current[1:] if id(arg) not in values]
+                if pending:
+                    stack.extend(reversed(pending))
+                else:
+                    stack.pop()
+                    values[key] = current[0](*[values[id(arg)] for arg in current[1:]])
+            elif isinstance(current, str):
+                stack.pop()
+                values[key] = variables[current]
+            else:
+                raise ValueError(f"Nó incorreto: {current}")
+        return values[id(node)]
 
-    def generate_truth_table(self, expression, variables):
+    def generate_truth_table(self, expression, variables, engine="python", workers=None, stats=None):
         """
         Gera uma tabela verdade para uma expressão lógica.
         
         Args:
             expression (tuple ou str): Expressão lógica analisada
             variables (list): Lista de variáveis na expressão
+            engine (str, opcional): Mecanismo de avaliação: "python" avalia linha a linha
+                uma função compilada a partir das subfórmulas, "numpy" avalia cada nó
+                uma única vez sobre a coluna inteira e "gray" percorre as linhas em
+                código de Gray, recalculando apenas o cone da variável que mudou
+            workers (int, opcional): Número de processos; com mais de um, a tabela é
+                gerada em paralelo por generate_packed_table e convertida em DataFrame
+            stats (Stats, opcional): Estatísticas que recebem o tempo das etapas
+                (subformulas, compile, evaluate, dataframe) e os contadores rows,
+                node_evaluations e bytes_allocated
             
         Returns:
             pandas.DataFrame: Tabela verdade com todas as combinações de valores e resultados
+            
+        Raises:
+            ValueError: Se o mecanismo de avaliação for desconhecido
         """
-        # Obter todas as subfórmulas
-        subformulas = self.formula_handler.get_subformulas(expression)
+        if engine not in self.ENGINES:
+            raise ValueError(f"Mecanismo de avaliação desconhecido: {engine}")
         
-        # Ordenar subfórmulas por complexidade (comprimento da string)
-        sorted_subformulas = sorted(subformulas, key=lambda x: len(x[0]))
+        if stats is None:
+            stats = Stats.DISABLED
+        
+        if workers is not None and workers > 1:
+            table = self.generate_packed_table(expression, variables, workers=workers, stats=stats)
+            with stats.stage("dataframe"):
+                data_frame = table.to_dataframe()
+            self._count_dataframe(stats, data_frame)
+            return data_frame
+
+        # Obter todas as subfórmulas, ordenadas por complexidade
+        with stats.stage("subformulas"):
+            sorted_subformulas = self.sorted_subformulas(expression)
+        num_rows = 1 << len(variables)
+        stats.count("rows", num_rows)
         
         # Preparar colunas para a tabela
         columns = variables.copy()
@@ -64,42 +124,435 @@ class TruthTableGenerator:
             columns.append(subformula_str)
             subformula_nodes[subformula_str] = subformula_node
         
-        # Gerar todas as combinações de valores verdade
-        rows = []
-        for values in product([0, 1], repeat=len(variables)):
-            # Criar dicionário de valores para as variáveis
-            local_vars = {var: bool(val) for var, val in zip(variables, values)}
+        if engine == "numpy":
+            # Importação tardia: o caminho puro em Python não depende do NumPy nem do pandas
+            import pandas as pd
+            from Model.vectorized_evaluator import VectorizedEvaluator
+            with stats.stage("evaluate"):
+                evaluator = VectorizedEvaluator(variables)
+                data = evaluator.evaluate_subformulas([node for _, node in sorted_subformulas])
+            stats.count("node_evaluations", len(sorted_subformulas) * num_rows)
+            with stats.stage("dataframe"):
+                data_frame = pd.DataFrame(data, columns=columns)
+            self._count_dataframe(stats, data_frame)
+            return data_frame
+        
+        # Importação tardia: o pandas só é necessário para montar o DataFrame
+        import pandas as pd
+        
+        if engine == "gray":
+            with stats.stage("compile"):
+                evaluator = GrayCodeEvaluator(variables, [node for _, node in sorted_subformulas])
+            with stats.stage("evaluate"):
+                rows = evaluator.rows()
+            # Apenas o cone da variável alterada é recalculado a cada linha
+            stats.count("node_evaluations", round(evaluator.average_updates() * num_rows))
+        else:
+            # Compilar todas as subfórmulas em uma única função avaliada a cada linha
+            with stats.stage("compile"):
+                compiler = FormulaCompiler(variables)
+                formula = compiler.compile([node for _, node in sorted_subformulas])
+            
+            # Gerar todas as combinações de valores verdade
+            with stats.stage("evaluate"):
+                rows = [values + formula(values) for values in product((0, 1), repeat=len(variables))]
+            stats.count("node_evaluations", len(sorted_subformulas) * num_rows)
+        
+        # Criar DataFrame
+        with stats.stage("dataframe"):
+            data_frame = pd.DataFrame(rows, columns=columns)
+        self._count_dataframe(stats, data_frame)
+        return data_frame
+
+    @staticmethod
+    def _count_dataframe(stats, data_frame):
+        """
+        Contabiliza a memória ocupada por um DataFrame gerado.
+        
+        Args:
+            stats (Stats): Estatísticas que recebem o contador bytes_allocated
+            data_frame (pandas.DataFrame): Tabela verdade gerada
+        """
+        if stats.enabled:
+            stats.count("bytes_allocated", int(data_frame.memory_usage(index=True, deep=False).sum()))
+
+    def generate_packed_table(self, expression, variables, workers=None, stats=None):
+        """
+        Gera uma tabela verdade empacotada, com 1 bit por célula.
+        
+        Cada nó é avaliado uma única vez com operações bit a bit sobre as colunas
+        inteiras, representadas como inteiros Python de 2^n bits.
+        
+        Args:
+            expression (tuple ou str): Expressão lógica analisada
+            variables (list): Lista de variáveis na expressão
+            workers (int, opcional): Número de processos; com mais de um, o espaço de
+                valorações é dividido pelas primeiras variáveis e avaliado em paralelo
+            stats (Stats, opcional): Estatísticas que recebem o tempo das etapas e os
+                contadores, como em iter_truth_table
+            
+        Returns:
+            TruthTable: Tabela verdade com as mesmas colunas de generate_truth_table
+        """
+        if stats is None:
+            stats = Stats.DISABLED
+        
+        if workers is not None and workers > 1:
+            # Importação tardia: o paralelismo só é necessário para tabelas grandes
+            from Model.parallel_evaluator import ParallelEvaluator
+            with stats.stage("subformulas"):
+                sorted_subformulas = self.sorted_subformulas(expression)
+            columns = variables + [subformula_str for subformula_str, _ in sorted_subformulas]
+            # Os processos recebem a fórmula compacta serializada
+            with stats.stage("compile"):
+                formula = CompactFormula.from_tree([node for _, node in sorted_subformulas], variables)
+            with stats.stage("evaluate"):
+                bits = ParallelEvaluator(workers).evaluate(formula.to_bytes(), len(variables), len(columns))
+            table = TruthTable(variables, columns, bits)
+            stats.count("rows", table.num_rows)
+            stats.count("node_evaluations", len(sorted_subformulas) * table.num_rows)
+            stats.count("bytes_allocated", table.nbytes)
+            return table
+        
+        return next(self.iter_truth_table(expression, variables, chunk_rows=1 << len(variables), stats=stats))
+
+    def sorted_subformulas(self, expression):
+        """
+        Obtém as subfórmulas de uma expressão na ordem das colunas da tabela verdade.
+        
+        Args:
+            expression (tuple ou str): Expressão lógica analisada
             
-            # Iniciar a linha com os valores das variáveis
-            row = list(values)
+        Returns:
+            list: Tuplas (string_da_subfórmula, nó_da_subfórmula) em ordem topológica:
+            cada subfórmula depois das que a compõem e a expressão inteira por último
+        """
+        return self.formula_handler.get_subformulas(expression)
+
+    def iter_truth_table(self, expression, variables, chunk_rows=65536, start=0, stop=None,
+                         subformulas=None, stats=None):
+        """
+        Gera a tabela verdade em blocos de linhas consecutivas, na ordem das valorações.
+        
+        Apenas um bloco existe em memória por vez, de modo que a tabela pode ser
+        classificada, contada, filtrada ou gravada em disco com memória constante.
+        O intervalo [start, stop) permite retomar ou dividir a geração.
+        
+        Args:
+            expression (tuple ou str): Expressão lógica analisada
+            variables (list): Lista de variáveis na expressão
+            chunk_rows (int, opcional): Número de linhas de cada bloco
+            start (int, opcional): Índice da primeira linha gerada
+            stop (int, opcional): Índice final (exclusivo); por padrão, 2^n
+            subformulas (list, opcional): Resultado de sorted_subformulas já calculado
+            stats (Stats, opcional): Estatísticas que recebem o tempo das etapas
+                (subformulas, compile e evaluate, esta uma vez por bloco) e os
+                contadores rows, node_evaluations e bytes_allocated
             
-            # Avaliar cada subfórmula
-            for subformula_str, subformula_node in sorted_subformulas:
-                result = self.evaluate(subformula_node, local_vars)
-                row.append(int(result))
+        Yields:
+            TruthTable: Bloco empacotado com as colunas de generate_truth_table
             
-            rows.append(row)
+        Raises:
+            ValueError: Se o intervalo de linhas ou o tamanho do bloco forem inválidos
+        """
+        if stats is None:
+            stats = Stats.DISABLED
         
-        # Criar DataFrame
-        return pd.DataFrame(rows, columns=columns)
+        if subformulas is None:
+            with stats.stage("subformulas"):
+                subformulas = self.sorted_subformulas(expression)
+        
+        formula = CompactFormula.from_tree([node for _, node in subformulas], variables)
+        yield from self.iter_compact_table(formula, [subformula_str for subformula_str, _ in subformulas],
+                                           chunk_rows, start, stop, stats)
+
+    @staticmethod
+    def iter_compact_table(formula, subformula_texts, chunk_rows=65536, start=0, stop=None, stats=None):
+        """
+        Gera a tabela verdade de uma fórmula compacta em blocos, como iter_truth_table.
+        
+        A fórmula é compilada diretamente a partir dos arrays da forma compacta,
+        sem árvore de análise.
+        
+        Args:
+            formula (CompactFormula): Fórmula cujas saídas são as colunas das subfórmulas
+            subformula_texts (list): Nome da coluna de cada saída da fórmula
+            chunk_rows (int, opcional): Número de linhas de cada bloco
+            start (int, opcional): Índice da primeira linha gerada
+            stop (int, opcional): Índice final (exclusivo); por padrão, 2^n
+            stats (Stats, opcional): Estatísticas que recebem o tempo das etapas
+                compile e evaluate e os contadores rows, node_evaluations e bytes_allocated
+            
+        Yields:
+            TruthTable: Bloco empacotado com as variáveis seguidas das subfórmulas
+            
+        Raises:
+            ValueError: Se o intervalo de linhas ou o tamanho do bloco forem inválidos
+        """
+        variables = formula.variables
+        total_rows = 1 << len(variables)
+        if stop is None:
+            stop = total_rows
+        if not 0 <= start <= stop <= total_rows:
+            raise ValueError(f"Intervalo de linhas inválido: [{start}, {stop}) para {total_rows} linhas")
+        if chunk_rows <= 0:
+            raise ValueError(f"Tamanho de bloco inválido: {chunk_rows}")
+        
+        if stats is None:
+            stats = Stats.DISABLED
+        columns = variables + list(subformula_texts)
+        
+        with stats.stage("compile"):
+            function = FormulaCompiler(variables).compile_compact(formula)
+        
+        num_outputs = len(formula.outputs)
+        for chunk_start in range(start, stop, chunk_rows):
+            size = min(chunk_rows, stop - chunk_start)
+            with stats.stage("evaluate"):
+                masks = TruthTable.variable_masks(variables, chunk_start, size)
+                bits = masks + function(masks, (1 << size) - 1)
+                chunk = TruthTable(variables, columns, bits, start=chunk_start, num_rows=size)
+            stats.count("rows", size)
+            stats.count("node_evaluations", num_outputs * size)
+            if stats.enabled:
+                stats.count("bytes_allocated", chunk.nbytes)
+            yield chunk
 
-    def classify_fbf(self, table, final_column):
+    @classmethod
+    def classify_fbf(cls, table, final_column):
         """
         Classifica uma Fórmula Bem Formada (FBF) com base em sua tabela verdade.
         
         Args:
-            table (pandas.DataFrame): Tabela verdade da fórmula
+            table (pandas.DataFrame ou TruthTable): Tabela verdade da fórmula
             final_column (str): Nome da coluna que contém os resultados finais da fórmula
             
         Returns:
             str: Classificação da fórmula (Tautologia, Contradição ou Contingência)
         """
-        all_true = all(table[final_column] == 1)
-        all_false = all(table[final_column] == 0)
+        if isinstance(table, TruthTable):
+            all_true = table.is_all_true(final_column)
+            all_false = table.is_all_false(final_column)
+        else:
+            all_true = all(table[final_column] == 1)
+            all_false = all(table[final_column] == 0)
         
         if all_true:
-            return "Tautologia: A fórmula é sempre verdadeira para qualquer valoração das variáveis."
+            return cls.TAUTOLOGY
         elif all_false:
-            return "Contradição: A fórmula é sempre falsa para qualquer valoração das variáveis."
+            return cls.CONTRADICTION
+        else:
+            return cls.CONTINGENCY
+
+    def classify(self, expression, variables, max_chunk_rows=65536, stats=None):
+        """
+        Classifica uma FBF avaliando apenas a fórmula principal, sem montar a tabela.
+        
+        As valorações são avaliadas em blocos empacotados que dobram de tamanho
+        (1, 2, 4, ... linhas), e a busca termina assim que houver uma linha verdadeira
+        e uma falsa. Nenhuma coluna de subfórmula é alocada. Com mais de
+        MAX_ENUMERATION_VARIABLES variáveis, é construído o BDD da fórmula (na
+        ordem de aparição das variáveis), em que a classificação é imediata: a
+        fórmula é tautologia ou contradição se a aresta for uma das constantes, e
+        as testemunhas saem de um caminho qualquer até o terminal. Se o BDD
+        ultrapassar MAX_CLASSIFY_BDD_NODES nós, a fórmula e sua negação são
+        decididas pelo resolvedor SAT.
+        
+        Args:
+            expression (tuple ou str): Expressão lógica analisada
+            variables (list): Lista de variáveis na expressão
+            max_chunk_rows (int, opcional): Tamanho máximo de cada bloco de linhas
+            stats (Stats, opcional): Estatísticas que recebem o tempo da etapa classify
+                e os contadores rows e node_evaluations das linhas enumeradas
+            
+        Returns:
+            tuple: (classificação, valoração verdadeira, valoração falsa), em que cada
+            valoração é um dicionário {variável: 0 ou 1} que testemunha o valor, ou None
+            se não existir
+        """
+        if stats is None:
+            stats = Stats.DISABLED
+        
+        with stats.stage("classify"):
+            if len(variables) > self.MAX_ENUMERATION_VARIABLES:
+                true_assignment, false_assignment = self._decide(expression, variables)
+                return self._classification(true_assignment, false_assignment), true_assignment, false_assignment
+        
+            compact = CompactFormula.from_tree([expression], variables)
+            formula = FormulaCompiler(variables).compile_compact(compact)
+            total_rows = 1 << len(variables)
+            num_operations = len(compact) - compact.opcodes.count(CompactFormula.VAR)
+        
+            true_row = None
+            false_row = None
+            chunk_start = 0
+            size = 1
+            while chunk_start < total_rows and (true_row is None or false_row is None):
+                size = min(size, total_rows - chunk_start)
+                full_mask = (1 << size) - 1
+                masks = TruthTable.variable_masks(variables, chunk_start, size)
+                (bits,) = formula(masks, full_mask)
+                stats.count("rows", size)
+                stats.count("node_evaluations", num_operations * size)
+        
+                if true_row is None and bits:
+                    true_row = chunk_start + (bits & -bits).bit_length() - 1
+                false_bits = full_mask ^ bits
+                if false_row is None and false_bits:
+                    false_row = chunk_start + (false_bits & -false_bits).bit_length() - 1
+        
+                chunk_start += size
+                size = min(size * 2, max_chunk_rows)
+        
+            true_assignment = None if true_row is None else TruthTable.row_assignment(true_row, variables)
+            false_assignment = None if false_row is None else TruthTable.row_assignment(false_row, variables)
+            return self._classification(true_assignment, false_assignment), true_assignment, false_assignment
+
+    def _decide(self, expression, variables):
+        """
+        Procura valorações que tornam a fórmula verdadeira e falsa sem enumerar as linhas.
+        
+        Args:
+            expression (tuple ou str): Expressão lógica analisada
+            variables (list): Lista de variáveis na expressão
+            
+        Returns:
+            tuple: (valoração verdadeira, valoração falsa), cada uma um dicionário
+            {variável: 0 ou 1} na ordem de variables, ou None se não existir
+        """
+        # Importação tardia: o BDD e o resolvedor só são necessários para fórmulas grandes
+        from Model.bdd import BDD, NodeLimitExceeded
+        bdd = BDD(BDD.appearance_order(expression, variables), node_limit=self.MAX_CLASSIFY_BDD_NODES)
+        try:
+            edge = bdd.from_formula(expression)
+        except NodeLimitExceeded:
+            from Model.sat_solver import TseitinEncoder
+            return (TseitinEncoder(variables).find_assignment(expression, True),
+                    TseitinEncoder(variables).find_assignment(expression, False))
+        # A negação de uma aresta é o seu bit de complemento
+        witnesses = (bdd.any_assignment(edge), bdd.any_assignment(edge ^ 1))
+        return tuple(None if assignment is None else {var: assignment[var] for var in variables}
+                     for assignment in witnesses)
+
+    def count_models(self, expression, variables, max_chunk_rows=65536):
+        """
+        Conta as valorações que tornam a fórmula verdadeira, sem montar a tabela.
+        
+        Até MAX_ENUMERATION_VARIABLES variáveis, apenas a fórmula principal é avaliada
+        em blocos empacotados e os bits verdadeiros de cada bloco são contados
+        (int.bit_count), com memória limitada ao tamanho do bloco. Acima disso, a
+        contagem é feita sobre o BDD da fórmula, em tempo linear no seu tamanho, ou,
+        se o BDD ultrapassar MAX_BDD_NODES nós, pelo ModelCounter (#SAT com
+        decomposição em componentes e cache), sem enumerar as valorações.
+        
+        Args:
+            expression (tuple ou str): Expressão lógica analisada
+            variables (list): Lista de variáveis na expressão
+            max_chunk_rows (int, opcional): Tamanho de cada bloco de linhas enumerado
+            
+        Returns:
+            int: Número de modelos da fórmula sobre as variáveis informadas
+        """
+        if len(variables) > self.MAX_ENUMERATION_VARIABLES:
+            # Importação tardia: o BDD e o contador só são necessários para fórmulas grandes
+            from Model.bdd import BDD, NodeLimitExceeded
+            from Model.model_counter import ModelCounter
+            bdd = BDD(BDD.appearance_order(expression, variables), node_limit=self.MAX_BDD_NODES)
+            try:
+                return bdd.count_models(bdd.from_formula(expression))
+            except NodeLimitExceeded:
+                return ModelCounter.count_formula(expression, variables)
+        return sum(bits.bit_count() for _, _, bits in self._iter_root_chunks(expression, variables, max_chunk_rows))
+
+    def iter_models(self, expression, variables, limit=None, max_chunk_rows=65536):
+        """
+        Enumera, sob demanda, as valorações que tornam a fórmula verdadeira.
+        
+        Os modelos são obtidos por busca nos cofatores do BDD da fórmula (na ordem
+        das variáveis), de modo que nenhuma linha falsa é visitada e o primeiro
+        modelo sai sem enumerar a tabela; eles saem na ordem das linhas da tabela
+        verdade. Se o BDD ultrapassar MAX_BDD_NODES nós, até
+        MAX_ENUMERATION_VARIABLES variáveis a fórmula principal é avaliada em
+        blocos empacotados (na mesma ordem); acima disso, os modelos são obtidos
+        pelo resolvedor SAT, um a um, bloqueando cada modelo já encontrado (em
+        ordem arbitrária).
+        
+        Args:
+            expression (tuple ou str): Expressão lógica analisada
+            variables (list): Lista de variáveis na expressão
+            limit (int, opcional): Número máximo de modelos; por padrão, todos
+            max_chunk_rows (int, opcional): Tamanho de cada bloco de linhas, se a
+                enumeração em blocos for necessária
+            
+        Yields:
+            dict: Valoração {variável: 0 ou 1} que torna a fórmula verdadeira
+        """
+        if limit is not None and limit <= 0:
+            return
+        # Importação tardia: o BDD só é necessário para a enumeração de modelos
+        from Model.bdd import BDD, NodeLimitExceeded
+        try:
+            bdd = BDD(variables, node_limit=self.MAX_BDD_NODES)
+            models = bdd.iter_models(bdd.from_formula(expression))
+        except NodeLimitExceeded:
+            if len(variables) > self.MAX_ENUMERATION_VARIABLES:
+                from Model.sat_solver import TseitinEncoder
+                models = TseitinEncoder(variables).iter_assignments(expression)
+            else:
+                models = self._iter_table_models(expression, variables, max_chunk_rows)
+        yield from islice(models, limit)
+
+    def _iter_table_models(self, expression, variables, max_chunk_rows):
+        """
+        Enumera os modelos avaliando a fórmula principal em blocos empacotados.
+        
+        Args:
+            expression (tuple ou str): Expressão lógica analisada
+            variables (list): Lista de variáveis na expressão
+            max_chunk_rows (int): Tamanho de cada bloco de linhas
+            
+        Yields:
+            dict: Valoração de cada linha verdadeira, na ordem das linhas
+        """
+        for chunk_start, _, bits in self._iter_root_chunks(expression, variables, max_chunk_rows):
+            while bits:
+                lowest = bits & -bits
+                yield TruthTable.row_assignment(chunk_start + lowest.bit_length() - 1, variables)
+                bits ^= lowest
+
+    def _iter_root_chunks(self, expression, variables, chunk_rows):
+        """
+        Avalia apenas a fórmula principal, bloco a bloco, sobre todas as valorações.
+        
+        Args:
+            expression (tuple ou str): Expressão lógica analisada
+            variables (list): Lista de variáveis na expressão
+            chunk_rows (int): Número de linhas de cada bloco
+            
+        Yields:
+            tuple: (primeira linha, número de linhas, coluna empacotada da fórmula no bloco)
+        """
+        formula = FormulaCompiler(variables).compile([expression])
+        total_rows = 1 << len(variables)
+        for chunk_start in range(0, total_rows, chunk_rows):
+            size = min(chunk_rows, total_rows - chunk_start)
+            (bits,) = formula(TruthTable.variable_masks(variables, chunk_start, size), (1 << size) - 1)
+            yield chunk_start, size, bits
+
+    def _classification(self, true_assignment, false_assignment):
+        """
+        Escolhe a mensagem de classificação a partir das valorações testemunhas.
+        
+        Args:
+            true_assignment (dict ou None): Valoração que torna a fórmula verdadeira
+            false_assignment (dict ou None): Valoração que torna a fórmula falsa
+            
+        Returns:
+            str: Classificação da fórmula
+        """
+        if false_assignment is None:
+            return self.TAUTOLOGY
+        elif true_assignment is None:
+            return self.CONTRADICTION
         else:
-            return "Contingência: A fórmula pode ser verdadeira ou falsa, dependendo da valoração das variáveis."
\ No newline at end of file
+            return self.CONTINGENCY
\ No newline at end of file
@@ -0,0 +1,104 @@
+import numpy as np
+from Model.logical_operations import LogicalOperations
+
+class VectorizedEvaluator:
+    """
+    Classe responsável por avaliar expressões lógicas coluna a coluna com NumPy.
+    Cada variável é representada por um vetor booleano com uma posição por linha
+    da tabela verdade, e cada nó da árvore de análise é avaliado uma única vez
+    como uma operação sobre a coluna inteira.
+    """
+
+    def __init__(self, variables):
+        """
+        Inicializa o avaliador vetorizado.
+
+        Args:
+            variables (list): Lista de variáveis na ordem das colunas da tabela
+        """
+        self.variables = variables
+        self.num_rows = 2 ** len(variables)
+        self.vector_ops = {
+            LogicalOperations.and_op: lambda a, b: a & b,
+            LogicalOperations.or_op: lambda a, b: a | b,
+            LogicalOperations.not_op: lambda a: ~a,
+            LogicalOperations.xor_op: lambda a, b: a ^ b,
+            LogicalOperations.eq_op: lambda a, b: a == b,
+            LogicalOperations.imp_op: lambda a, b: ~a | b,
+        }
+
+    def variable_columns(self):
+        """
+        Constrói as colunas das variáveis a partir do índice da linha.
+
+        A primeira variável corresponde ao bit mais significativo do índice,
+        reproduzindo a ordem de itertools.product([0, 1], repeat=n).
+
+        Returns:
+            dict: Dicionário mapeando cada variável para seu vetor booleano
+        """
+        rows = np.arange(self.num_rows, dtype=np.int64)
+        n = len(self.variables)
+        return {
+            var: ((rows >> (n - 1 - i)) & 1).astype(bool)
+            for i, var in enumerate(self.variables)
+        }
+
+    def evaluate(self, node, columns, cache=None):
+        """
+        Avalia um nó da árvore de análise sobre todas as linhas de uma vez.
+
+        Args:
+            node (tuple ou str): Nó da árvore de análise
+            columns (dict): Vetores booleanos de cada variável
+            cache (dict, opcional): Resultados já calculados, indexados pela identidade do nó
+
+        Returns:
+            numpy.ndarray: Vetor booleano com o valor do nó em cada linha
+
+        Raises:
+            ValueError: Se o nó for de um tipo desconhecido
+        """
+        if cache is None:
+            cache = {}
+        # Percurso em pós-ordem com pilha explícita, sem limite de profundidade
+        stack = [node]
+        while stack:
+            current = stack[-1]
+            key = id(current)
+            if key in cache:
+                stack.pop()
+            elif isinstance(current, tuple):
+                pending = [arg for arg in current[1:] if id(arg) not in cache]
+                if pending:
+                    stack.extend(reversed(pending))
+                else:
+                    stack.pop()
+                    cache[key] = self.vector_ops[current[0]](*[cache[id(arg)] for arg in current[1:]])
+            elif isinstance(current, str):
+                stack.pop()
+                cache[key] = columns[current]
+            else:
+                raise ValueError(f"Nó incorreto: {current}")
+        return cache[id(node)]
+
+    def evaluate_subformulas(self, subformula_nodes):
+        """
+        Avalia as variáveis e uma lista de subfórmulas sobre todas as linhas.
+
+        Args:
+            subformula_nodes (list): Nós das subfórmulas, na ordem das colunas
+
+        Returns:
+            numpy.ndarray: Matriz int64 com uma coluna por variável seguida de
+            uma coluna por subfórmula
+        """
+        columns = self.variable_columns()
+        cache = {}
+        results = [columns[var] for var in self.variables]
+        for node in subformula_nodes:
+            results.append(self.evaluate(node, columns, cache))
+
+        if not results:
+            return np.zeros((self.num_rows, 0), dtype=np.int64)
+        return np.column_stack(results).astype(np.int64)
@@ -1,12 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, filedialog
 import os
-from Model.expression_processor import ExpressionProcessor
-from Model.parser import Parser
-from Model.formula_handler import FormulaHandler
-from Model.truth_table_generator import TruthTableGenerator
+from View.virtual_table import VirtualTableView
 from Controller.file_handler import FileHandler
+from Controller.table_job_runner import TableJobRunner
+from Model.formula_cache import FormulaCache
+from Model.table_store import TableStore
 from Model.logical_operations import LogicalOperations
+from Model.stats import Stats
 
 class TruthTableGUI:
     """
@@ -15,12 +16,14 @@ class TruthTableGUI:
     visualização de tabelas verdade com classificação de fórmulas.
     """
     
+    # Intervalo de consulta aos eventos da geração em segundo plano
+    POLL_INTERVAL_MS = 100
+    
     def __init__(self):
         """
         Inicializa a interface gráfica.
         """
         self.selected_fbf = None
-        self.expr_processor = ExpressionProcessor()
         
     def show_input_window(self):
         """
@@ -63,28 +66,59 @@ class TruthTableGUI:
         error_label = tk.Label(main_frame, text="", font=("Arial", 12), fg="red", bg="#f0f0f0")
         error_label.pack(pady=10)
         
+        # Geração das tabelas fora da thread da interface; o cache em disco só é
+        # usado quando configurado pelas variáveis de ambiente
+        runner = TableJobRunner(cache=FormulaCache(store=TableStore.from_environment()), profile=True)
+        
         def process_input():
-            try:
-                raw_expression = expr_entry.get()
-                # Extrair variáveis automaticamente da expressão
-                variables = self.expr_processor.extract_variables(raw_expression)
-                tokens = self.expr_processor.tokenize(raw_expression)
-                parser = Parser(tokens, variables)
-                parsed_expression = parser.parse()
-                
-                formula_handler = FormulaHandler(parser)
-                truth_table_gen = TruthTableGenerator(formula_handler)
-                
-                # Gerar tabela verdade com subfórmulas
-                table = truth_table_gen.generate_truth_table(parsed_expression, variables)
-                
-                # Classificar a FBF
-                final_column = table.columns[-1]
-                classification = truth_table_gen.classify_fbf(table, final_column)
-                
-                self.show_truth_table(parsed_expression, variables, table, classification, formula_handler)
-            except Exception as e:
-                error_label["text"] = f"Erro: {e}"
+            raw_expression = expr_entry.get()
+            runner.submit(raw_expression)
+            error_label["text"] = ""
+            update_status()
+        
+        def cancel_generation():
+            if runner.cancel_current():
+                status_label["text"] = "Cancelando..."
+        
+        def update_status(text=None):
+            pending = runner.pending_count()
+            if text is None:
+                text = "Gerando tabela..." if runner.current_job is not None else ""
+            if pending:
+                text = f"{text} ({pending} na fila)".strip()
+            status_label["text"] = text
+        
+        def poll_runner():
+            # Reagendada antes de tratar os eventos, para que a consulta continue
+            # mesmo se o tratamento de um evento falhar
+            root.after(self.POLL_INTERVAL_MS, poll_runner)
+            for event in runner.poll_events():
+                kind = event[0]
+                if kind == "started":
+                    progress_bar["value"] = 0
+                    cancel_button["state"] = "normal"
+                    update_status(f"Gerando: {event[2]}")
+                elif kind == "progress":
+                    _, _, done_rows, total_rows = event
+                    progress_bar["value"] = 100 * done_rows / total_rows
+                    update_status(f"{done_rows} / {total_rows} linhas")
+                else:
+                    cancel_button["state"] = "disabled"
+                    progress_bar["value"] = 0
+                    if kind == "done":
+                        result = event[2]
+                        stats = result["cache_stats"]
+                        update_status(f"Cache: {stats['table_hits']} acertos, "
+                                      f"{stats['table_misses']} falhas, "
+                                      f"{stats['disk_hits']} do disco")
+                        self.show_truth_table(result["expression"], result["variables"],
+                                              result["table"], result["classification"],
+                                              result["stats"], root)
+                    elif kind == "cancelled":
+                        update_status("Geração cancelada.")
+                    else:
+                        update_status()
+                        error_label["text"] = f"Erro: {event[2]}"
 
         def load_from_file():
             try:
@@ -178,10 +212,26 @@ class TruthTableGUI:
                                activebackground="#004c99", activeforeground="white", 
                                padx=15, pady=5)
         build_button.pack()
+        
+        # Progresso da geração e cancelamento
+        progress_frame = tk.Frame(main_frame, bg="#f0f0f0")
+        progress_frame.pack(fill="x", pady=5)
+        
+        progress_bar = ttk.Progressbar(progress_frame, mode="determinate", maximum=100)
+        progress_bar.pack(side="left", fill="x", expand=True)
+        
+        cancel_button = tk.Button(progress_frame, text="Cancelar", command=cancel_generation,
+                                  font=("Arial", 12), state="disabled", padx=10)
+        cancel_button.pack(side="left", padx=(10, 0))
+        
+        status_label = tk.Label(main_frame, text="", font=("Arial", 11, "italic"),
+                                fg="#666666", bg="#f0f0f0")
+        status_label.pack()
 
         # Adicionar menu de operadores
         self.add_operator_menu(main_frame, expr_entry)
 
+        root.after(self.POLL_INTERVAL_MS, poll_runner)
         root.mainloop()
 
     def add_operator_menu(self, parent_frame, entry_widget):
@@ -338,18 +388,28 @@ class TruthTableGUI:
         
         return selected_fbf[0]
 
-    def show_truth_table(self, expression, variables, table, classification, formula_handler):
+    def show_truth_table(self, expression, variables, table, classification, stats=None, parent_window=None):
         """
         Exibe a tabela verdade para uma expressão lógica.
         
+        Com uma janela pai, a tabela abre em uma janela secundária (Toplevel) que
+        usa o laço de eventos da janela pai, de modo que a janela de entrada
+        continua respondendo (e recebendo o progresso de outras gerações)
+        enquanto a tabela está aberta.
+        
         Args:
-            expression (tuple): Expressão lógica analisada
+            expression (str): Texto da fórmula (CachedFormula.render)
             variables (list): Lista de variáveis na expressão
-            table (pandas.DataFrame): Tabela verdade gerada
+            table (TruthTable ou pandas.DataFrame): Tabela verdade gerada
             classification (str): Classificação da fórmula
-            formula_handler (FormulaHandler): Manipulador de fórmulas para conversão de nós para string
+            stats (Stats, opcional): Estatísticas da geração; recebem o tempo de montagem
+                do Treeview e são exibidas em uma linha de status no rodapé da janela
+            parent_window (tk.Tk, opcional): Janela pai; sem ela, uma nova janela
+                principal é criada e o laço de eventos é executado até ela ser fechada
         """
-        root = tk.Tk()
+        if stats is None:
+            stats = Stats.DISABLED
+        root = tk.Tk() if parent_window is None else tk.Toplevel(parent_window)
         root.title("Tabela Verdade")
         root.configure(bg="#f5f5f5")
         
@@ -364,8 +424,7 @@ class TruthTableGUI:
                  font=("Arial", 16, "bold"), fg="#0066cc", bg="#f5f5f5").pack()
         
         # Expressão formatada
-        expr_str = formula_handler.node_to_string(expression)
-        expr_label = tk.Label(title_frame, text=expr_str, 
+        expr_label = tk.Label(title_frame, text=expression, 
                              font=("Arial", 14), fg="#333333", bg="#f5f5f5")
         expr_label.pack(pady=5)
 
@@ -380,40 +439,9 @@ class TruthTableGUI:
         style.configure("Treeview.Heading", font=("Arial", 12, "bold"), background="#e6f2ff", foreground="#0066cc")
         style.map("Treeview", background=[("selected", "#0066cc")])
 
-        # Criar tabela com scrollbar
-        table_container = tk.Frame(table_frame)
-        table_container.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Scrollbars
-        vsb = ttk.Scrollbar(table_container, orient="vertical")
-        hsb = ttk.Scrollbar(table_container, orient="horizontal")
-        
-        tree = ttk.Treeview(table_container, columns=list(table.columns), show="headings", 
-                           yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-        
-        vsb.config(command=tree.yview)
-        hsb.config(command=tree.xview)
-        
-        vsb.pack(side="right", fill="y")
-        hsb.pack(side="bottom", fill="x")
-        tree.pack(side="left", fill="both", expand=True)
-        
-        # Configurar colunas
-        for i, col in enumerate(table.columns):
-            # Variáveis com largura menor
-            if i < len(variables):
-                tree.heading(col, text=col)
-                tree.column(col, width=60, anchor="center")
-            else:
-                # Subfórmulas com largura maior
-                tree.heading(col, text=col)
-                tree.column(col, width=min(200, len(col)*10), anchor="center")
-
-        # Inserir dados
-        for _, row in table.iterrows():
-            # Converter valores para V/F para melhor visualização
-            display_row = ["V" if val == 1 else "F" for val in row]
-            tree.insert("", tk.END, values=display_row)
+        # Criar tabela virtualizada: só as linhas visíveis viram itens do Treeview
+        with stats.stage("treeview"):
+            VirtualTableView(table_frame, table, variables)
 
         # Classificação da FBF
         class_frame = tk.Frame(main_frame, bg="#f5f5f5", pady=15)
@@ -441,5 +469,11 @@ class TruthTableGUI:
                                padx=15, pady=5, width=15)
         close_button.pack(pady=15)
 
-        root.mainloop()
+        # Linha de status com o tempo de cada etapa e os contadores da geração
+        if stats.enabled:
+            tk.Label(main_frame, text=stats.summary(), font=("Arial", 10), fg="#666666",
+                     bg="#f5f5f5", anchor="w", justify="left", wraplength=800).pack(fill="x")
+
+        if parent_window is None:
+            root.mainloop()
         
\ No newline at end of file
@@ -0,0 +1,154 @@
+import tkinter as tk
+from tkinter import ttk
+from Model.truth_table import TruthTable
+
+class VirtualTableView:
+    """
+    Classe responsável por exibir uma tabela verdade em um Treeview virtualizado.
+    Apenas as linhas visíveis (mais uma pequena margem) existem como itens do
+    Treeview; ao rolar, os mesmos itens recebem os valores das novas linhas,
+    lidos diretamente das colunas da tabela. O tempo de abertura e a memória
+    não dependem do número de linhas.
+    """
+
+    # Linhas extras renderizadas abaixo da área visível
+    OVERSCAN = 5
+
+    def __init__(self, parent, table, variables, row_height=25):
+        """
+        Cria a visualização dentro de um frame.
+
+        Args:
+            parent (tk.Widget): Widget pai
+            table (TruthTable ou pandas.DataFrame): Tabela verdade exibida
+            variables (list): Lista de variáveis (colunas mais estreitas)
+            row_height (int, opcional): Altura de cada linha em pixels
+        """
+        self.table = table
+        self.columns = list(table.columns)
+        self.num_rows = len(table)
+        self.row_height = row_height
+        self.first_row = 0
+        self.visible_rows = 1
+
+        container = tk.Frame(parent)
+        container.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self.vsb = ttk.Scrollbar(container, orient="vertical", command=self.on_scrollbar)
+        hsb = ttk.Scrollbar(container, orient="horizontal")
+        self.tree = ttk.Treeview(container, columns=self.columns, show="headings",
+                                 xscrollcommand=hsb.set)
+        hsb.config(command=self.tree.xview)
+
+        self.vsb.pack(side="right", fill="y")
+        hsb.pack(side="bottom", fill="x")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        # Configurar colunas
+        for i, col in enumerate(self.columns):
+            self.tree.heading(col, text=col)
+            if i < len(variables):
+                # Variáveis com largura menor
+                self.tree.column(col, width=60, anchor="center")
+            else:
+                # Subfórmulas com largura maior
+                self.tree.column(col, width=min(200, len(col) * 10), anchor="center")
+
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", lambda event: self.scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda event: self.scroll_by(3))
+        self.tree.bind("<Up>", lambda event: self.scroll_by(-1))
+        self.tree.bind("<Down>", lambda event: self.scroll_by(1))
+        self.tree.bind("<Prior>", lambda event: self.scroll_by(-self.visible_rows))
+        self.tree.bind("<Next>", lambda event: self.scroll_by(self.visible_rows))
+        self.tree.bind("<Home>", lambda event: self.scroll_to(0))
+        self.tree.bind("<End>", lambda event: self.scroll_to(self.num_rows))
+
+        self.refresh()
+
+    def row_values(self, start, stop):
+        """
+        Lê os valores das linhas de um intervalo.
+
+        Args:
+            start (int): Primeira linha
+            stop (int): Linha final (exclusiva)
+
+        Returns:
+            list: Valores (0 ou 1) de cada linha do intervalo
+        """
+        if isinstance(self.table, TruthTable):
+            return list(self.table.iter_rows(self.table.start + start, self.table.start + stop))
+        return [list(row) for row in self.table.iloc[start:stop].itertuples(index=False)]
+
+    def refresh(self):
+        """
+        Atualiza os itens do Treeview com as linhas a partir de first_row.
+        """
+        stop = min(self.first_row + self.visible_rows + self.OVERSCAN, self.num_rows)
+        rows = self.row_values(self.first_row, stop)
+
+        items = self.tree.get_children()
+        # Ajusta a quantidade de itens reutilizados ao tamanho da janela
+        for item in items[len(rows):]:
+            self.tree.delete(item)
+        for _ in range(len(items), len(rows)):
+            self.tree.insert("", tk.END)
+        items = self.tree.get_children()
+
+        for item, row in zip(items, rows):
+            # Converter valores para V/F para melhor visualização
+            self.tree.item(item, values=["V" if val == 1 else "F" for val in row])
+
+        if self.num_rows:
+            self.vsb.set(self.first_row / self.num_rows,
+                         min(self.first_row + self.visible_rows, self.num_rows) / self.num_rows)
+
+    def scroll_to(self, row):
+        """
+        Rola a tabela para que a linha informada seja a primeira visível.
+
+        Args:
+            row (int): Índice da linha
+        """
+        row = max(0, min(row, self.num_rows - self.visible_rows))
+        if row != self.first_row:
+            self.first_row = row
+            self.refresh()
+        return "break"
+
+    def scroll_by(self, rows):
+        """
+        Rola a tabela por um número de linhas (negativo para cima).
+
+        Args:
+            rows (int): Deslocamento em linhas
+        """
+        return self.scroll_to(self.first_row + rows)
+
+    def on_scrollbar(self, action, amount, unit=None):
+        """
+        Trata os comandos da barra de rolagem vertical.
+        """
+        if action == "moveto":
+            return self.scroll_to(int(float(amount) * self.num_rows))
+        step = self.visible_rows if unit == "pages" else 1
+        return self.scroll_by(int(amount) * step)
+
+    def on_mousewheel(self, event):
+        """
+        Trata a roda do mouse (Windows e macOS).
+        """
+        return self.scroll_by(-3 if event.delta > 0 else 3)
+
+    def on_resize(self, event):
+        """
+        Recalcula quantas linhas cabem na área visível.
+        """
+        # Desconta a linha do cabeçalho
+        visible = max(1, event.height // self.row_height - 1)
+        if visible != self.visible_rows:
+            self.visible_rows = visible
+            self.first_row = max(0, min(self.first_row, self.num_rows - self.visible_rows))
+            self.refresh()
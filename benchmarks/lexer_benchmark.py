@@ -0,0 +1,99 @@
+"""
+Mede a vazão do analisador léxico (ExpressionProcessor.lex) em expressões grandes.
+
+Cada cenário gera uma expressão com o tamanho pedido, analisa-a várias vezes e
+informa o tempo mediano e a vazão em MB/s:
+
+- ascii: operadores em ASCII (^, v, ~, x, ->, <->) e variáveis com dígitos;
+- unicode: os mesmos operadores na grafia Unicode (∧, ∨, ¬, ⊻, →, ↔);
+- compacta: operadores Unicode, sem espaços entre os tokens.
+
+Uso (a partir da raiz do projeto):
+
+    python benchmarks/lexer_benchmark.py --size-mb 1 --runs 5 --budget-ms 500
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Model.expression_processor import ExpressionProcessor
+
+ASCII_OPERATORS = ["^", "v", "x", "->", "<->"]
+UNICODE_OPERATORS = ["∧", "∨", "⊻", "→", "↔"]
+
+
+def build_expression(size, operators, separator=" ", num_variables=64):
+    """
+    Gera uma expressão válida com aproximadamente o tamanho informado.
+
+    Args:
+        size (int): Tamanho aproximado da expressão, em caracteres
+        operators (list): Operadores binários usados, em rodízio
+        separator (str, opcional): Texto entre os tokens
+        num_variables (int, opcional): Número de variáveis distintas
+
+    Returns:
+        str: Expressão gerada
+    """
+    parts = []
+    length = 0
+    i = 0
+    while length < size:
+        operand = f"(~P{i % num_variables}{separator}{operators[i % len(operators)]}{separator}Q{i % 7})"
+        parts.append(operand)
+        parts.append(operators[(i + 1) % len(operators)])
+        length += len(operand) + len(parts[-1]) + 2 * len(separator)
+        i += 1
+    parts.pop()
+    return separator.join(parts)
+
+
+def main(argv=None):
+    """
+    Executa os cenários e compara as medianas com o orçamento.
+
+    Args:
+        argv (list, opcional): Argumentos da linha de comando
+
+    Returns:
+        int: 0 se todos os cenários couberem no orçamento, 1 caso contrário
+    """
+    arg_parser = argparse.ArgumentParser(description="Mede a vazão do analisador léxico.")
+    arg_parser.add_argument("--size-mb", type=float, default=1.0, help="Tamanho das expressões (padrão: 1)")
+    arg_parser.add_argument("--runs", type=int, default=5, help="Execuções por cenário (padrão: 5)")
+    arg_parser.add_argument("--budget-ms", type=float, default=None,
+                            help="Tempo mediano máximo aceito por cenário, em milissegundos")
+    args = arg_parser.parse_args(argv)
+
+    size = int(args.size_mb * 1024 * 1024)
+    scenarios = {
+        "ascii": build_expression(size, ASCII_OPERATORS),
+        "unicode": build_expression(size, UNICODE_OPERATORS),
+        "compacta": build_expression(size, UNICODE_OPERATORS, separator=""),
+    }
+
+    over_budget = False
+    for name, expression in scenarios.items():
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            tokens, _, variables = ExpressionProcessor.lex(expression)
+            timings.append((time.perf_counter() - start) * 1000)
+        median = statistics.median(timings)
+        megabytes = len(expression.encode("utf-8")) / (1024 * 1024)
+        status = ""
+        if args.budget_ms is not None:
+            within = median <= args.budget_ms
+            over_budget |= not within
+            status = "ok" if within else f"ACIMA DO ORÇAMENTO ({args.budget_ms:.0f} ms)"
+        print(f"{name:9s} {megabytes:5.2f} MB  {len(tokens):8d} tokens  {len(variables):3d} variáveis  "
+              f"mediana {median:8.1f} ms  {megabytes / (median / 1000):6.1f} MB/s  {status}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
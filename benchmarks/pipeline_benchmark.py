@@ -0,0 +1,372 @@
+"""
+Mede cada etapa do processamento de uma fórmula sobre famílias geradas de
+fórmulas escaláveis, registra os resultados em uma linha de base JSON e detecta
+regressões de desempenho.
+
+As famílias são geradas de forma determinística:
+
+- paridade: cadeia de ou-exclusivos P1 x P2 x ... x Pn;
+- pombos: princípio da casa dos pombos (n + 1 pombos em n casas), em forma
+  normal conjuntiva; é sempre uma contradição;
+- 3cnf: fórmula aleatória em 3-CNF com n variáveis e razão cláusulas/variáveis
+  configurável (4,26 é a região mais difícil);
+- implicacoes: silogismo hipotético encadeado, como em FBF/Tautologias.txt:
+  ((P1 -> P2) ^ ... ^ (Pn-1 -> Pn)) -> (P1 -> Pn);
+- aninhamento: n níveis de parênteses aninhados sobre poucas variáveis, que
+  estressa a análise, a extração das subfórmulas e a largura da tabela.
+
+Para cada caso são medidas separadamente as etapas lex
+(ExpressionProcessor.lex, que é a base de tokenize), parse (Parser.parse),
+subformulas (FormulaHandler.get_subformulas), table (generate_truth_table) e
+classify (classify_fbf sobre a tabela; acima de --max-table-variables a tabela
+não é gerada e classify usa o resolvedor SAT). O tempo é a mediana de --runs
+execuções; o pico de memória é medido com tracemalloc em uma execução à parte,
+para não distorcer os tempos.
+
+Uso (a partir da raiz do projeto):
+
+    python benchmarks/pipeline_benchmark.py --save-baseline baseline.json
+    python benchmarks/pipeline_benchmark.py --baseline baseline.json --threshold 1.25
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Model.expression_processor import ExpressionProcessor
+from Model.formula_handler import FormulaHandler
+from Model.parser import Parser
+from Model.truth_table_generator import TruthTableGenerator
+
+STAGES = ("lex", "parse", "subformulas", "table", "classify")
+
+
+def parity(n):
+    """
+    Gera a cadeia de ou-exclusivos de n variáveis.
+
+    Args:
+        n (int): Número de variáveis
+
+    Returns:
+        str: P1 x P2 x ... x Pn
+    """
+    return " x ".join(f"P{i}" for i in range(1, n + 1))
+
+
+def pigeonhole(holes):
+    """
+    Gera o princípio da casa dos pombos com holes + 1 pombos em holes casas.
+
+    A variável PiHj indica que o pombo i está na casa j. Cada pombo ocupa alguma
+    casa e nenhuma casa recebe dois pombos, o que é impossível.
+
+    Args:
+        holes (int): Número de casas
+
+    Returns:
+        str: Conjunção das cláusulas
+    """
+    pigeons = range(1, holes + 2)
+    clauses = ["(" + " v ".join(f"P{i}H{j}" for j in range(1, holes + 1)) + ")" for i in pigeons]
+    for j in range(1, holes + 1):
+        for i in pigeons:
+            for k in range(i + 1, holes + 2):
+                clauses.append(f"(~P{i}H{j} v ~P{k}H{j})")
+    return " ^ ".join(clauses)
+
+
+def random_3cnf(n, ratio=4.26, seed=0):
+    """
+    Gera uma fórmula aleatória em 3-CNF.
+
+    Args:
+        n (int): Número de variáveis (pelo menos 3)
+        ratio (float, opcional): Razão entre o número de cláusulas e de variáveis
+        seed (int, opcional): Semente do gerador, para que a fórmula seja reproduzível
+
+    Returns:
+        str: Conjunção de round(ratio * n) cláusulas com 3 literais distintos
+    """
+    rng = random.Random(f"3cnf-{n}-{ratio}-{seed}")
+    clauses = []
+    for _ in range(max(1, round(ratio * n))):
+        literals = [("~" if rng.random() < 0.5 else "") + f"P{i}" for i in rng.sample(range(1, n + 1), 3)]
+        clauses.append("(" + " v ".join(literals) + ")")
+    return " ^ ".join(clauses)
+
+
+def implication_chain(n):
+    """
+    Gera o silogismo hipotético encadeado sobre n variáveis (uma tautologia).
+
+    Args:
+        n (int): Número de variáveis (pelo menos 2)
+
+    Returns:
+        str: ((P1 -> P2) ^ ... ^ (Pn-1 -> Pn)) -> (P1 -> Pn)
+    """
+    premises = " ^ ".join(f"(P{i} -> P{i + 1})" for i in range(1, n))
+    return f"({premises}) -> (P1 -> P{n})"
+
+
+def deep_nesting(depth, num_variables=4):
+    """
+    Gera uma expressão com depth níveis de parênteses aninhados.
+
+    Args:
+        depth (int): Profundidade de aninhamento
+        num_variables (int, opcional): Número de variáveis distintas, usadas em rodízio
+
+    Returns:
+        str: (P1 ^ (P2 v (P3 -> (... P0 ...))))
+    """
+    operators = ("^", "v", "->", "x", "<->")
+    parts = [f"(P{i % num_variables} {operators[i % len(operators)]} " for i in range(1, depth + 1)]
+    return "".join(parts) + "P0" + ")" * depth
+
+
+# Família: (gerador, tamanhos medidos por padrão)
+FAMILIES = {
+    "paridade": (parity, (8, 12, 16)),
+    "pombos": (pigeonhole, (2, 3, 4)),
+    "3cnf": (random_3cnf, (10, 14, 30)),
+    "implicacoes": (implication_chain, (8, 12, 16)),
+    "aninhamento": (deep_nesting, (250, 1000)),
+}
+
+
+def build_cases(families, ratio, seed):
+    """
+    Gera as expressões de cada caso.
+
+    Args:
+        families (list): Nomes das famílias
+        ratio (float): Razão cláusulas/variáveis das fórmulas 3-CNF
+        seed (int): Semente das fórmulas 3-CNF
+
+    Returns:
+        dict: Expressão de cada caso, indexada por "família-tamanho"
+    """
+    cases = {}
+    for family in families:
+        generator, sizes = FAMILIES[family]
+        for size in sizes:
+            if generator is random_3cnf:
+                cases[f"{family}-{size}"] = random_3cnf(size, ratio, seed)
+            else:
+                cases[f"{family}-{size}"] = generator(size)
+    return cases
+
+
+def run_pipeline(expression, engine, max_table_variables, clock, mark):
+    """
+    Executa todas as etapas uma vez, medindo cada uma.
+
+    Args:
+        expression (str): Expressão a processar
+        engine (str): Mecanismo de avaliação de generate_truth_table
+        max_table_variables (int): Maior número de variáveis para o qual a tabela é gerada
+        clock (function): Função chamada antes de cada etapa; devolve o estado inicial
+        mark (function): Função chamada depois de cada etapa com o estado inicial;
+            devolve a medida da etapa
+
+    Returns:
+        tuple: (medida de cada etapa, número de tokens, número de variáveis); a
+        etapa table é None quando a tabela não é gerada
+    """
+    measures = {}
+
+    state = clock()
+    tokens, _, variables = ExpressionProcessor.lex(expression)
+    measures["lex"] = mark(state)
+
+    state = clock()
+    parser = Parser(tokens, variables)
+    parsed_expression = parser.parse()
+    measures["parse"] = mark(state)
+
+    state = clock()
+    formula_handler = FormulaHandler(parser)
+    subformulas = formula_handler.get_subformulas(parsed_expression)
+    measures["subformulas"] = mark(state)
+
+    generator = TruthTableGenerator(formula_handler)
+    if len(variables) <= max_table_variables:
+        state = clock()
+        table = generator.generate_truth_table(parsed_expression, variables, engine=engine)
+        measures["table"] = mark(state)
+
+        state = clock()
+        generator.classify_fbf(table, subformulas[-1][0] if subformulas else variables[0])
+        measures["classify"] = mark(state)
+    else:
+        measures["table"] = None
+        state = clock()
+        generator.classify(parsed_expression, variables)
+        measures["classify"] = mark(state)
+    return measures, len(tokens), len(variables)
+
+
+def measure_case(expression, engine, max_table_variables, runs):
+    """
+    Mede o tempo mediano e o pico de memória de cada etapa de um caso.
+
+    Args:
+        expression (str): Expressão a processar
+        engine (str): Mecanismo de avaliação de generate_truth_table
+        max_table_variables (int): Maior número de variáveis para o qual a tabela é gerada
+        runs (int): Número de execuções cronometradas
+
+    Returns:
+        dict: Número de tokens e de variáveis e, para cada etapa, o tempo mediano em
+        milissegundos ("ms") e o pico de memória em KiB ("peak_kb"), ou None se a
+        etapa não foi executada
+    """
+    def start_timer():
+        return time.perf_counter()
+
+    def stop_timer(start):
+        return (time.perf_counter() - start) * 1000
+
+    timings = {stage: [] for stage in STAGES}
+    for _ in range(runs):
+        measures, num_tokens, num_variables = run_pipeline(
+            expression, engine, max_table_variables, start_timer, stop_timer)
+        for stage, elapsed in measures.items():
+            timings[stage].append(elapsed)
+
+    def start_memory():
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0]
+
+    def stop_memory(start):
+        return (tracemalloc.get_traced_memory()[1] - start) / 1024
+
+    tracemalloc.start()
+    try:
+        peaks, _, _ = run_pipeline(expression, engine, max_table_variables, start_memory, stop_memory)
+    finally:
+        tracemalloc.stop()
+
+    stages = {}
+    for stage in STAGES:
+        if peaks[stage] is None:
+            stages[stage] = None
+        else:
+            stages[stage] = {"ms": round(statistics.median(timings[stage]), 3), "peak_kb": round(peaks[stage], 1)}
+    return {"tokens": num_tokens, "variables": num_variables, "stages": stages}
+
+
+def find_regressions(results, baseline, threshold, min_ms):
+    """
+    Compara os tempos medidos com a linha de base.
+
+    Args:
+        results (dict): Casos medidos por measure_case
+        baseline (dict): Casos da linha de base, no mesmo formato
+        threshold (float): Maior razão aceita entre o tempo atual e o da linha de base
+        min_ms (float): Etapas mais rápidas que isso na linha de base são ignoradas,
+            pois o ruído de medição domina
+
+    Returns:
+        tuple: (razão entre os tempos de cada etapa comparada, indexada por
+        (caso, etapa); conjunto das etapas acima do limite)
+    """
+    ratios = {}
+    regressions = set()
+    for case, result in results.items():
+        reference = baseline.get(case)
+        if reference is None:
+            continue
+        for stage, measure in result["stages"].items():
+            base = reference["stages"].get(stage)
+            if measure is None or base is None or base["ms"] < min_ms:
+                continue
+            ratio = measure["ms"] / base["ms"]
+            ratios[case, stage] = ratio
+            if ratio > threshold:
+                regressions.add((case, stage))
+    return ratios, regressions
+
+
+def main(argv=None):
+    """
+    Executa os casos, grava ou compara a linha de base e informa as regressões.
+
+    Args:
+        argv (list, opcional): Argumentos da linha de comando
+
+    Returns:
+        int: 0 se nenhuma etapa ficou mais lenta que o limite, 1 caso contrário
+    """
+    arg_parser = argparse.ArgumentParser(description="Mede cada etapa do processamento de fórmulas.")
+    arg_parser.add_argument("--runs", type=int, default=3, help="Execuções por caso (padrão: 3)")
+    arg_parser.add_argument("--engine", choices=TruthTableGenerator.ENGINES, default="python",
+                            help="Mecanismo de avaliação da tabela (padrão: python)")
+    arg_parser.add_argument("--max-table-variables", type=int, default=16,
+                            help="Maior número de variáveis para o qual a tabela é gerada (padrão: 16)")
+    arg_parser.add_argument("--ratio", type=float, default=4.26,
+                            help="Razão cláusulas/variáveis das fórmulas 3-CNF (padrão: 4,26)")
+    arg_parser.add_argument("--seed", type=int, default=0, help="Semente das fórmulas 3-CNF (padrão: 0)")
+    arg_parser.add_argument("--baseline", metavar="ARQUIVO", help="Linha de base JSON com a qual comparar")
+    arg_parser.add_argument("--save-baseline", metavar="ARQUIVO", help="Grava os resultados como linha de base JSON")
+    arg_parser.add_argument("--threshold", type=float, default=1.25,
+                            help="Maior razão aceita entre o tempo atual e o da linha de base (padrão: 1,25)")
+    arg_parser.add_argument("--min-ms", type=float, default=1.0,
+                            help="Etapas mais rápidas que isso na linha de base não são comparadas (padrão: 1)")
+    arg_parser.add_argument("families", nargs="*", metavar="FAMÍLIA",
+                            help=f"Famílias a medir: {', '.join(FAMILIES)} (padrão: todas)")
+    args = arg_parser.parse_args(argv)
+    unknown = [name for name in args.families if name not in FAMILIES]
+    if unknown:
+        arg_parser.error(f"família desconhecida: {', '.join(unknown)}")
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["cases"]
+
+    results = {}
+    for case, expression in build_cases(args.families or list(FAMILIES), args.ratio, args.seed).items():
+        results[case] = measure_case(expression, args.engine, args.max_table_variables, args.runs)
+
+    ratios, regressions = find_regressions(results, baseline, args.threshold, args.min_ms)
+    for case, result in results.items():
+        print(f"{case:18s} {result['tokens']:7d} tokens  {result['variables']:3d} variáveis")
+        for stage, measure in result["stages"].items():
+            if measure is None:
+                print(f"    {stage:12s} ignorada (mais de {args.max_table_variables} variáveis)")
+                continue
+            status = ""
+            if (case, stage) in ratios:
+                status = f"{ratios[case, stage]:5.2f}x da linha de base"
+                if (case, stage) in regressions:
+                    status += f"  ACIMA DO LIMITE ({args.threshold:.2f}x)"
+            print(f"    {stage:12s} {measure['ms']:10.2f} ms  pico {measure['peak_kb']:10.1f} KiB  {status}")
+
+    if args.save_baseline:
+        document = {
+            "python": platform.python_version(),
+            "engine": args.engine,
+            "runs": args.runs,
+            "cases": results,
+        }
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+    if regressions:
+        print(f"{len(regressions)} etapa(s) acima do limite de {args.threshold:.2f}x")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""
+Mede o tempo de inicialização do aplicativo.
+
+Cada cenário é executado em um processo Python novo, várias vezes, e o tempo
+de parede mediano é comparado com o orçamento informado:
+
+- gui: de "python main.py" até a primeira janela ser desenhada (o mainloop é
+  substituído por uma única atualização da janela, seguida do encerramento);
+- gui-imports: apenas a importação de View.gui (não precisa de display);
+- headless: "python main.py batch" sobre um arquivo de exemplo.
+
+O cenário gui só é ignorado quando não há display (a criação de uma janela Tk
+falha com TclError); qualquer outro comando que termine com erro é uma falha.
+
+Uso (a partir da raiz do projeto):
+
+    python benchmarks/startup_benchmark.py --runs 10 --budget-ms 300
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Executa main.py trocando o mainloop por uma única atualização da janela
+GUI_PROBE = (
+    "import sys, runpy, tkinter\n"
+    "def first_frame(self, n=0):\n"
+    "    self.update()\n"
+    "    self.destroy()\n"
+    "tkinter.Tk.mainloop = first_frame\n"
+    "sys.argv = ['main.py']\n"
+    "runpy.run_path('main.py', run_name='__main__')\n"
+)
+
+SCENARIOS = {
+    "gui": [sys.executable, "-c", GUI_PROBE],
+    "gui-imports": [sys.executable, "-c", "import View.gui"],
+    "headless": [sys.executable, "main.py", "batch", os.path.join("FBF", "Tautologias.txt")],
+}
+
+# Cenários que precisam de um display
+DISPLAY_SCENARIOS = {"gui"}
+
+# Verifica se uma janela Tk pode ser criada (sem display, Tk() lança TclError)
+DISPLAY_PROBE = (
+    "import sys, tkinter\n"
+    "try:\n"
+    "    tkinter.Tk().destroy()\n"
+    "except tkinter.TclError:\n"
+    "    sys.exit(3)\n"
+)
+
+
+def has_display():
+    """
+    Verifica se há um display disponível para a interface gráfica.
+
+    Returns:
+        bool: True se uma janela Tk pode ser criada
+    """
+    result = subprocess.run([sys.executable, "-c", DISPLAY_PROBE], cwd=ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return result.returncode == 0
+
+
+def time_command(command, runs):
+    """
+    Executa um comando várias vezes e mede o tempo de parede de cada execução.
+
+    Args:
+        command (list): Comando e argumentos
+        runs (int): Número de execuções
+
+    Returns:
+        list: Tempos em milissegundos
+
+    Raises:
+        subprocess.CalledProcessError: Se o comando terminar com erro (com a saída
+            de erro do comando)
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        elapsed = (time.perf_counter() - start) * 1000
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(result.returncode, command, stderr=result.stderr)
+        timings.append(elapsed)
+    return timings
+
+
+def main(argv=None):
+    """
+    Executa os cenários e compara as medianas com o orçamento.
+
+    Args:
+        argv (list, opcional): Argumentos da linha de comando
+
+    Returns:
+        int: 0 se todos os cenários executados terminarem sem erro e couberem no
+        orçamento, 1 caso contrário
+    """
+    arg_parser = argparse.ArgumentParser(description="Mede o tempo de inicialização do aplicativo.")
+    arg_parser.add_argument("--runs", type=int, default=5, help="Execuções por cenário (padrão: 5)")
+    arg_parser.add_argument("--budget-ms", type=float, default=None,
+                            help="Tempo mediano máximo aceito por cenário, em milissegundos")
+    arg_parser.add_argument("scenarios", nargs="*", metavar="CENÁRIO",
+                            help=f"Cenários a medir: {', '.join(SCENARIOS)} (padrão: todos)")
+    args = arg_parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        arg_parser.error(f"cenário desconhecido: {', '.join(unknown)}")
+
+    failed = False
+    display = None
+    for name in args.scenarios or list(SCENARIOS):
+        if name in DISPLAY_SCENARIOS:
+            if display is None:
+                display = has_display()
+            if not display:
+                print(f"{name:12s} ignorado (sem display)")
+                continue
+        try:
+            timings = time_command(SCENARIOS[name], args.runs)
+        except subprocess.CalledProcessError as e:
+            failed = True
+            print(f"{name:12s} FALHOU (código {e.returncode})")
+            error = e.stderr.decode("utf-8", "replace").strip()
+            if error:
+                print(error, file=sys.stderr)
+            continue
+        median = statistics.median(timings)
+        status = ""
+        if args.budget_ms is not None:
+            within = median <= args.budget_ms
+            failed |= not within
+            status = "ok" if within else f"ACIMA DO ORÇAMENTO ({args.budget_ms:.0f} ms)"
+        print(f"{name:12s} mediana {median:8.1f} ms  mín {min(timings):8.1f} ms  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
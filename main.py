@@ -1,9 +1,16 @@
-from View.gui import TruthTableGUI
+import sys
 
 if __name__ == "__main__":
     """
     Ponto de entrada principal do aplicativo.
-    Inicializa a interface gráfica da calculadora de tabela verdade.
+    Sem argumentos, inicializa a interface gráfica da calculadora de tabela verdade;
+    com um subcomando (por exemplo, "batch"), executa o modo sem interface gráfica.
     """
+    if len(sys.argv) > 1:
+        # O modo sem interface gráfica nunca importa o tkinter
+        from Controller.batch_cli import main
+        sys.exit(main(sys.argv[1:]))
+
+    from View.gui import TruthTableGUI
     app = TruthTableGUI()
     app.show_input_window()
\ No newline at end of file
@@ -0,0 +1,158 @@
+import os
+import random
+import sys
+from itertools import product
+
+import pytest
+
+# O projeto não é instalado como pacote: os testes importam os módulos a partir da raiz
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from Model.expression_processor import ExpressionProcessor
+from Model.formula_handler import FormulaHandler
+from Model.parser import Parser
+from Model.truth_table_generator import TruthTableGenerator
+
+FBF_DIR = os.path.join(ROOT, "FBF")
+
+BINARY_OPERATORS = ("^", "v", "x", "->", "<->")
+
+
+class ParsedFormula:
+    """
+    Fórmula analisada usada nos testes, com o parser e o gerador de tabelas.
+    """
+
+    def __init__(self, text):
+        """
+        Analisa uma expressão.
+
+        Args:
+            text (str): Expressão lógica
+        """
+        self.text = text
+        tokens, _, self.variables = ExpressionProcessor.lex(text)
+        self.parser = Parser(tokens, self.variables)
+        self.expression = self.parser.parse()
+        self.generator = TruthTableGenerator(FormulaHandler(self.parser))
+
+    def truth_values(self):
+        """
+        Avalia a fórmula principal em todas as linhas com o avaliador de referência
+        (TruthTableGenerator.evaluate, nó a nó, sem compilação).
+
+        Returns:
+            list: Valor (0 ou 1) da fórmula em cada linha, na ordem canônica
+        """
+        return [int(self.generator.evaluate(self.expression, dict(zip(self.variables, map(bool, row)))))
+                for row in product((0, 1), repeat=len(self.variables))]
+
+    def true_rows(self):
+        """
+        Retorna as valorações que tornam a fórmula verdadeira.
+
+        Returns:
+            list: Dicionários {variável: 0 ou 1}, na ordem das linhas
+        """
+        rows = product((0, 1), repeat=len(self.variables))
+        return [dict(zip(self.variables, row)) for row, value in zip(rows, self.truth_values()) if value]
+
+    def value_at(self, assignment):
+        """
+        Avalia a fórmula em uma valoração.
+
+        Args:
+            assignment (dict): Valor de cada variável
+
+        Returns:
+            int: Valor (0 ou 1) da fórmula
+        """
+        return int(self.generator.evaluate(self.expression, {var: bool(assignment[var]) for var in self.variables}))
+
+
+def check_classification(formula, result):
+    """
+    Confere o resultado de TruthTableGenerator.classify com a enumeração da tabela.
+
+    Args:
+        formula (ParsedFormula): Fórmula classificada
+        result (tuple): (classificação, valoração verdadeira, valoração falsa)
+    """
+    classification, true_assignment, false_assignment = result
+    values = formula.truth_values()
+    generator = formula.generator
+    if all(values):
+        assert classification == generator.TAUTOLOGY
+    elif not any(values):
+        assert classification == generator.CONTRADICTION
+    else:
+        assert classification == generator.CONTINGENCY
+    for target, assignment in ((1, true_assignment), (0, false_assignment)):
+        if assignment is None:
+            assert target not in values
+        else:
+            assert list(assignment) == formula.variables
+            assert formula.value_at(assignment) == target
+
+
+def random_formula(rng, variables, depth):
+    """
+    Gera o texto de uma fórmula aleatória.
+
+    Args:
+        rng (random.Random): Gerador de números aleatórios
+        variables (list): Variáveis que podem aparecer
+        depth (int): Profundidade máxima
+
+    Returns:
+        str: Expressão totalmente parentizada
+    """
+    if depth == 0 or rng.random() < 0.2:
+        return rng.choice(variables)
+    if rng.random() < 0.2:
+        return f"~({random_formula(rng, variables, depth - 1)})"
+    left = random_formula(rng, variables, depth - 1)
+    right = random_formula(rng, variables, depth - 1)
+    return f"({left}) {rng.choice(BINARY_OPERATORS)} ({right})"
+
+
+def random_formulas(seed, count, variables=("P", "Q", "R", "S"), depth=4):
+    """
+    Gera fórmulas aleatórias analisadas, de forma reprodutível.
+
+    Args:
+        seed (int): Semente
+        count (int): Número de fórmulas
+        variables (tuple, opcional): Variáveis que podem aparecer
+        depth (int, opcional): Profundidade máxima
+
+    Returns:
+        list: Fórmulas analisadas (ParsedFormula)
+    """
+    rng = random.Random(seed)
+    return [ParsedFormula(random_formula(rng, list(variables), depth)) for _ in range(count)]
+
+
+def fbf_formulas():
+    """
+    Lê todas as fórmulas dos arquivos de exemplo.
+
+    Returns:
+        list: Texto de cada fórmula
+    """
+    formulas = []
+    for name in sorted(os.listdir(FBF_DIR)):
+        if name.endswith(".txt"):
+            with open(os.path.join(FBF_DIR, name), encoding="utf-8") as f:
+                formulas.extend(line.strip() for line in f if line.strip())
+    return formulas
+
+
+@pytest.fixture
+def parse():
+    """
+    Fornece a função que analisa uma expressão (ParsedFormula).
+    """
+    return ParsedFormula
@@ -0,0 +1,77 @@
+import json
+import os
+
+from Controller.batch_cli import CHUNK_SIZE, PENDING_CHUNKS_PER_JOB, analyze_formula, iter_records, main
+from conftest import FBF_DIR
+
+
+def test_batch_classifies_every_formula(capsys):
+    path = os.path.join(FBF_DIR, "Tautologias.txt")
+    assert main(["batch", path]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    with open(path, encoding="utf-8") as f:
+        assert len(records) == sum(1 for line in f if line.strip())
+    assert {record["classification"] for record in records} == {"Tautologia"}
+
+
+def test_batch_reports_errors_and_continues(tmp_path, capsys):
+    path = tmp_path / "fbfs.txt"
+    path.write_text("P ^ Q\nP ^\n# comentário\nP v ~P\n", encoding="utf-8")
+    assert main(["batch", str(path), "--tables"]) == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["line"] for record in records] == [1, 2, 4]
+    assert records[1]["error"] is not None
+    assert records[0]["table"]["rows"] == [[0, 0, 0], [0, 1, 0], [1, 0, 0], [1, 1, 1]]
+    assert records[2]["classification"] == "Tautologia"
+
+
+def test_parallel_batch_matches_serial(capsys):
+    path = os.path.join(FBF_DIR, "Formulas complexas.txt")
+    assert main(["batch", path, "--tables"]) == 0
+    serial = capsys.readouterr().out
+    assert main(["batch", path, "--tables", "--jobs", "2"]) == 0
+    assert capsys.readouterr().out == serial
+
+
+def test_parallel_records_read_input_in_a_bounded_window():
+    read = []
+
+    def items():
+        for line in range(1, 20001):
+            read.append(line)
+            yield "f.txt", line, 0, "P v ~P", False, 16, None, None, None
+
+    records = iter_records(items(), jobs=2)
+    assert next(records)["line"] == 1
+    # Só os blocos em andamento foram lidos, não a entrada inteira
+    assert len(read) <= (2 * PENDING_CHUNKS_PER_JOB + 1) * CHUNK_SIZE
+    assert [record["line"] for record in records] == list(range(2, 20001))
+
+def test_equiv_groups_formulas(tmp_path, capsys):
+    path = tmp_path / "fbfs.txt"
+    path.write_text("~(P ^ Q)\nP -> Q\n~P v ~Q\n~Q -> ~P\nP\n", encoding="utf-8")
+    assert main(["equiv", str(path)]) == 0
+    classes = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [[member["line"] for member in record["formulas"]] for record in classes] == [[1, 3], [2, 4], [5]]
+
+
+def test_undecodable_line_is_reported_and_skipped(tmp_path, capsys):
+    path = tmp_path / "fbfs.txt"
+    path.write_bytes(b"P ^ Q\n\xff\xfe\nP v ~P\n# comentario\nQ -> R\n")
+    assert main(["batch", str(path)]) == 1
+    out, err = capsys.readouterr()
+    records = [json.loads(line) for line in out.splitlines()]
+    assert [record["line"] for record in records] == [1, 2, 3, 5]
+    assert records[1]["formula"] is None and "linha 2" in records[1]["error"]
+    assert [record["classification"] for record in records[2:]] == ["Tautologia", "Contingência"]
+    assert "4 fórmulas" in err and "1 erros" in err
+
+    assert main(["equiv", str(path)]) == 1
+    classes = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert sorted(member["line"] for record in classes for member in record["formulas"]) == [1, 3, 5]
+
+
+def test_profile_counts_shared_nodes():
+    item = ("f.txt", 1, 0, "(P ^ Q) v (P ^ Q)", False, 20, None, None, "stats")
+    stats, _ = analyze_formula(item)["profile"]
+    assert stats["counters"]["shared_nodes"] == 3
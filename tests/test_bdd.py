@@ -0,0 +1,59 @@
+import pytest
+
+from Model.bdd import BDD, NodeLimitExceeded
+from conftest import random_formulas
+
+
+@pytest.fixture(scope="module")
+def formulas():
+    return random_formulas(seed=3, count=150)
+
+
+def test_count_models_matches_truth_table(formulas):
+    for formula in formulas:
+        bdd = BDD(formula.variables)
+        edge = bdd.from_formula(formula.expression)
+        assert bdd.count_models(edge) == sum(formula.truth_values()), formula.text
+
+
+def test_count_models_does_not_depend_on_order(formulas):
+    for formula in formulas:
+        bdd = BDD(list(reversed(formula.variables)))
+        edge = bdd.from_formula(formula.expression)
+        assert bdd.count_models(edge) == sum(formula.truth_values()), formula.text
+
+
+def test_iter_models_lists_true_rows_in_order(formulas):
+    for formula in formulas:
+        bdd = BDD(formula.variables)
+        assert list(bdd.iter_models(bdd.from_formula(formula.expression))) == formula.true_rows(), formula.text
+
+
+def test_constants_and_witnesses(formulas):
+    for formula in formulas:
+        bdd = BDD(BDD.appearance_order(formula.expression, formula.variables))
+        edge = bdd.from_formula(formula.expression)
+        values = formula.truth_values()
+        assert (edge == BDD.TRUE) == all(values)
+        assert (edge == BDD.FALSE) == (not any(values))
+        for target, candidate in ((1, edge), (0, edge ^ 1)):
+            assignment = bdd.any_assignment(candidate)
+            if assignment is None:
+                assert target not in values
+            else:
+                assert formula.value_at(assignment) == target
+
+
+def test_equivalent_formulas_share_an_edge(parse):
+    first = parse("~(P ^ Q) v R")
+    second = parse("(P -> (Q -> R))")
+    third = parse("P -> R")
+    bdd = BDD(["P", "Q", "R"])
+    assert bdd.equivalent(bdd.from_formula(first.expression), bdd.from_formula(second.expression))
+    assert not bdd.equivalent(bdd.from_formula(first.expression), bdd.from_formula(third.expression))
+
+
+def test_node_limit(parse):
+    formula = parse(" x ".join(f"A{i}" for i in range(12)) + " ^ (B0 v B1 v B2)")
+    with pytest.raises(NodeLimitExceeded):
+        BDD(formula.variables, node_limit=4).from_formula(formula.expression)
@@ -0,0 +1,94 @@
+import gc
+import random
+import tracemalloc
+from itertools import product
+
+import pytest
+
+from Model.compact_formula import CompactFormula
+from Model.formula_cache import FormulaCache
+from Model.logical_operations import LogicalOperations
+from Model.truth_table import TruthTable
+from Model.truth_table_generator import TruthTableGenerator
+from conftest import ParsedFormula, random_formulas
+
+
+def render_tree(node, op_symbols):
+    """Texto de referência, convertido recursivamente a partir da árvore."""
+    if isinstance(node, str):
+        return node
+    args = [arg if isinstance(arg, str) else f"({render_tree(arg, op_symbols)})" for arg in node[1:]]
+    if node[0] is LogicalOperations.not_op:
+        return f"~{args[0]}"
+    return f"{args[0]} {op_symbols[node[0]]} {args[1]}"
+
+
+def test_render_matches_tree():
+    for formula in random_formulas(seed=14, count=100):
+        compact, tree_nodes = CompactFormula.encode([formula.expression], formula.variables)
+        texts = compact.render(formula.parser.op_symbols)
+        assert texts == [render_tree(node, formula.parser.op_symbols) for node in tree_nodes], formula.text
+
+
+def test_subformula_outputs_follow_column_order():
+    formula = ParsedFormula("(P -> Q) <-> (~P v Q)")
+    compact = CompactFormula.from_subformulas(formula.expression, formula.variables)
+    texts = compact.render(formula.parser.op_symbols)
+    assert [texts[i] for i in compact.outputs] == ["P → Q", "~P", "(~P) v Q", "(P → Q) ↔ ((~P) v Q)"]
+    assert [text for text, _ in formula.generator.sorted_subformulas(formula.expression)] == \
+        [texts[i] for i in compact.outputs]
+
+
+def test_bytes_round_trip():
+    for formula in random_formulas(seed=15, count=50):
+        compact = CompactFormula.from_subformulas(formula.expression, formula.variables)
+        loaded = CompactFormula.from_bytes(compact.to_bytes())
+        assert loaded.variables == compact.variables
+        assert (loaded.opcodes, loaded.operands, loaded.outputs) == (compact.opcodes, compact.operands, compact.outputs)
+    data = compact.to_bytes()
+    for bad in (data[:5], data[:-1], b"XXXX" + data[4:]):
+        with pytest.raises(ValueError):
+            CompactFormula.from_bytes(bad)
+
+
+def test_compact_table_matches_evaluation():
+    for formula in random_formulas(seed=16, count=50):
+        compact = CompactFormula.from_subformulas(formula.expression, formula.variables)
+        texts = compact.render(formula.parser.op_symbols)
+        chunks = TruthTableGenerator.iter_compact_table(compact, [texts[i] for i in compact.outputs], chunk_rows=3)
+        table = TruthTable.concat(list(chunks))
+        assert [row[-1] for row in table.iter_rows()] == formula.truth_values(), formula.text
+        assert [row[:len(formula.variables)] for row in table.iter_rows()] == \
+            [list(values) for values in product((0, 1), repeat=len(formula.variables))]
+
+
+def retained_bytes(build):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()
+        gc.collect()
+        return kept, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def test_cached_formula_is_much_smaller_than_the_tree():
+    rng = random.Random(17)
+    variables = [f"A{i}" for i in range(200)]
+
+    def build(depth):
+        if depth == 0:
+            return rng.choice(variables)
+        return f"({build(depth - 1)} {rng.choice(['^', 'v', '->', 'x', '<->'])} {build(depth - 1)})"
+
+    def parse_with_subformulas():
+        # O que a entrada do cache guardava antes: parser, árvore e subfórmulas com seus textos
+        formula = ParsedFormula(text)
+        return formula, formula.generator.sorted_subformulas(formula.expression)
+
+    text = build(13)
+    _, tree_bytes = retained_bytes(parse_with_subformulas)
+    entry, entry_bytes = retained_bytes(lambda: FormulaCache().get_formula(text))
+    assert len(entry.formula) > 5000
+    assert 10 * entry_bytes < tree_bytes
@@ -0,0 +1,64 @@
+from itertools import product
+
+import pytest
+
+from Model.equivalence_checker import EquivalenceChecker
+from conftest import ParsedFormula, random_formulas
+
+
+def table_over(formula, variables):
+    return tuple(formula.value_at(dict(zip(variables, row))) for row in product((0, 1), repeat=len(variables)))
+
+
+@pytest.mark.parametrize("max_nodes", [EquivalenceChecker.MAX_BDD_NODES, 1])
+def test_find_difference_matches_truth_tables(max_nodes):
+    checker = EquivalenceChecker()
+    checker.MAX_BDD_NODES = max_nodes
+    formulas = random_formulas(seed=10, count=40, variables=("P", "Q", "R"), depth=3)
+    for first in formulas:
+        for second in formulas:
+            variables = sorted(set(first.variables) | set(second.variables))
+            difference = checker.find_difference(first.expression, first.variables,
+                                                 second.expression, second.variables)
+            if table_over(first, variables) == table_over(second, variables):
+                assert difference is None, (first.text, second.text)
+            else:
+                assert list(difference) == variables
+                assert first.value_at(difference) != second.value_at(difference), (first.text, second.text)
+
+
+def test_signatures_are_deterministic():
+    formula = ParsedFormula("(P -> Q) ^ R")
+    assert EquivalenceChecker(seed=1).signature(formula.expression, formula.variables) == \
+        EquivalenceChecker(seed=1).signature(formula.expression, formula.variables)
+
+
+def test_difference_hidden_from_signatures_is_found():
+    variables = [f"A{i}" for i in range(24)]
+    conjunction = ParsedFormula(" ^ ".join(variables))
+    # Difere da conjunção apenas na linha em que todas as variáveis são falsas
+    widened = ParsedFormula("(" + " ^ ".join(variables) + ") v (" + " ^ ".join("~" + var for var in variables) + ")")
+    checker = EquivalenceChecker()
+    assert checker.signature(conjunction.expression, variables) == checker.signature(widened.expression, variables)
+    assert checker.find_difference(conjunction.expression, variables, widened.expression, variables) == \
+        dict.fromkeys(variables, 0)
+
+
+@pytest.mark.parametrize("max_nodes", [EquivalenceChecker.MAX_BDD_NODES, 1])
+def test_group_matches_truth_tables(max_nodes):
+    checker = EquivalenceChecker()
+    checker.MAX_BDD_NODES = max_nodes
+    formulas = random_formulas(seed=11, count=200, variables=("P", "Q", "R"), depth=3)
+    variables = ["P", "Q", "R"]
+    expected = {}
+    for index, formula in enumerate(formulas):
+        expected.setdefault(table_over(formula, variables), []).append(index)
+    classes = checker.group((formula.expression, formula.variables) for formula in formulas)
+    assert classes == sorted(expected.values())
+
+
+def test_de_morgan_pairs_are_equivalent():
+    checker = EquivalenceChecker()
+    for left, right in [("~(P ^ Q)", "~P v ~Q"), ("~(P v Q)", "~P ^ ~Q"), ("P -> Q", "~Q -> ~P")]:
+        first, second = ParsedFormula(left), ParsedFormula(right)
+        assert checker.equivalent(first.expression, first.variables, second.expression, second.variables)
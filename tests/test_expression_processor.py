@@ -0,0 +1,23 @@
+import pytest
+
+from Model.expression_processor import ExpressionProcessor
+
+
+def test_lex_rejects_invalid_characters_with_position():
+    with pytest.raises(ValueError, match=r"Caractere incorreto: & \(posição 2\)"):
+        ExpressionProcessor.lex("P & Q")
+
+
+def test_lex_tokens_spans_and_variables():
+    text = "Q1  ∧ ¬(P → abc)"
+    tokens, spans, variables = ExpressionProcessor.lex(text)
+    assert tokens == ["Q1", "^", "~", "(", "P", "->", "abc", ")"]
+    assert [text[spans[2 * i]:spans[2 * i + 1]] for i in range(len(tokens))] == \
+        ["Q1", "∧", "¬", "(", "P", "→", "abc", ")"]
+    assert variables == ["P", "Q1", "abc"]
+
+
+def test_v_and_x_inside_names_are_not_operators():
+    tokens, _, variables = ExpressionProcessor.lex("PvQ v x1 x Rx")
+    assert tokens == ["PvQ", "v", "x1", "x", "Rx"]
+    assert variables == ["PvQ", "Rx", "x1"]
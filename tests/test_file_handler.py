@@ -0,0 +1,82 @@
+import pytest
+
+from Controller.file_handler import FbfFileError, FileHandler
+
+CONTENT = "\ufeffP ^ Q\n\n  # comentário\n  P v ~P  \r\nQ -> R".encode("utf-8")
+
+
+@pytest.fixture
+def fbf_file(tmp_path):
+    path = tmp_path / "fbfs.txt"
+    path.write_bytes(CONTENT)
+    return str(path)
+
+
+@pytest.fixture
+def bad_file(tmp_path):
+    path = tmp_path / "bad.txt"
+    path.write_bytes(b"P ^ Q\n\xff\xfe\nP v ~P\n# comentario\nQ -> R\n")
+    return str(path)
+
+
+def test_records_have_line_numbers_and_offsets(fbf_file):
+    records = list(FileHandler.iter_fbf_records(fbf_file))
+    assert [(line, fbf) for line, _, fbf in records] == [(1, "P ^ Q"), (4, "P v ~P"), (5, "Q -> R")]
+    for _, offset, fbf in records:
+        assert CONTENT[offset:].decode("utf-8").strip().startswith(fbf)
+    assert [line for line, _, _ in FileHandler.iter_fbf_records(fbf_file, comment_prefix=None)] == [1, 3, 4, 5]
+
+
+def test_undecodable_line_does_not_stop_reading(bad_file):
+    records = list(FileHandler.iter_fbf_records(bad_file))
+    assert [line for line, _, _ in records] == [1, 2, 3, 5]
+    line, offset, error = records[1]
+    assert isinstance(error, FbfFileError)
+    assert (error.line_number, error.byte_offset, offset) == (2, 6, 6)
+    assert [fbf for _, _, fbf in records[2:]] == ["P v ~P", "Q -> R"]
+
+
+def test_list_readers_raise_on_undecodable_line(bad_file):
+    with pytest.raises(FbfFileError, match="linha 2"):
+        FileHandler.read_fbfs_from_file(bad_file)
+    with pytest.raises(FbfFileError):
+        list(FileHandler.iter_fbfs(bad_file))
+
+
+def test_empty_and_missing_files(tmp_path):
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert FileHandler.read_fbfs_from_file(str(empty)) == []
+    with pytest.raises(ValueError):
+        list(FileHandler.iter_fbf_records(str(tmp_path / "missing.txt")))
+
+
+def test_index_reads_any_record_directly(fbf_file, bad_file):
+    for path in (fbf_file, bad_file):
+        records = list(FileHandler.iter_fbf_records(path))
+        index = FileHandler.build_index(path)
+        try:
+            assert len(index) == len(records)
+            for k in [*range(len(records)), -1]:
+                line, offset, fbf = index[k]
+                assert (line, offset) == records[k][:2]
+                if isinstance(records[k][2], FbfFileError):
+                    assert str(fbf) == str(records[k][2])
+                else:
+                    assert fbf == records[k][2]
+            with pytest.raises(IndexError):
+                index[len(records)]
+        finally:
+            index.close()
+
+
+def test_index_detects_changed_file(tmp_path):
+    path = tmp_path / "fbfs.txt"
+    path.write_bytes(b"P\nQ\nR\n")
+    index = FileHandler.build_index(str(path))
+    path.write_bytes(b"P\nQ\n\n\n")
+    try:
+        with pytest.raises(ValueError, match="mudou"):
+            index[2]
+    finally:
+        index.close()
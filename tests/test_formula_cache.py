@@ -0,0 +1,86 @@
+import pytest
+
+from Model.formula_cache import FormulaCache
+from Model.stats import Stats
+from Model.table_store import TableStore
+from Model.truth_table import TruthTable
+from Model.truth_table_generator import TruthTableGenerator
+
+
+def build_table(entry):
+    _, subformula_texts = entry.render()
+    return TruthTable.concat(list(TruthTableGenerator.iter_compact_table(entry.formula, subformula_texts)))
+
+
+def test_same_formula_returns_same_entry():
+    cache = FormulaCache()
+    entry = cache.get_formula("P ^ (Q v R)")
+    assert cache.get_formula("P ^ (Q v R)") is entry
+    # Espaços e parênteses redundantes não mudam a chave
+    assert cache.get_formula("  P ^ (Q  v R) ") is entry
+    assert cache.get_formula("(P ^ ((Q v R)))") is entry
+    assert cache.get_formula("P ∧ (Q ∨ R)") is entry
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["misses"] == 1 and stats["hits"] == 4
+
+
+def test_canonical_key_distinguishes_structure():
+    cache = FormulaCache()
+    assert cache.get_formula("(P ^ Q) v R").key != cache.get_formula("P ^ (Q v R)").key
+
+
+def test_table_round_trip():
+    cache = FormulaCache()
+    entry = cache.get_formula("(P -> Q) <-> (~Q -> ~P)")
+    assert cache.get_table(entry) is None
+    table = build_table(entry)
+    cache.put_table(entry, table, "Tautologia")
+    assert cache.get_table(entry) is table
+    assert entry.classification == "Tautologia"
+    stats = cache.stats()
+    assert stats["table_misses"] == 1 and stats["table_hits"] == 1
+
+
+def test_invalid_expression():
+    with pytest.raises(ValueError):
+        FormulaCache().get_formula("P ^")
+
+
+def test_eviction_keeps_text_index_and_budget_consistent():
+    cache = FormulaCache(max_bytes=64 * 1024)
+    for i in range(2000):
+        cache.get_formula(f"A{i} ^ (B v C{i % 7})")
+        if i % 3 == 0:
+            cache.get_formula(f"A{i}  ^ ( B v C{i % 7} )")
+    assert cache.stats()["evictions"] > 0
+    assert cache.current_bytes <= cache.max_bytes
+    assert cache.current_bytes == sum(entry.nbytes for entry in cache.entries.values())
+    indexed = {text: entry.key for entry in cache.entries.values() for text in entry.text_keys}
+    assert indexed == cache.text_index
+
+
+def test_tables_are_reloaded_from_disk(tmp_path):
+    expression = " <-> ".join("ABCDEFGH")
+    cache = FormulaCache(store=TableStore(str(tmp_path), min_rows=1))
+    entry = cache.get_formula(expression)
+    table = build_table(entry)
+    cache.put_table(entry, table, "Contingência")
+
+    reopened = FormulaCache(store=TableStore(str(tmp_path), min_rows=1))
+    loaded_entry = reopened.get_formula("(" + expression + ")")
+    loaded = reopened.get_table(loaded_entry)
+    assert loaded.equals(table)
+    assert loaded_entry.classification == "Contingência"
+    assert reopened.stats()["disk_hits"] == 1
+
+
+def test_stats_count_shared_nodes_on_parse():
+    cache = FormulaCache()
+    stats = Stats()
+    cache.get_formula("(P -> Q) <-> (~P v Q)", stats=stats)
+    # Um acerto pelo texto não analisa a expressão de novo
+    cache.get_formula("(P -> Q) <-> (~P v Q)", stats=stats)
+    counters = stats.as_dict()["counters"]
+    assert counters["shared_nodes"] == 2
+    assert counters["formula_cache_hits"] == 1
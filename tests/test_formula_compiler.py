@@ -0,0 +1,21 @@
+from itertools import product
+
+from Model.formula_compiler import FormulaCompiler
+from conftest import random_formulas
+
+
+def test_compiled_rows_match_evaluate():
+    for formula in random_formulas(seed=12, count=100):
+        function = FormulaCompiler(formula.variables).compile([formula.expression])
+        for values in product((0, 1), repeat=len(formula.variables)):
+            assert function(values) == (formula.value_at(dict(zip(formula.variables, values))),), formula.text
+
+
+def test_compiled_columns_match_evaluate():
+    for formula in random_formulas(seed=13, count=100):
+        num_rows = 1 << len(formula.variables)
+        # Coluna de cada variável empacotada em um inteiro: bit r = valor na linha r
+        columns = tuple(sum(1 << row for row, values in enumerate(product((0, 1), repeat=len(formula.variables)))
+                            if values[i]) for i in range(len(formula.variables)))
+        (column,) = FormulaCompiler(formula.variables).compile([formula.expression])(columns, (1 << num_rows) - 1)
+        assert [column >> row & 1 for row in range(num_rows)] == formula.truth_values(), formula.text
@@ -0,0 +1,33 @@
+import random
+from itertools import product
+
+import pytest
+
+from Model.model_counter import ModelCounter
+from conftest import random_formulas
+
+
+def brute_force_count(num_vars, clauses):
+    return sum(all(any(values[abs(lit) - 1] == (lit > 0) for lit in clause) for clause in clauses)
+               for values in product((False, True), repeat=num_vars))
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_count_matches_brute_force(seed):
+    rng = random.Random(seed)
+    num_vars = rng.randint(1, 10)
+    clauses = [[rng.choice((-1, 1)) * rng.randint(1, num_vars) for _ in range(rng.randint(1, 3))]
+               for _ in range(rng.randint(0, 3 * num_vars))]
+    assert ModelCounter(num_vars).count(clauses) == brute_force_count(num_vars, clauses)
+
+
+def test_variables_outside_clauses_are_free():
+    assert ModelCounter(5).count([[1, 2]]) == 3 * 2 ** 3
+    assert ModelCounter(3).count([]) == 8
+    assert ModelCounter(2).count([[1], [-1]]) == 0
+
+
+def test_count_formula_matches_truth_table():
+    for formula in random_formulas(seed=4, count=150):
+        assert ModelCounter.count_formula(formula.expression, formula.variables) == \
+            sum(formula.truth_values()), formula.text
@@ -0,0 +1,93 @@
+import pytest
+
+from Model.expression_processor import ExpressionProcessor
+from Model.logical_operations import LogicalOperations
+from Model.parser import Parser, ParseError
+
+
+def parse_text(text):
+    tokens, _, variables = ExpressionProcessor.lex(text)
+    return Parser(tokens, variables).parse()
+
+
+def test_equal_subtrees_are_shared():
+    node = parse_text("(P ^ Q) v (P ^ Q)")
+    assert node[1] is node[2]
+
+
+def test_node_ids_follow_topological_order():
+    tokens, _, variables = ExpressionProcessor.lex("(P -> Q) <-> (~P v Q)")
+    parser = Parser(tokens, variables)
+    root = parser.parse()
+    order = parser.topological_order(root)
+    assert [parser.node_id(node) for node in order] == list(range(len(order)))
+    assert order[-1] is root
+    for node in order:
+        if isinstance(node, tuple):
+            assert all(parser.node_id(arg) < parser.node_id(node) for arg in node[1:])
+
+
+@pytest.mark.parametrize("text, shared", [
+    ("P ^ Q", 0),
+    ("(P ^ Q) v (P ^ Q)", 3),
+    ("(P -> Q) <-> (~P v Q)", 2),
+])
+def test_shared_node_count(text, shared):
+    tokens, _, variables = ExpressionProcessor.lex(text)
+    parser = Parser(tokens, variables)
+    assert parser.shared_node_count(parser.parse()) == shared
+
+
+@pytest.mark.parametrize("text, position, message", [
+    ("P ^", 2, "Token incorreto: None"),
+    ("(P ^ Q", 4, "Esperado parêntese de fechamento."),
+    ("P Q", 1, "Token inesperado: Q"),
+    ("P ^ ) Q", 2, "Token incorreto: )"),
+    (") P", 0, "Token incorreto: )"),
+    ("P v Q)", 3, "Token inesperado: )"),
+    ("~", 1, "Token incorreto: None"),
+    ("", 0, "Token incorreto: None"),
+])
+def test_parse_error_positions(text, position, message):
+    with pytest.raises(ParseError) as raised:
+        parse_text(text)
+    assert raised.value.position == position
+    assert str(raised.value) == f"{message} (token {position})"
+
+
+def test_parse_error_position_maps_to_characters():
+    text = "(P ^ Q) v ^ R"
+    tokens, spans, variables = ExpressionProcessor.lex(text)
+    with pytest.raises(ParseError) as raised:
+        Parser(tokens, variables).parse()
+    position = raised.value.position
+    assert text[spans[2 * position]:spans[2 * position + 1]] == "^"
+
+
+def test_parse_error_is_value_error():
+    with pytest.raises(ValueError):
+        parse_text("P ->")
+
+
+def test_binary_operators_associate_left():
+    node = parse_text("P -> Q -> R")
+    assert node[0] is LogicalOperations.imp_op
+    assert node[1][0] is LogicalOperations.imp_op
+    assert node[2] == "R"
+
+
+def test_negation_applies_to_next_operand():
+    node = parse_text("~P ^ Q")
+    assert node[0] is LogicalOperations.and_op
+    assert node[1] == (LogicalOperations.not_op, "P")
+
+
+@pytest.mark.parametrize("text", [
+    "(" * 20000 + "P" + ")" * 20000,
+    "~" * 20000 + "P",
+    " ^ ".join(["P"] * 20000),
+])
+def test_deep_nesting_does_not_recurse(text, parse):
+    formula = parse(text)
+    # O avaliador de referência também percorre o DAG com pilha explícita
+    formula.value_at({"P": 1})
@@ -0,0 +1,89 @@
+import random
+from itertools import product
+
+import pytest
+
+from Model.sat_solver import SatSolver, TseitinEncoder
+from conftest import check_classification, random_formulas
+
+
+def brute_force_satisfiable(num_vars, clauses):
+    for values in product((False, True), repeat=num_vars):
+        if all(any(values[abs(lit) - 1] == (lit > 0) for lit in clause) for clause in clauses):
+            return True
+    return False
+
+
+def pigeonhole_clauses(holes):
+    """Cláusulas de holes + 1 pombos em holes casas (insatisfatível)."""
+    def var(pigeon, hole):
+        return pigeon * holes + hole + 1
+    clauses = [[var(p, h) for h in range(holes)] for p in range(holes + 1)]
+    for h in range(holes):
+        for p in range(holes + 1):
+            for q in range(p + 1, holes + 1):
+                clauses.append([-var(p, h), -var(q, h)])
+    return (holes + 1) * holes, clauses
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_cnf_matches_brute_force(seed):
+    rng = random.Random(seed)
+    num_vars = rng.randint(3, 10)
+    clauses = [[rng.choice((-1, 1)) * rng.randint(1, num_vars) for _ in range(3)]
+               for _ in range(rng.randint(1, 5 * num_vars))]
+    solver = SatSolver(num_vars)
+    for clause in clauses:
+        solver.add_clause(clause)
+    satisfiable = solver.solve()
+    assert satisfiable == brute_force_satisfiable(num_vars, clauses)
+    if satisfiable:
+        assert all(any(solver.model[abs(lit)] == (lit > 0) for lit in clause) for clause in clauses)
+
+
+@pytest.mark.parametrize("holes", [2, 3, 4, 5])
+def test_pigeonhole_is_unsatisfiable(holes):
+    num_vars, clauses = pigeonhole_clauses(holes)
+    solver = SatSolver(num_vars)
+    for clause in clauses:
+        solver.add_clause(clause)
+    assert not solver.solve()
+
+
+def test_clauses_can_be_added_after_solving():
+    solver = SatSolver(2)
+    solver.add_clause([1, 2])
+    assert solver.solve()
+    solver.add_clause([-1])
+    assert solver.solve()
+    assert solver.model[2]
+    solver.add_clause([-2])
+    assert not solver.solve()
+
+
+def test_find_assignment_matches_enumeration():
+    for formula in random_formulas(seed=1, count=200):
+        rows = formula.truth_values()
+        for value in (True, False):
+            assignment = TseitinEncoder(formula.variables).find_assignment(formula.expression, value)
+            if assignment is None:
+                assert int(value) not in rows, formula.text
+            else:
+                assert list(assignment) == formula.variables
+                assert formula.value_at(assignment) == int(value), formula.text
+
+
+def test_iter_assignments_enumerates_every_model_once():
+    for formula in random_formulas(seed=2, count=60):
+        models = list(TseitinEncoder(formula.variables).iter_assignments(formula.expression))
+        as_rows = sorted(tuple(model[var] for var in formula.variables) for model in models)
+        expected = sorted(tuple(model[var] for var in formula.variables) for model in formula.true_rows())
+        assert as_rows == expected, formula.text
+
+
+def test_classify_through_sat_matches_truth_table():
+    for formula in random_formulas(seed=6, count=80):
+        # Sem enumeração e com o BDD interrompido no primeiro nó, classify decide pelo SAT
+        formula.generator.MAX_ENUMERATION_VARIABLES = 0
+        formula.generator.MAX_CLASSIFY_BDD_NODES = 1
+        check_classification(formula, formula.generator.classify(formula.expression, formula.variables))
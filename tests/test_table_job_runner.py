@@ -0,0 +1,134 @@
+import threading
+
+import pytest
+
+from Controller.table_job_runner import TableJobRunner
+from Model.truth_table import TruthTable
+from Model.truth_table_generator import TruthTableGenerator
+
+FINAL_EVENTS = ("done", "cancelled", "error")
+
+
+def wait_for(runner, job_id, timeout=30):
+    """
+    Espera o fim de um pedido e retorna os eventos produzidos para ele.
+    """
+    events = []
+    while True:
+        event = runner.events.get(timeout=timeout)
+        if event[1] == job_id:
+            events.append(event)
+            if event[0] in FINAL_EVENTS:
+                return events
+
+
+def test_done_event_with_progress(parse):
+    runner = TableJobRunner(chunk_rows=4, profile=True)
+    job_id = runner.submit("(P -> Q) <-> (~Q -> ~P) ^ (R v S)")
+    events = wait_for(runner, job_id)
+    assert events[0] == ("started", job_id, "(P -> Q) <-> (~Q -> ~P) ^ (R v S)")
+    assert [event[2:] for event in events if event[0] == "progress"] == [(4, 16), (8, 16), (12, 16), (16, 16)]
+    kind, _, result = events[-1]
+    assert kind == "done"
+    formula = parse("(P -> Q) <-> (~Q -> ~P) ^ (R v S)")
+    assert result["variables"] == formula.variables
+    assert result["table"].equals(formula.generator.generate_packed_table(formula.expression, formula.variables))
+    assert result["classification"] == TruthTableGenerator.CONTINGENCY
+    assert result["stats"].enabled
+
+
+def test_cache_hit_reuses_table():
+    runner = TableJobRunner()
+    first = wait_for(runner, runner.submit("P v ~P"))[-1][2]
+    events = wait_for(runner, runner.submit("(P  v  (~P))"))
+    assert events[-1][0] == "done"
+    result = events[-1][2]
+    assert result["table"] is first["table"]
+    assert result["classification"] == TruthTableGenerator.TAUTOLOGY
+    assert [event for event in events if event[0] == "progress"] == [("progress", events[0][1], 2, 2)]
+    assert result["cache_stats"]["table_hits"] == 1
+
+
+def test_invalid_expression_reports_error():
+    runner = TableJobRunner()
+    events = wait_for(runner, runner.submit("P ^"))
+    assert events[-1][0] == "error"
+    # O executor continua atendendo os pedidos seguintes
+    assert wait_for(runner, runner.submit("P"))[-1][0] == "done"
+
+
+def test_cancel_between_chunks(monkeypatch):
+    original = TruthTableGenerator.iter_compact_table
+    proceed = threading.Event()
+
+    def slow_chunks(*args, **kwargs):
+        for chunk in original(*args, **kwargs):
+            yield chunk
+            proceed.wait(30)
+
+    monkeypatch.setattr(TruthTableGenerator, "iter_compact_table", staticmethod(slow_chunks))
+    runner = TableJobRunner(chunk_rows=4)
+    job_id = runner.submit("P ^ Q ^ R ^ S")
+    assert runner.events.get(timeout=30)[0] == "started"
+    assert runner.events.get(timeout=30)[0] == "progress"
+    assert runner.cancel_current()
+    proceed.set()
+    assert wait_for(runner, job_id)[-1] == ("cancelled", job_id)
+    assert runner.cache.stats()["table_hits"] == 0
+    assert not runner.cancel_current()
+
+
+@pytest.mark.parametrize("stage", ["last_chunk", "classify"])
+def test_cancel_after_last_chunk_is_not_cached(monkeypatch, stage):
+    runner = None
+    concatenated = []
+    original_chunks = TruthTableGenerator.iter_compact_table
+    original_concat = TruthTable.concat
+    original_classify = TruthTableGenerator.classify_fbf
+
+    def chunks_then_cancel(*args, **kwargs):
+        yield from original_chunks(*args, **kwargs)
+        if stage == "last_chunk":
+            runner.cancel_current()
+
+    def record_concat(tables):
+        concatenated.append(len(tables))
+        return original_concat(tables)
+
+    def classify_then_cancel(*args, **kwargs):
+        if stage == "classify":
+            runner.cancel_current()
+        return original_classify(*args, **kwargs)
+
+    monkeypatch.setattr(TruthTableGenerator, "iter_compact_table", staticmethod(chunks_then_cancel))
+    monkeypatch.setattr(TruthTable, "concat", staticmethod(record_concat))
+    monkeypatch.setattr(TruthTableGenerator, "classify_fbf", staticmethod(classify_then_cancel))
+    runner = TableJobRunner(chunk_rows=4096)
+    job_id = runner.submit("P ^ Q")
+    events = wait_for(runner, job_id)
+    assert events[-1] == ("cancelled", job_id)
+    assert concatenated == ([] if stage == "last_chunk" else [1])
+    entry = runner.cache.get_formula("P ^ Q")
+    assert entry.table is None and entry.classification is None
+
+
+def test_pending_count():
+    proceed = threading.Event()
+    original = TruthTableGenerator.iter_compact_table
+
+    def blocked_chunks(*args, **kwargs):
+        proceed.wait(30)
+        return original(*args, **kwargs)
+
+    runner = TableJobRunner()
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(TruthTableGenerator, "iter_compact_table", staticmethod(blocked_chunks))
+        first = runner.submit("P")
+        assert runner.events.get(timeout=30)[0] == "started"
+        runner.submit("Q")
+        last = runner.submit("R")
+        assert runner.pending_count() == 2
+        proceed.set()
+        wait_for(runner, first)
+    assert wait_for(runner, last)[-1][0] == "done"
+    assert runner.pending_count() == 0
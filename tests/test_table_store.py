@@ -0,0 +1,124 @@
+import json
+import os
+import random
+
+import pytest
+
+from Model.table_store import TableStore
+from Model.truth_table import TruthTable
+
+
+def random_table(rng, num_variables, start=0, num_rows=None):
+    if num_rows is None:
+        num_rows = (1 << num_variables) - start
+    columns = [f"V{i}" for i in range(num_variables)] + ["f", "g"]
+    bits = [rng.getrandbits(num_rows) for _ in columns]
+    return TruthTable(columns[:num_variables], columns, bits, start, num_rows)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TableStore(str(tmp_path), min_rows=1)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_round_trip(store, seed):
+    rng = random.Random(seed)
+    num_variables = rng.randint(1, 10)
+    start = rng.randrange(1 << num_variables)
+    table = random_table(rng, num_variables, start, rng.randint(1, (1 << num_variables) - start))
+    assert store.store("key", table, "Contingência")
+    # Todas as colunas começam alinhadas em 8 bytes
+    assert os.path.getsize(store.path("key")) % 8 == 0
+
+    loaded, classification = store.load("key")
+    assert classification == "Contingência"
+    assert loaded.equals(table)
+    assert list(loaded.iter_rows(block_rows=rng.randint(1, 20))) == list(table.iter_rows())
+    first = rng.randint(table.start, table.start + table.num_rows - 1)
+    last = rng.randint(first, table.start + table.num_rows)
+    assert list(loaded.iter_rows(first, last, 3)) == list(table.iter_rows(first, last, 3))
+    assert [loaded.value(row, "f") for row in range(first, last)] == \
+        [table.value(row, "f") for row in range(first, last)]
+
+
+def test_row_ranges_do_not_decode_columns(store):
+    table = random_table(random.Random(0), 16)
+    store.store("key", table, "Contingência")
+    loaded, _ = store.load("key")
+    assert list(loaded.iter_rows(40000, 40010)) == list(table.iter_rows(40000, 40010))
+    assert loaded._bits._decoded == {}
+
+
+def test_small_tables_are_not_stored(tmp_path):
+    store = TableStore(str(tmp_path), min_rows=1 << 10)
+    assert not store.store("key", random_table(random.Random(0), 4), "Contingência")
+    assert store.load("key") is None
+
+
+def test_missing_key(store):
+    assert store.load("missing") is None
+    assert store.misses == 1
+
+
+def write_raw(store, key, metadata, num_rows=8, magic=TableStore.MAGIC, version=TableStore.VERSION):
+    header = TableStore.HEADER.pack(magic, version, len(metadata), 0, num_rows)
+    os.makedirs(store.directory, exist_ok=True)
+    with open(store.path(key), "wb") as f:
+        f.write(header + metadata + bytes(64))
+
+
+@pytest.mark.parametrize("metadata", [
+    b"not json",
+    b"[]",
+    b'"text"',
+    b'{"columns": ["a"]}',
+    b'{"columns": 5, "variables": [], "classification": ""}',
+])
+def test_invalid_files_are_dropped(store, metadata):
+    write_raw(store, "bad", metadata)
+    assert store.load("bad") is None
+    assert not os.path.exists(store.path("bad"))
+
+
+def test_wrong_magic_or_version_is_dropped(store):
+    metadata = json.dumps({"columns": [], "variables": [], "classification": ""}).encode()
+    write_raw(store, "magic", metadata, magic=b"XXXX")
+    write_raw(store, "version", metadata, version=TableStore.VERSION - 1)
+    assert store.load("magic") is None
+    assert store.load("version") is None
+
+
+def test_eviction_respects_size_limit(tmp_path):
+    rng = random.Random(1)
+    store = TableStore(str(tmp_path), max_bytes=8000, min_rows=1)
+    for i in range(10):
+        store.store(f"t{i}", random_table(rng, 10), "Contingência")
+    files = [name for name in os.listdir(tmp_path) if name.endswith(TableStore.EXTENSION)]
+    assert sum(os.path.getsize(os.path.join(tmp_path, name)) for name in files) <= 8000
+    assert 1 < len(files) < 10
+    # A tabela mais recente é sempre mantida
+    assert store.load("t9") is not None
+
+
+def test_slices_use_decoded_columns(store):
+    table = random_table(random.Random(1), 12)
+    store.store("key", table, "Contingência")
+    loaded, _ = store.load("key")
+    loaded.column("f")
+    # Recortes de colunas já decodificadas não voltam ao arquivo
+    loaded._bits.memory = None
+    assert [loaded.value(row, "f") for row in range(100, 140)] == \
+        [table.value(row, "f") for row in range(100, 140)]
+    assert loaded._bits.slice_bits("f", 5, 3000) == (table.column("f") >> 5) & ((1 << 3000) - 1)
+
+
+def test_store_from_environment(tmp_path):
+    assert TableStore.from_environment({}) is None
+    store = TableStore.from_environment({"TABELA_VERDADE_CACHE": str(tmp_path),
+                                         "TABELA_VERDADE_CACHE_MB": "2"})
+    assert store.directory == str(tmp_path)
+    assert store.max_bytes == 2 * 1024 * 1024
+    assert TableStore.from_environment({"TABELA_VERDADE_CACHE": str(tmp_path)}).max_bytes == 1024 * 1024 * 1024
+    with pytest.raises(ValueError):
+        TableStore.from_environment({"TABELA_VERDADE_CACHE": str(tmp_path), "TABELA_VERDADE_CACHE_MB": "muito"})
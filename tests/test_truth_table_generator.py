@@ -0,0 +1,142 @@
+from itertools import product
+
+import pandas as pd
+import pytest
+
+from Model.stats import Stats
+from Model.truth_table import TruthTable
+from conftest import ParsedFormula, check_classification, fbf_formulas, random_formulas
+
+FORMULAS = fbf_formulas() + [formula.text for formula in random_formulas(seed=5, count=20, depth=5)]
+
+
+def reference_table(formula):
+    """Tabela de referência: cada subfórmula avaliada nó a nó, linha a linha."""
+    subformulas = formula.generator.sorted_subformulas(formula.expression)
+    rows = []
+    for values in product((0, 1), repeat=len(formula.variables)):
+        assignment = dict(zip(formula.variables, map(bool, values)))
+        rows.append(list(values) + [int(formula.generator.evaluate(node, assignment)) for _, node in subformulas])
+    return pd.DataFrame(rows, columns=formula.variables + [text for text, _ in subformulas])
+
+
+@pytest.mark.parametrize("text", FORMULAS)
+@pytest.mark.parametrize("engine", ["python", "numpy", "gray"])
+def test_engines_match_reference(text, engine):
+    formula = ParsedFormula(text)
+    expected = reference_table(formula)
+    table = formula.generator.generate_truth_table(formula.expression, formula.variables, engine=engine)
+    assert list(table.columns) == list(expected.columns)
+    assert (table.values == expected.values).all()
+
+
+# Com 6 variáveis, a tabela é dividida entre os processos (ParallelEvaluator.split_bits)
+WORKER_FORMULAS = [
+    "((P -> Q) ^ (R v ~S)) <-> (T x U)",
+    "(P ^ Q ^ R) v (S ^ T ^ U) v ~(P <-> U)",
+    "~(P x Q x R x S x T x U) -> (P ^ ~Q)",
+]
+
+
+@pytest.mark.parametrize("text", WORKER_FORMULAS)
+@pytest.mark.parametrize("workers", [2, 4])
+def test_workers_match_reference(text, workers):
+    formula = ParsedFormula(text)
+    expected = reference_table(formula)
+    table = formula.generator.generate_truth_table(formula.expression, formula.variables, workers=workers)
+    assert list(table.columns) == list(expected.columns)
+    assert (table.values == expected.values).all()
+
+
+def test_unknown_engine():
+    formula = ParsedFormula("P ^ Q")
+    with pytest.raises(ValueError):
+        formula.generator.generate_truth_table(formula.expression, formula.variables, engine="fortran")
+
+
+@pytest.mark.parametrize("text", FORMULAS)
+def test_packed_table_matches_reference(text):
+    formula = ParsedFormula(text)
+    expected = reference_table(formula)
+    table = formula.generator.generate_packed_table(formula.expression, formula.variables)
+    assert table.columns == list(expected.columns)
+    assert list(table.iter_rows(block_rows=3)) == expected.values.tolist()
+    assert (table.to_dataframe().values == expected.values).all()
+
+
+@pytest.mark.parametrize("text", FORMULAS)
+def test_chunks_match_packed_table(text):
+    formula = ParsedFormula(text)
+    expected = reference_table(formula)
+    table = formula.generator.generate_packed_table(formula.expression, formula.variables)
+    chunks = list(formula.generator.iter_truth_table(formula.expression, formula.variables, chunk_rows=3))
+    assert TruthTable.concat(chunks).equals(table)
+    middle = list(formula.generator.iter_truth_table(formula.expression, formula.variables, 2, 1, len(expected) - 1))
+    assert [row for chunk in middle for row in chunk.iter_rows()] == expected.values.tolist()[1:-1]
+
+
+def test_stats_count_rows_and_stages():
+    formula = ParsedFormula("(P -> Q) ^ R")
+    stats = Stats()
+    formula.generator.generate_truth_table(formula.expression, formula.variables, stats=stats)
+    data = stats.as_dict()
+    assert data["counters"]["rows"] == 8
+    assert {"subformulas", "compile", "evaluate", "dataframe"} <= set(data["stages"])
+
+
+def force_large(formula, bdd_nodes=None):
+    """Faz o gerador tratar a fórmula como grande (sem enumeração)."""
+    formula.generator.MAX_ENUMERATION_VARIABLES = 0
+    if bdd_nodes is not None:
+        formula.generator.MAX_BDD_NODES = bdd_nodes
+    return formula
+
+
+@pytest.mark.parametrize("mode", ["enumeration", "bdd"])
+def test_classify_matches_truth_table(mode):
+    for formula in random_formulas(seed=6, count=80):
+        if mode == "bdd":
+            force_large(formula)
+        check_classification(formula, formula.generator.classify(formula.expression, formula.variables))
+
+
+@pytest.mark.parametrize("mode", ["enumeration", "bdd", "counter"])
+def test_count_models_matches_truth_table(mode):
+    for formula in random_formulas(seed=7, count=80):
+        if mode == "bdd":
+            force_large(formula)
+        elif mode == "counter":
+            force_large(formula, bdd_nodes=1)
+        assert formula.generator.count_models(formula.expression, formula.variables, max_chunk_rows=4) == \
+            sum(formula.truth_values()), formula.text
+
+
+@pytest.mark.parametrize("mode", ["bdd", "table", "sat"])
+def test_iter_models_matches_truth_table(mode):
+    for formula in random_formulas(seed=8, count=80):
+        if mode == "table":
+            formula.generator.MAX_BDD_NODES = 1
+        elif mode == "sat":
+            force_large(formula, bdd_nodes=1)
+        models = list(formula.generator.iter_models(formula.expression, formula.variables, max_chunk_rows=4))
+        expected = formula.true_rows()
+        if mode == "sat":
+            # O resolvedor SAT devolve os modelos em ordem arbitrária
+            key = lambda model: tuple(model[var] for var in formula.variables)
+            models, expected = sorted(models, key=key), sorted(expected, key=key)
+        assert models == expected, formula.text
+
+
+def test_iter_models_limit():
+    formula = ParsedFormula("P v Q v R")
+    assert len(list(formula.generator.iter_models(formula.expression, formula.variables, limit=3))) == 3
+    assert list(formula.generator.iter_models(formula.expression, formula.variables, limit=0)) == []
+
+
+def test_large_formula_is_classified_without_enumeration():
+    variables = [f"A{i}" for i in range(40)]
+    text = "(" + " x ".join(variables) + ") <-> (" + " x ".join(reversed(variables)) + ")"
+    formula = ParsedFormula(text)
+    classification, _, false_assignment = formula.generator.classify(formula.expression, formula.variables)
+    assert classification == formula.generator.TAUTOLOGY and false_assignment is None
+    assert formula.generator.count_models(formula.expression, formula.variables) == 2 ** 40